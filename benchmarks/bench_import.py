@@ -0,0 +1,61 @@
+"""Cold-start import benchmarks for swachhdata.text
+
+Run with asv, or directly to check the regex-only recasts stay under the
+cold-start budget:
+
+    python -m benchmarks.bench_import
+"""
+import subprocess
+import sys
+import time
+
+
+REGEX_RECASTS = [
+    'urlRecast',
+    'EscapeSequenceRecast',
+    'MentionRecast',
+    'CaseRecast',
+    'HashtagRecast',
+    'ShortWordsRecast',
+    'NumberRecast',
+    'AlphabetRecast',
+    'PunctuationRecast',
+]
+
+COLD_START_BUDGET = 0.1 # seconds
+
+
+def timeraw_import_text():
+    return 'import swachhdata.text'
+
+
+class TimeRawImportRecast:
+
+    params = REGEX_RECASTS
+    param_names = ['recast']
+
+    def timeraw_import_recast(self, recast):
+        return f'from swachhdata.text import {recast}\n{recast}()'
+
+
+def cold_start(code, repeat=5):
+    """Best wall time of running code in a fresh interpreter, minus the bare interpreter start"""
+
+    def run(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        return time.perf_counter() - start
+
+    base = min(run('pass') for _ in range(repeat))
+    return min(run(code) for _ in range(repeat)) - base
+
+
+if __name__ == '__main__':
+
+    status = 0
+    for recast in REGEX_RECASTS:
+        elapsed = cold_start(f'from swachhdata.text import {recast}\n{recast}()')
+        ok = elapsed < COLD_START_BUDGET
+        status |= not ok
+        print(f'{recast:<24} {elapsed * 1000:8.1f} ms {"ok" if ok else "SLOW"}')
+    sys.exit(status)
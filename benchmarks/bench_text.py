@@ -0,0 +1,260 @@
+"""Per-stage throughput benchmarks for swachhdata.text
+
+Every class exported from swachhdata.text (TweetExtractor aside, it needs
+the Twitter API) is benchmarked in every process mode, plus TextRecast and
+RecastPipeline end to end, on 1k, 100k and 1M synthetic tweet-like
+documents. asv reports time, peak RSS, docs/sec and bytes/sec and keeps
+the results of every commit in .asv/results:
+
+    asv run v1.2.2..master
+    asv compare v1.2.2 master
+
+Cases whose nltk / spacy resources are not present locally are skipped.
+Run directly to measure without asv, each case in a fresh interpreter;
+results are stored in .asv/standalone/<version>.json and compared with
+another stored version:
+
+    python -m benchmarks.bench_text --docs 1000 100000 --compare 1.2.2
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+WORDS = ['the', 'a', 'we', 'are', 'going', 'to', 'have', 'lunch', 'at', 'our', 'favourite', 'place', 'today',
+         'Great', 'news', 'everyone', 'running', 'quickly', 'services', 'catalogue', 'and', 'is', 'it',
+         'café', 'naïve', 'résumé', 'Zürich']
+EXTRAS = ['www.samplewebsite.com', 'https://example.org/path/page.html', '192.168.1.1:8080/img.jpg',
+          '@jondoe', '@jane_doe', '#python', '#DataCleaning', '😀', '🍛', '☕️',
+          '1,234', '42', '3.14', "can't", "we're", "it's",
+          '<b>bold</b>', '&amp;', '\n', '\t', '!!', '...', '?']
+
+_corpora = {}
+
+
+def corpus(docs, seed=0):
+    """docs synthetic tweet-like documents, the same for every run"""
+
+    if docs not in _corpora:
+        rng = random.Random(seed)
+        _corpora[docs] = [' '.join(rng.choice(WORDS) if rng.random() < 0.75 else rng.choice(EXTRAS)
+                                   for _ in range(rng.randint(8, 30))) for _ in range(docs)]
+    return _corpora[docs]
+
+
+def _recast(name, **params):
+
+    def factory():
+        from swachhdata import text
+        return getattr(text, name)(**params)
+    return factory
+
+
+def _text_recast(text):
+
+    from swachhdata.text import TextRecast
+    return TextRecast(text, urlRecast={'process': 'extract_remove'}, htmlRecast=True, EscapeSequenceRecast=True,
+                      MentionRecast={'process': 'extract_remove'}, CaseRecast={'process': 'lower'},
+                      HashtagRecast={'process': 'extract_remove'}, NumberRecast={'process': 'remove', 'seperator': None},
+                      AlphabetRecast={'process': 'all'}, PunctuationRecast=True)
+
+
+def _pipeline(compiled):
+
+    def factory():
+        from swachhdata.text import (RecastPipeline, urlRecast, EscapeSequenceRecast, MentionRecast, CaseRecast,
+                                     HashtagRecast, NumberRecast, AlphabetRecast, PunctuationRecast, ShortWordsRecast)
+        recasts = [urlRecast(), EscapeSequenceRecast(), MentionRecast(), CaseRecast(), HashtagRecast(),
+                   NumberRecast(), AlphabetRecast(), PunctuationRecast(), ShortWordsRecast()]
+        return lambda text: RecastPipeline(text, recasts, compiled=compiled)
+    return factory
+
+
+# case name -> factory of a callable recasting a list of documents,
+# recasts are constructed outside of the timed section
+CASES = {}
+
+for process in ['remove', 'extract', 'extract_remove']:
+    for backend in ['python', 'vectorized']:
+        for name in ['urlRecast', 'MentionRecast', 'HashtagRecast']:
+            CASES[f'{name}-{process}-{backend}'] = _recast(name, process=process, backend=backend)
+
+for process in ['remove', 'replace', 'extract', 'extract_remove', 'extract_replace']:
+    for backend in ['python', 'vectorized']:
+        CASES[f'NumberRecast-{process}-{backend}'] = _recast('NumberRecast', process=process, backend=backend)
+    CASES[f'EmojiRecast-{process}'] = _recast('EmojiRecast', process=process)
+
+for backend in ['python', 'vectorized']:
+    CASES[f'PunctuationRecast-{backend}'] = _recast('PunctuationRecast', backend=backend)
+
+for process in ['lower', 'upper', 'fupper']:
+    CASES[f'CaseRecast-{process}'] = _recast('CaseRecast', process=process)
+
+for process in ['all', 'keep_alpha', 'rem_non_ascii', 'rem_acc_char']:
+    CASES[f'AlphabetRecast-{process}'] = _recast('AlphabetRecast', process=process)
+
+for package in ['nltk', 'spacy', 'gensim']:
+    CASES[f'StopWordsRecast-{package}'] = _recast('StopWordsRecast', package=package)
+CASES['StopWordsRecast-custom'] = _recast('StopWordsRecast', package='custom', stopwords=['the', 'a', 'is', 'it'])
+
+for package in ['nltk', 'spacy']:
+    for method in ['word', 'sentence']:
+        CASES[f'TokenisationRecast-{package}-{method}'] = _recast('TokenisationRecast', package=package, method=method)
+    CASES[f'LemmatizationRecast-{package}'] = _recast('LemmatizationRecast', package=package)
+
+for method in ['porter', 'snowball']:
+    CASES[f'StemmingRecast-{method}'] = _recast('StemmingRecast', method=method)
+
+CASES['htmlRecast'] = _recast('htmlRecast')
+CASES['EscapeSequenceRecast'] = _recast('EscapeSequenceRecast')
+CASES['ContractionsRecast'] = _recast('ContractionsRecast')
+CASES['ShortWordsRecast'] = _recast('ShortWordsRecast', min_length=3)
+CASES['TextRecast'] = lambda: _text_recast
+CASES['RecastPipeline'] = _pipeline(compiled=False)
+CASES['RecastPipeline-compiled'] = _pipeline(compiled=True)
+
+
+def prepare(case):
+    """Callable recasting a list of documents for case, NotImplementedError (asv skip) if it cannot run here
+
+    The callable is run once on a few documents, so lazily imported
+    backends are not part of the measurement.
+    """
+
+    from swachhdata.resources import ResourceNotFoundError
+
+    try:
+        recast = CASES[case]()
+        recast = getattr(recast, 'setup_recast', recast)
+        recast(corpus(10))
+    except (ResourceNotFoundError, ImportError, OSError) as error:
+        raise NotImplementedError(f'{case}: {error}')
+    return recast
+
+
+def measure(case, docs):
+    """Recast docs synthetic documents once
+
+    Returns
+    -------
+    result : dict
+        seconds, docs_per_sec, bytes_per_sec and peak_rss (bytes, of this process)
+    """
+
+    import resource
+
+    text = corpus(docs)
+    recast = prepare(case)
+    size = sum(len(doc.encode('utf-8')) for doc in text)
+
+    start = time.perf_counter()
+    recast(text)
+    elapsed = time.perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        peak_rss *= 1024
+    return {'seconds': elapsed, 'docs_per_sec': docs / elapsed, 'bytes_per_sec': size / elapsed, 'peak_rss': peak_rss}
+
+
+class Recast:
+
+    params = [list(CASES), SIZES]
+    param_names = ['recast', 'docs']
+    timeout = 3600
+    number = 1
+    repeat = 1
+
+    def setup(self, case, docs):
+        self.text = corpus(docs)
+        self.recast = prepare(case)
+
+    def time_recast(self, case, docs):
+        self.recast(self.text)
+
+    def peakmem_recast(self, case, docs):
+        self.recast(self.text)
+
+    def track_docs_per_sec(self, case, docs):
+        start = time.perf_counter()
+        self.recast(self.text)
+        return docs / (time.perf_counter() - start)
+
+    track_docs_per_sec.unit = 'docs/s'
+
+    def track_bytes_per_sec(self, case, docs):
+        size = sum(len(doc.encode('utf-8')) for doc in self.text)
+        start = time.perf_counter()
+        self.recast(self.text)
+        return size / (time.perf_counter() - start)
+
+    track_bytes_per_sec.unit = 'bytes/s'
+
+
+def results_path(version):
+
+    return os.path.join('.asv', 'standalone', f'{version}.json')
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--docs', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--cases', nargs='+', default=list(CASES))
+    parser.add_argument('--compare', metavar='VERSION', help='stored version to compare docs/sec against')
+    parser.add_argument('--threshold', type=float, default=0.1, help='slowdown reported as a regression')
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        try:
+            print(json.dumps(measure(args.case, args.docs[0])))
+        except NotImplementedError as error:
+            print(json.dumps({'skipped': str(error)}))
+        sys.exit(0)
+
+    import swachhdata
+    results = {}
+    baseline = {}
+    if args.compare:
+        with open(results_path(args.compare)) as fh:
+            baseline = json.load(fh)
+
+    status = 0
+    for case in args.cases:
+        for docs in args.docs:
+            key = f'{case}[{docs}]'
+            out = subprocess.run([sys.executable, '-m', 'benchmarks.bench_text', '--case', case, '--docs', str(docs)],
+                                 check=True, capture_output=True, text=True).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            if 'skipped' in result:
+                print(f'{key:<48} skipped')
+                continue
+            results[key] = result
+
+            line = (f'{key:<48} {result["docs_per_sec"]:>12,.0f} docs/s {result["bytes_per_sec"] / 1e6:>9.2f} MB/s '
+                    f'{result["peak_rss"] / 1e6:>9.1f} MB peak RSS')
+            if key in baseline:
+                change = result['docs_per_sec'] / baseline[key]['docs_per_sec'] - 1
+                regression = change < -args.threshold
+                status |= regression
+                line += f' {change:+7.1%}{" REGRESSION" if regression else ""}'
+            print(line)
+
+    path = results_path(swachhdata.__version__)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    stored = {}
+    if os.path.exists(path):
+        with open(path) as fh:
+            stored = json.load(fh)
+    stored.update(results)
+    with open(path, 'w') as fh:
+        json.dump(stored, fh, indent=1)
+
+    sys.exit(status)
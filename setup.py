@@ -31,6 +31,7 @@ setup(
         'beautifulsoup4>=4.6.3',
         'html5lib>=1.0.1',
         'contractions>=0.0.25',
+        'pyahocorasick>=1.4.0',
         'emoji>=0.6.0',
         'nltk>=3.2.5',
         'spacy>=2.2.4',
@@ -40,5 +41,9 @@ setup(
         'requests>=2.23.0',
         'opencv-python>=4.1.2.30',
         'tweepy>=3.6.0'
-    ]
+    ],
+    extras_require={
+        # backend='vectorized', Extraction.to_arrow, TweetExtractor.extract(file_format='parquet')
+        'arrow': ['pyarrow>=11.0.0']
+    }
 )
\ No newline at end of file
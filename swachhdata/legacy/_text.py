@@ -1,10 +1,8 @@
 import re
 import nltk
 
-nltk.download('averaged_perceptron_tagger')
-nltk.download('wordnet')
-nltk.download('punkt')
-nltk.download('stopwords')
+from ..resources import require
+require('averaged_perceptron_tagger', 'wordnet', 'punkt', 'stopwords')
 
 from bs4 import BeautifulSoup
 from html import unescape
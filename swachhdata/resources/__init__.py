@@ -0,0 +1,20 @@
+from ._resources import RESOURCES
+from ._resources import RECASTS
+from ._resources import ResourceNotFoundError
+from ._resources import data_dir
+from ._resources import require
+from ._resources import require_recast
+from ._resources import prefetch
+from ._resources import configure_nltk
+
+
+__all__ = [
+    'RESOURCES',
+    'RECASTS',
+    'ResourceNotFoundError',
+    'data_dir',
+    'require',
+    'require_recast',
+    'prefetch',
+    'configure_nltk'
+]
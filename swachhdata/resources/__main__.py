@@ -0,0 +1,15 @@
+"""Fetch all swachhdata resources into the data directory
+
+    python -m swachhdata.resources [name ...]
+"""
+import sys
+
+from ._resources import prefetch, data_dir
+
+
+if __name__ == '__main__':
+
+    locations = prefetch(sys.argv[1:] or None, quiet=False)
+    print(f'swachhdata resources ready in {data_dir()}')
+    for name, path in locations.items():
+        print(f'  {name}: {path}')
@@ -0,0 +1,263 @@
+import os
+import sys
+import json
+import inspect
+import threading
+import importlib.util
+
+
+# corpora and models used by swachhdata, with the locations nltk may store
+# them under and the nltk packages that provide them
+RESOURCES = {
+    'punkt': {'package': 'nltk',
+              'paths': ['tokenizers/punkt_tab', 'tokenizers/punkt'],
+              'downloads': ['punkt_tab', 'punkt']},
+    'stopwords': {'package': 'nltk',
+                  'paths': ['corpora/stopwords'],
+                  'downloads': ['stopwords']},
+    'wordnet': {'package': 'nltk',
+                'paths': ['corpora/wordnet'],
+                'downloads': ['wordnet']},
+    'averaged_perceptron_tagger': {'package': 'nltk',
+                                   'paths': ['taggers/averaged_perceptron_tagger_eng', 'taggers/averaged_perceptron_tagger'],
+                                   'downloads': ['averaged_perceptron_tagger_eng', 'averaged_perceptron_tagger']},
+    'en_core_web_sm': {'package': 'spacy'},
+}
+
+# resources needed by each Recast, per package
+RECASTS = {
+    'StopWordsRecast': {'nltk': ['stopwords']},
+    'TokenisationRecast': {'nltk': ['punkt'], 'spacy': ['en_core_web_sm']},
+    'LemmatizationRecast': {'nltk': ['wordnet', 'averaged_perceptron_tagger'], 'spacy': ['en_core_web_sm']},
+}
+
+STAMP_FILE = '.swachhdata_resources.json'
+
+_resolved = {}
+_lock = threading.Lock()
+
+
+class ResourceNotFoundError(LookupError):
+    """Raised when a required corpus or model is not present locally"""
+
+
+def data_dir():
+    """Local directory swachhdata resources are resolved from
+
+    Set with the SWACHHDATA_DATA environment variable,
+    default is ~/swachhdata_data
+    """
+
+    return os.environ.get('SWACHHDATA_DATA', os.path.join(os.path.expanduser('~'), 'swachhdata_data'))
+
+
+def configure_nltk(nltk):
+    """Make nltk look up its data in the swachhdata data directory first"""
+
+    directory = data_dir()
+    if directory not in nltk.data.path:
+        nltk.data.path.insert(0, directory)
+
+
+def _read_stamp(directory):
+
+    try:
+        with open(os.path.join(directory, STAMP_FILE)) as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_stamp(directory, stamp):
+
+    path = os.path.join(directory, STAMP_FILE)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(f'{path}.{os.getpid()}', 'w') as fh:
+            json.dump(stamp, fh, indent=1)
+        os.replace(f'{path}.{os.getpid()}', path)
+    except OSError:
+        pass
+
+
+def _spacy_model_dir(path):
+    """Directory spacy.load can load a model from: path itself, or the
+    versioned data directory of a model package; None if path holds neither"""
+
+    if not os.path.isdir(path):
+        return None
+    if os.path.isfile(os.path.join(path, 'config.cfg')):
+        return path
+    # a model package holds its data in a <name>-<version> sub directory
+    for entry in sorted(os.listdir(path), reverse=True):
+        sub = os.path.join(path, entry)
+        if os.path.isfile(os.path.join(sub, 'config.cfg')) or os.path.isfile(os.path.join(sub, 'meta.json')):
+            return sub
+    if os.path.isfile(os.path.join(path, 'meta.json')):
+        return path
+    return None
+
+
+def _valid(name, path):
+    """path (e.g. read from the stamp file) still holds resource name"""
+
+    if RESOURCES.get(name, {}).get('package') == 'spacy':
+        return _spacy_model_dir(path) == path
+    return os.path.exists(path)
+
+
+def _locate(name, directory):
+    """Local path of resource name, None if it is not present"""
+
+    resource = RESOURCES[name]
+
+    if resource['package'] == 'nltk':
+        import nltk
+        configure_nltk(nltk)
+        for path in resource['paths']:
+            try:
+                pointer = nltk.data.find(path)
+            except LookupError:
+                continue
+            if hasattr(pointer, 'zipfile'):
+                return pointer.zipfile.filename
+            return pointer.path
+
+    elif resource['package'] == 'spacy':
+        # the model data directory, passed to spacy.load
+        path = _spacy_model_dir(os.path.join(directory, 'spacy', name))
+        if path is not None:
+            return path
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.submodule_search_locations:
+            for location in spec.submodule_search_locations:
+                path = _spacy_model_dir(location)
+                if path is not None:
+                    return path
+
+
+def require(*names):
+    """Resolve resources from the local data directory, never touching the network
+
+    Resolved locations are cached in a stamp file in the data directory,
+    so later processes only check that the cached paths still exist.
+
+    Parameters
+    ----------
+    *names : string(s), keys of RESOURCES
+
+    Returns
+    -------
+    locations : dict
+        resource name to local path (for spacy models the data directory
+        spacy.load loads them from)
+
+    Raises
+    ------
+    ResourceNotFoundError
+        if any of the resources is not present
+    """
+
+    for name in names:
+        if name not in RESOURCES:
+            raise KeyError(f'Unknown resource {name!r}, expected one of {sorted(RESOURCES)}')
+
+    directory = data_dir()
+    missing = []
+    # threads resolving the same directory share its locations and stamp file
+    with _lock:
+        if directory not in _resolved:
+            _resolved[directory] = {name: path for name, path in _read_stamp(directory).items() if _valid(name, path)}
+        resolved = _resolved[directory]
+
+        changed = False
+        for name in names:
+            if name in resolved:
+                continue
+            path = _locate(name, directory)
+            if path is None:
+                missing.append(name)
+            else:
+                resolved[name] = path
+                changed = True
+
+        if changed:
+            _write_stamp(directory, resolved)
+        resolved = {name: resolved[name] for name in names if name in resolved}
+
+    if missing:
+        raise ResourceNotFoundError(f'Resource(s) {missing} not found in {directory!r} or the default nltk / spacy locations, '
+                                    f'fetch them once with swachhdata.resources.prefetch({missing}) '
+                                    f'or python -m swachhdata.resources')
+
+    if 'nltk' in sys.modules and any(RESOURCES[name]['package'] == 'nltk' for name in names):
+        configure_nltk(sys.modules['nltk'])
+
+    return resolved
+
+
+def require_recast(recast, package):
+    """Resolve the resources needed by a Recast for the given package
+
+    Parameters
+    ----------
+    recast : string, Recast class name
+    package : string ('nltk', 'spacy', ...)
+
+    Returns
+    -------
+    locations : dict
+        resource name to local path
+    """
+
+    return require(*RECASTS.get(recast, {}).get(package, []))
+
+
+def _download_spacy_model(name, target):
+    """pip install the spacy model package name into the target directory
+    (target/name), instead of site-packages"""
+
+    from spacy.cli import download
+
+    # the positional arguments of spacy.cli.download before its pip arguments vary across spacy versions
+    parameters = list(inspect.signature(download).parameters.values())
+    defaults = [parameter.default for parameter in parameters[1:]
+                if parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD]
+    download(name, *defaults, '--target', target, '--no-deps', '--upgrade')
+
+
+def prefetch(names=None, quiet=True):
+    """Download resources into the data directory
+
+    Intended for provisioning, e.g. baking resources into images;
+    this is the only part of swachhdata.resources that uses the network.
+
+    Parameters
+    ----------
+    names : list of string(s), default=None (all of RESOURCES)
+    quiet : bool, default=True
+
+    Returns
+    -------
+    locations : dict
+        resource name to local path
+    """
+
+    directory = data_dir()
+    names = list(RESOURCES) if names is None else list(names)
+
+    for name in names:
+        resource = RESOURCES[name]
+
+        if resource['package'] == 'nltk':
+            import nltk
+            for package in resource['downloads']:
+                nltk.download(package, download_dir=directory, quiet=quiet, raise_on_error=False)
+
+        elif resource['package'] == 'spacy':
+            if _spacy_model_dir(os.path.join(directory, 'spacy', name)) is None:
+                _download_spacy_model(name, os.path.join(directory, 'spacy'))
+
+    with _lock:
+        _resolved.pop(directory, None)
+    return require(*names)
@@ -1,22 +1,8 @@
-from ._text import urlRecast
-from ._text import htmlRecast
-from ._text import EscapeSequenceRecast
-from ._text import MentionRecast
-from ._text import ContractionsRecast
-from ._text import CaseRecast
-from ._text import EmojiRecast
-from ._text import HashtagRecast
-from ._text import ShortWordsRecast
-from ._text import StopWordsRecast
-from ._text import NumberRecast
-from ._text import AlphabetRecast
-from ._text import PunctuationRecast
-from ._text import StemmingRecast
-from ._text import LemmatizationRecast
-from ._text import TokenisationRecast
-from ._text import TextRecast
-from ._text import TweetExtractor
-from ._text import RecastPipeline
+"""
+Recasts are loaded on first access through the module level ``__getattr__``,
+and each heavy backend (spacy, nltk, gensim, ...) is only imported once a
+Recast that needs it is constructed.
+"""
 
 
 __all__ = [
@@ -37,6 +23,26 @@ __all__ = [
     'LemmatizationRecast',
     'TokenisationRecast',
     'TextRecast',
+    'TextRecastResult',
+    'Extraction',
     'TweetExtractor',
-    'RecastPipeline'
+    'RecastPipeline',
+    'RecastProfile',
+    'StageProfile',
+    'spacy_models'
 ]
+
+
+def __getattr__(name):
+
+    if name in __all__:
+        from . import _text
+        value = getattr(_text, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,171 @@
-import re
-import pandas
-from tqdm.auto import trange, tqdm
-from bs4 import BeautifulSoup
-from html import unescape
-import contractions
-import emoji
-from emoji import UNICODE_EMOJI
-import nltk
-nltk.download('popular', quiet=True)
-import spacy
-from gensim.parsing.preprocessing import remove_stopwords
-import num2words
-import unicodedata
-import string
-import json
-import textblob
+import os
+import sys
+import importlib
+import threading
+from collections import deque
+from functools import partial
+from itertools import islice
+
+# held while a LazyModule imports and sets up its module (reentrant: setups use other LazyModules)
+_import_lock = threading.RLock()
+
+
+class LazyModule:
+    """
+    Module proxy for the heavy backends used by swachhdata.text
+
+    The wrapped module is imported on first attribute access (or when a
+    Recast needing it calls ``_lazy_import``), so importing a regex-only
+    recast does not pull in spacy, nltk, gensim, ...
+
+    Parameters
+    ----------
+    name : string
+        dotted module name
+    setup : callable, default=None
+        called once with the module right after it is imported
+    extra : string, default=None
+        swachhdata extra that installs the module (optional dependency),
+        named in the ImportError raised when it is missing
+    """
+
+    def __init__(self, name, setup=None, extra=None):
+
+        self.__name = name
+        self.__setup = setup
+        self.__extra = extra
+        self.__module = None
+
+
+    def _lazy_import(self):
+
+        if self.__module is None:
+            # setup runs once even when threads first use the module together
+            with _import_lock:
+                if self.__module is None:
+                    try:
+                        module = importlib.import_module(self.__name)
+                    except ImportError as error:
+                        if self.__extra is None:
+                            raise
+                        raise ImportError(f'{self.__name} is required for this feature and is not installed, '
+                                          f'install it with pip install swachhdata[{self.__extra}]') from error
+                    if self.__setup is not None:
+                        self.__setup(module)
+                    self.__module = module
+        return self.__module
+
+
+    def __getattr__(self, attr):
+
+        if attr.startswith('_LazyModule__'):
+            raise AttributeError(attr)
+        return getattr(self._lazy_import(), attr)
+
+
+def _lazy_import(*modules):
+    """Import the given LazyModule backends"""
+
+    for module in modules:
+        module._lazy_import()
+
+
+def trange(*args, **kwargs):
+
+    from tqdm.auto import trange
+    return trange(*args, **kwargs)
+
+
+def tqdm(*args, **kwargs):
+
+    from tqdm.auto import tqdm
+    return tqdm(*args, **kwargs)
+
+
+def _is_series(text):
+    """Check for a pandas Series without importing pandas
+
+    If pandas has not been imported yet, text cannot be a Series.
+    """
+
+    pandas = sys.modules.get('pandas')
+    return pandas is not None and isinstance(text, pandas.Series)
+
+
+def _n_workers(n_jobs):
+    """Number of worker processes for n_jobs (-1 uses all cores, -2 all but one, ...)"""
+
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def _chunks(texts, count, chunksize):
+
+    for start in range(0, count, chunksize):
+        yield texts[start:start + chunksize]
+
+
+def _batches(iterable, chunksize):
+    """Lists of chunksize documents from any iterable, read lazily"""
+
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, chunksize))
+        if not batch:
+            return
+        yield batch
+
+
+# chunk function of the pool running in this (worker) process
+_worker_recast = None
+
+
+def _init_worker(recast):
+
+    global _worker_recast
+    _worker_recast = recast
+
+
+def _recast_chunk(chunk):
+
+    return _worker_recast(chunk)
+
+
+def _recast_documents(base_recast, chunk):
+
+    return [base_recast(text) for text in chunk]
+
+
+def _recast_batch(batch_recast, chunk):
+
+    return list(batch_recast(chunk))
+
+
+def _parallel_map(recast, chunks, n_jobs):
+    """Run recast on every chunk in a pool of n_jobs worker processes
+
+    recast is pickled once per worker (not once per chunk), so resources it
+    holds are set up a single time in each worker. chunks is consumed lazily,
+    at most 2 chunks per worker are pending at a time.
+
+    Yields
+    ------
+    recast(chunk) for every chunk, in the order of chunks
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(n_jobs, initializer=_init_worker, initargs=(recast,)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_recast_chunk, chunk))
+            if len(pending) >= 2 * n_jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 class TextFormatter:
@@ -25,23 +176,244 @@ class TextFormatter:
         * string
         * list of string
         * pandas.core.series.Series
+
+    pandas.Series input is never copied into a list, its values are read
+    in place and recast documents are returned as a pandas.Series with the
+    original index, name and string dtype (Arrow-backed dtypes such as
+    string[pyarrow] are written straight into a new Arrow string array).
+
+    With n_jobs other than 1, list and pandas.Series input is split into
+    chunks of chunksize documents which are recast in a pool of worker
+    processes; documents and extractions are returned in input order.
+
+    Parameters
+    ----------
+    n_jobs : int, default=1
+        worker processes (-1 uses all cores)
+    chunksize : int, default=None
+        documents sent to a worker at a time
+        (None splits the text into 4 chunks per worker, 1000 for recast_iter)
     """
 
-    def __init__(self):
-        
+    # attributes holding resources (e.g. spacy models) that are not sent to
+    # worker processes, the recast loads them again on first use in the worker
+    _worker_resources = ()
+
+    def __init__(self, n_jobs=1, chunksize=None):
+
         self._dtype = None
         self._text = None
         self._count = None
+        self._series = None
+        self._n_jobs = n_jobs
+        self._chunksize = chunksize
+
+        try:
+            assert(isinstance(self._n_jobs, int) and self._n_jobs != 0)
+        except:
+            print(f'Expected n_jobs input non-zero <class \'int\'>, input received {self._n_jobs}')
+
+        try:
+            assert(self._chunksize is None or (isinstance(self._chunksize, int) and self._chunksize > 0))
+        except:
+            print(f'Expected chunksize input positive <class \'int\'> or None, input received {self._chunksize}')
+
+
+    def __getstate__(self):
+        """Recasts are sent to worker processes without the setup text"""
+
+        state = self.__dict__.copy()
+        state['_text'] = None
+        state['_series'] = None
+        for attr in self._worker_resources:
+            state[attr] = None
+        return state
+
+
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines
+        (see swachhdata.text._pipeline), None if the process does more than rewrite strings"""
+
+        return None
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        raise NotImplementedError(f'{type(self).__name__} does not support compiled pipelines')
+
+
+    def _side_output(self):
+        """Attribute the values extracted alongside the text are set on,
+        None if the selected process does not return (ntext, extracted)"""
+
+        return None
+
+
+    def _batch_recast(self):
+        """Recast of an iterable of documents yielding their results in order
+        (e.g. spacy nlp.pipe), used instead of the single document recast on
+        list, pandas.Series and streaming input; None if there is none"""
+
+        return None
+
+
+    def _recast_strings(self):
+        """Whether the selected process returns strings (False for tokens / extractions)"""
+
+        return True
+
 
-    
     def __text_formatter(self):
-        
+
         self._count = len(self._text)
+        self._series = None
 
-        if self._dtype == pandas.core.series.Series:
-            self._text = self._text.tolist()
-            self._dtype = type(self._text)
+        if _is_series(self._text):
+            self._series = (self._text.index, self._text.name, self._text.dtype)
+            self._text = self._text.array
+            self._dtype = list
 
         if self._dtype == str:
             self._count = len(self._text.split())
-            self._dtype = type(self._text)
\ No newline at end of file
+            self._dtype = type(self._text)
+
+
+    def __text_output(self, ntext, strings=True):
+        """Return recast documents in the container type of the setup text
+
+        Parameters
+        ----------
+        ntext : iterable of recast documents / pyarrow string array
+        strings : bool, documents are strings (False for lists of tokens / extractions)
+
+        Returns
+        -------
+        ntext : list / pandas.Series
+        """
+
+        arrow = False
+        if self._series is not None and strings:
+            dtype = self._series[2]
+            arrow = getattr(dtype, 'storage', None) == 'pyarrow' or hasattr(dtype, 'pyarrow_dtype')
+
+        if hasattr(ntext, 'to_pylist') and not arrow:
+            ntext = ntext.to_pylist()
+
+        if self._series is None:
+            return ntext if isinstance(ntext, list) else list(ntext)
+
+        import pandas
+        index, name, dtype = self._series
+
+        if not arrow:
+            return pandas.Series(list(ntext), index=index, name=name, dtype=dtype if strings else object)
+
+        if not hasattr(ntext, 'to_pylist'):
+            import pyarrow
+            pa_type = getattr(dtype, 'pyarrow_dtype', pyarrow.large_string())
+            ntext = pyarrow.array(ntext, type=pa_type, size=self._count)
+        return pandas.Series(ntext, index=index, name=name, dtype=dtype, copy=False)
+
+
+    def __map(self, base_recast):
+        """Yield base_recast(text) for every setup document, in order,
+        from a pool of worker processes when n_jobs is not 1"""
+
+        batch_recast = self._batch_recast()
+        n_jobs = min(_n_workers(self._n_jobs), self._count)
+        if n_jobs <= 1:
+            return map(base_recast, self._text) if batch_recast is None else batch_recast(self._text)
+
+        chunksize = self._chunksize or -(-self._count // (n_jobs * 4))
+        chunks = (list(chunk) for chunk in _chunks(self._text, self._count, chunksize))
+        recast = partial(_recast_documents, base_recast) if batch_recast is None else partial(_recast_batch, batch_recast)
+        return (text for chunk in _parallel_map(recast, chunks, n_jobs) for text in chunk)
+
+
+    def recast_iter(self, iterable):
+        """Lazily perform selected process on every document of an iterable
+
+        Documents are read from iterable one at a time (one chunk per
+        worker with n_jobs), so memory stays constant for any corpus size,
+        e.g. a generator over the lines of a file. No setup is needed.
+
+        Parameters
+        ----------
+        iterable : iterable of strings (list, generator, file, pandas.Series, ...)
+
+        Yields
+        ------
+        ntext : string / list of strings
+            Processed document (tokens / extracted values for those processes)
+        ntext, extracted : string, list of strings (process='extract_remove', ...)
+            Processed document, values extracted from it
+        """
+
+        batch_recast = self._batch_recast()
+        base_recast = self._document_recast() if batch_recast is None else None
+
+        n_jobs = _n_workers(self._n_jobs)
+        if n_jobs <= 1:
+            if batch_recast is not None:
+                yield from batch_recast(iterable)
+                return
+            for text in iterable:
+                yield base_recast(text)
+            return
+
+        chunks = _batches(iterable, self._chunksize or 1000)
+        recast = partial(_recast_documents, base_recast) if batch_recast is None else partial(_recast_batch, batch_recast)
+        for chunk in _parallel_map(recast, chunks, n_jobs):
+            yield from chunk
+
+
+    def __recast_text(self, base_recast, verbose, verbose_status, postfix, extract=False, strings=True, column_recast=None):
+        """Perform base_recast on every setup document
+
+        Parameters
+        ----------
+        base_recast : callable, recasts a single document
+        verbose : int (0, 1, -1)
+        verbose_status : bool, leave the progress bar
+        postfix : dict, progress bar postfix
+        extract : bool, base_recast returns (ntext, extracted)
+        strings : bool, base_recast returns strings (False for lists of tokens / extractions)
+        column_recast : callable, default=None
+            recasts all setup documents at once as a pyarrow string array
+            (backend='vectorized', see swachhdata.text._vectorized),
+            used instead of base_recast (and the worker pool) when given
+
+        Returns
+        -------
+        ntext : list / pandas.Series
+            Processed text
+        ntext, extracted : list / pandas.Series, list / pandas.Series (extract=True)
+            Processed text, Extracted values
+        """
+
+        if column_recast is not None:
+            from ._vectorized import column
+            result = column_recast(column(self._text))
+            if not extract:
+                return self.__text_output(result, strings)
+            ntext, extracted = result
+            return self.__text_output(ntext), self.__text_output(extracted, strings=False)
+
+        results = self.__map(base_recast)
+        if verbose == 1 or verbose == -1:
+            results = tqdm(results, total=self._count, leave=verbose_status, postfix=postfix)
+
+        if not extract:
+            return self.__text_output(results, strings)
+
+        extracted = []
+
+        def recast(results):
+            for text, values in results:
+                extracted.append(values)
+                yield text
+
+        ntext = self.__text_output(recast(results), strings)
+        return ntext, self.__text_output(extracted, strings=False)
+
@@ -0,0 +1,191 @@
+"""Character level translation tables of the string rewriting recasts
+
+PunctuationRecast, EscapeSequenceRecast, AlphabetRecast('keep_alpha') and
+CaseRecast('lower' / 'upper') replace every character on its own, so
+adjacent ones are composed by compiled pipelines into a single CharTable:
+one str.translate call replaces them all, instead of a pass (and an
+intermediate string) per recast.
+
+The spaces PunctuationRecast leaves behind are squeezed in one pass
+(squeeze_spaces), with the result of its chain of replace calls.
+"""
+import re
+import string
+import sys
+import unicodedata
+from functools import lru_cache
+from operator import methodcaller
+
+# characters EscapeSequenceRecast replaces with a space
+ESCAPE_TABLE = str.maketrans('\r\n\t\f', ' ' * 4)
+
+# string.punctuation replaced with spaces (PunctuationRecast)
+PUNCTUATION_TABLE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+
+_NON_ALPHA = re.compile(r'[^a-zA-Z]')
+
+_NON_ASCII = re.compile(r'[^\x00-\x7F]+')
+
+# AlphabetRecast processes
+ALPHABET_PROCESSES = ['all', 'keep_alpha', 'rem_non_ascii', 'rem_acc_char']
+
+# characters whose lower case depends on the characters around them (final sigma)
+_CONTEXTUAL_LOWER = frozenset('Σσς')
+
+
+# runs of spaces up to this length are squeezed to a single space
+SQUEEZED_RUN = 10
+
+_SPACE_RUN = re.compile(' {2,}')
+
+
+@lru_cache(maxsize=1024)
+def _squeezed(length):
+    """Spaces left of a run of length spaces"""
+
+    return (' ' * length).replace(' '*4, ' ').replace(' '*3, ' ').replace(' '*2, ' ')
+
+
+def _squeeze_run(match):
+
+    return _squeezed(len(match.group()))
+
+
+def squeeze_spaces(text):
+    """text.replace(' '*4, ' ').replace(' '*3, ' ').replace(' '*2, ' ').strip() in a single pass
+
+    Every run of spaces is replaced on its own, with what the chain of
+    replace calls leaves of it (a single space for runs up to SQUEEZED_RUN).
+    """
+
+    if '  ' in text:
+        text = _SPACE_RUN.sub(_squeeze_run, text)
+    return text.strip()
+
+
+def keep_alpha(text):
+    """Every character of text but ASCII letters replaced with a space"""
+
+    return _NON_ALPHA.sub(' ', text)
+
+
+def ascii_fold(text):
+    """Accents of text dropped and all other non ASCII characters removed,
+    ASCII text is returned as is"""
+
+    if text.isascii():
+        return text
+    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
+
+
+def remove_non_ascii(text):
+    """Every run of non ASCII characters of text replaced with a space"""
+
+    if text.isascii():
+        return text
+    return _NON_ASCII.sub(' ', text)
+
+
+def alphabet_ops(processes):
+    """Ops of a sequence of AlphabetRecast processes
+
+    Every process leaves ASCII text, so only the first one can change
+    non ASCII characters, and the rest reduce to keeping the letters
+    (or nothing): a list of processes is one optional non ASCII step
+    ('call', only run on documents that are not ASCII), followed by
+    ('map', keep_alpha) if any process keeps only the letters.
+
+    Parameters
+    ----------
+    processes : list of strings, of ALPHABET_PROCESSES
+
+    Returns
+    -------
+    ops : list of tuples
+    """
+
+    ops = []
+    if processes and processes[0] in ('all', 'rem_acc_char'):
+        # 'all' folds accents before removing what is left, which folding already did
+        ops.append(('call', ascii_fold))
+    elif processes and processes[0] == 'rem_non_ascii':
+        ops.append(('call', remove_non_ascii))
+    if any(process in ('all', 'keep_alpha') for process in processes):
+        ops.append(('map', keep_alpha))
+    return ops
+
+
+@lru_cache(maxsize=None)
+def unicode_punctuation_table():
+    """string.punctuation and every character of the Unicode punctuation
+    categories (P*) replaced with spaces, built once per process"""
+
+    chars = set(string.punctuation)
+    chars.update(char for char in map(chr, range(sys.maxunicode + 1)) if unicodedata.category(char)[0] == 'P')
+    chars = ''.join(sorted(chars))
+    return str.maketrans(chars, ' ' * len(chars))
+
+
+def _mapping(op):
+    """String -> string callable of a character level op"""
+
+    if op[0] == 'translate':
+        return methodcaller('translate', op[1])
+    return op[1]
+
+
+class CharTable(dict):
+    """str.translate table of a sequence of character level ops
+
+    ops are ('translate', table) and ('map', func) with func replacing every
+    character on its own (func(text) == ''.join(func(char) for char in text)).
+    Entries are computed on first use of each character, by running the ops
+    on it, and kept.
+
+    str.lower is not character level for a final sigma, documents that may
+    hold one when lower cased run the ops one after the other instead.
+
+    Parameters
+    ----------
+    ops : list of tuples
+    """
+
+    def __init__(self, ops):
+
+        dict.__init__(self)
+        self.ops_ = list(ops)
+        self.__mappings = [_mapping(op) for op in self.ops_]
+
+        self.__contextual = frozenset()
+        produced = set()
+        for op in self.ops_:
+            if op[0] == 'map' and op[1] is str.lower:
+                self.__contextual = frozenset(_CONTEXTUAL_LOWER | produced)
+                break
+            if op[0] == 'translate':
+                produced.update(chr(key) for key, value in op[1].items()
+                                if not _CONTEXTUAL_LOWER.isdisjoint(chr(value) if isinstance(value, int) else value or ''))
+
+
+    def __reduce__(self):
+
+        return (CharTable, (self.ops_,))
+
+
+    def __missing__(self, key):
+
+        text = chr(key)
+        for mapping in self.__mappings:
+            text = mapping(text)
+        self[key] = text
+        return text
+
+
+    def translate(self, text):
+        """Run the ops on text"""
+
+        if self.__contextual and any(char in text for char in self.__contextual):
+            for mapping in self.__mappings:
+                text = mapping(text)
+            return text
+        return text.translate(self)
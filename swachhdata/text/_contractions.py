@@ -0,0 +1,243 @@
+"""Contraction expansion engine shared by every ContractionsRecast
+
+The mappings of the contractions package (contractions, leftovers and
+slang, as used by contractions.fix) and any user supplied mappings are
+compiled into a single Aho-Corasick automaton. Every contraction is added
+with each of the characters that may border it on both sides, and documents
+are mapped (lower cased, other non word characters folded into one) with
+bytes.translate before the scan, so the automaton only reports bounded
+contractions and a document is scanned once, in C. Matches are resolved
+and re-cased exactly as contractions.fix does, so the output is identical.
+
+The engine is built once per process per set of extra mappings, under a
+lock on first use (contraction_engine).
+"""
+import string
+import threading
+
+from ._base import LazyModule, _lazy_import
+
+contractions = LazyModule('contractions')
+ahocorasick = LazyModule('ahocorasick')
+
+# characters that may not border a contraction (textsearch bounds)
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
+# characters whose lower case is, or contains, an ASCII word character
+_LOWER_TO_ASCII = ['K', 'İ']
+
+# stand-ins of the non-ASCII characters of the contractions in mapped documents
+_PLACEHOLDERS = [chr(code) for code in [*range(0x01, 0x09), *range(0x0e, 0x20)]]
+
+# any other non word character of a mapped document
+_OTHER = '\x00'
+
+# trie key marking the end of a contraction
+_END = ''
+
+_engines = {}
+_lock = threading.Lock()
+
+
+def _sentence_case(word):
+
+    return word[0].upper() + word[1:].lower()
+
+
+def _recase(value, match):
+    """value in the case of match (textsearch insensitive norm)"""
+
+    if match == match.upper():
+        return value.upper()
+    if match == match.title():
+        return value.title()
+    if match == match.lower():
+        return value.lower()
+    if match == _sentence_case(match):
+        return _sentence_case(value)
+    return value
+
+
+class ContractionEngine:
+    """Case aware contraction expander
+
+    Contractions are matched case insensitively, where they are not part
+    of a longer word, and expanded in the case of the match, as
+    contractions.fix (leftovers=True, slang=True) does.
+
+    Parameters
+    ----------
+    extra : dict, default=None
+        contraction -> expansion, taking precedence over the mappings
+        of the contractions package
+    """
+
+    def __init__(self, extra=None):
+
+        self.__extra = dict(extra) if extra else None
+        self.__values = {}
+        for mapping in [contractions.contractions_dict, contractions.leftovers_dict, contractions.slang_dict, extra or {}]:
+            for key, value in mapping.items():
+                self.__values[key.lower()] = value
+
+        self.__trie = {}
+        for key in self.__values:
+            node = self.__trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[_END] = key
+
+        self.__compile()
+
+
+    def __compile(self):
+        """Automaton of the bounded contractions, translation of the documents"""
+
+        chars = set().union(*self.__values)
+        placeholders = [char for char in _PLACEHOLDERS if char not in chars]
+        foreign = sorted(char for char in chars if not char.isascii())
+
+        self.__automaton = None
+        if len(foreign) > len(placeholders) or _OTHER in chars:
+            return
+        try:
+            _lazy_import(ahocorasick)
+        except ImportError:
+            # without pyahocorasick documents are matched with the trie
+            return
+
+        placeholder = dict(zip(foreign, placeholders))
+        self.__placeholders = [(variant, placeholder[char]) for char in foreign
+                               for variant in sorted({char, char.upper(), char.title()})
+                               if len(variant) == 1 and variant.lower() == char]
+        self.__reserved = placeholders[:len(foreign)]
+        # non-ASCII characters are encoded as '?'
+        self.__foreign_text = '?' not in chars
+
+        bounds = sorted(char for char in chars if char.isascii() and char not in _WORD_CHARS)
+        table = bytearray(_OTHER.encode('ascii') * 256)
+        for char in [*string.ascii_lowercase, *string.digits, '_', *bounds, *placeholder.values()]:
+            table[ord(char)] = ord(char)
+        for char in string.ascii_uppercase:
+            table[ord(char)] = ord(char.lower())
+        self.__table = bytes(table)
+
+        pads = [*bounds, *placeholder.values(), _OTHER]
+        automaton = ahocorasick.Automaton()
+        for key in self.__values:
+            mapped = ''.join(placeholder.get(char, char) for char in key)
+            for left in pads:
+                for right in pads:
+                    automaton.add_word(left + mapped + right, (len(key), key))
+        automaton.make_automaton()
+        self.__automaton = automaton
+
+
+    def __reduce__(self):
+        """Worker processes use their own process-wide engine"""
+
+        return (contraction_engine, (self.__extra,))
+
+
+    def __mapped(self, text):
+        """text lower cased with its non word characters folded, None if it has
+        to be matched character by character"""
+
+        if self.__automaton is None:
+            return None
+        if not text.isascii() and (not self.__foreign_text or any(char in text for char in _LOWER_TO_ASCII)):
+            return None
+        if any(char in text for char in self.__reserved):
+            return None
+
+        for char, placeholder in self.__placeholders:
+            if char in text:
+                text = text.replace(char, placeholder)
+        return text.encode('ascii', 'replace').translate(self.__table).decode('ascii')
+
+
+    def __matches(self, text):
+        """(stop, start, key) of every contraction bordered by non word characters"""
+
+        mapped = self.__mapped(text)
+        if mapped is not None:
+            # the automaton reports a contraction with its borders
+            return [(end - 1, end - 1 - length, key)
+                    for end, (length, key) in self.__automaton.iter(_OTHER + mapped + _OTHER)]
+
+        lowered = text.lower()
+        size = len(text)
+        matches = []
+        for start in range(len(lowered)):
+            if 0 < start <= size and text[start - 1] in _WORD_CHARS:
+                continue
+            node = self.__trie.get(lowered[start])
+            stop = start
+            while node is not None:
+                stop += 1
+                key = node.get(_END)
+                if key is not None and (stop >= size or text[stop] not in _WORD_CHARS):
+                    matches.append((stop, start, key))
+                if stop == len(lowered):
+                    break
+                node = node.get(lowered[stop])
+        return matches
+
+
+    def fix(self, text):
+        """Expand the contractions of text
+
+        Returns
+        -------
+        ntext : string
+        """
+
+        matches = self.__matches(text)
+        if not matches:
+            return text
+
+        # overlapping matches are resolved as textsearch does: in order of
+        # their end, a match overlapping the last one kept replaces it if longer
+        matches.sort()
+        kept = []
+        current_stop = -1
+        for stop, start, key in matches:
+            value = _recase(self.__values[key], text[start:stop])
+            if start >= current_stop:
+                current_stop = stop
+                kept.append((current_stop - start, start, current_stop, value))
+            elif stop - start > kept[-1][0]:
+                current_stop = max(current_stop, stop)
+                kept[-1] = (current_stop - start, start, current_stop, value)
+
+        pieces, last = [], 0
+        for _, start, stop, value in kept:
+            pieces.append(text[last:start])
+            pieces.append(value)
+            last = stop
+        pieces.append(text[last:])
+        return ''.join(pieces)
+
+
+def contraction_engine(extra=None):
+    """ContractionEngine of the contractions package and extra mappings,
+    built once per process per extra mappings
+
+    Parameters
+    ----------
+    extra : dict, default=None
+        contraction -> expansion taking precedence over the package mappings
+
+    Returns
+    -------
+    engine : ContractionEngine
+    """
+
+    key = frozenset(extra.items()) if extra else None
+    engine = _engines.get(key)
+    if engine is None:
+        with _lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = _engines[key] = ContractionEngine(extra)
+    return engine
@@ -0,0 +1,78 @@
+"""Exact duplicate documents recast once (TextRecast / RecastPipeline dedup=True)"""
+import time
+
+from ._base import _is_series
+from ._profile import StageProfile, _nbytes
+
+
+class Deduplicated:
+    """Unique documents of a list / pandas.Series, and the fan out of their results
+
+    Documents are keyed by content in a dict (hash and equality of the
+    string), each unique document is kept once, in order of first occurrence.
+
+    Parameters
+    ----------
+    text : list of strings / pandas.core.series.Series
+    profile : RecastProfile, default=None
+        records the deduplication as a 'dedup' stage
+        (docs_modified: duplicate documents dropped)
+
+    Attributes
+    ----------
+    unique_ : list of strings / pandas.core.series.Series (same name and dtype as text)
+    ratio_ : float
+        share of the documents that are duplicates
+    """
+
+    def __init__(self, text, profile=None):
+
+        start, cpu_start = time.perf_counter(), time.process_time()
+
+        self.__index = None
+        series = _is_series(text)
+        if series:
+            self.__index = text.index
+            name, dtype = text.name, text.dtype
+            text = text.array
+
+        first = {}
+        self.__positions = [first.setdefault(doc, len(first)) for doc in text]
+        self.unique_ = list(first)
+        self.ratio_ = 1 - len(self.unique_) / len(self.__positions) if self.__positions else 0.0
+
+        if profile is not None:
+            stage = StageProfile('dedup')
+            stage.wall_time = time.perf_counter() - start
+            stage.cpu_time = time.process_time() - cpu_start
+            stage.docs = len(self.__positions)
+            stage.bytes_in = sum(_nbytes(self.unique_[i]) for i in self.__positions)
+            stage.bytes_out = sum(_nbytes(doc) for doc in self.unique_)
+            stage.docs_modified = len(self.__positions) - len(self.unique_)
+            profile._record(stage)
+
+        if series:
+            import pandas
+            self.unique_ = pandas.Series(self.unique_, name=name, dtype=dtype)
+
+
+    def expand(self, values):
+        """Results of the unique documents at the positions of every document
+
+        Parameters
+        ----------
+        values : list / pandas.Series of per unique document results, or a tuple of them
+
+        Returns
+        -------
+        values : list / pandas.Series (with the index of text), or a tuple of them
+        """
+
+        if isinstance(values, tuple):
+            return tuple(self.expand(value) for value in values)
+
+        if not _is_series(values):
+            return [values[i] for i in self.__positions]
+
+        import pandas
+        return pandas.Series(values.take(self.__positions).array, index=self.__index, name=values.name, dtype=values.dtype)
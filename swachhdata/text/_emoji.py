@@ -0,0 +1,165 @@
+"""Emoji matching engine shared by every EmojiRecast
+
+Every emoji sequence known to the emoji package (ZWJ sequences, skin tone
+modifiers, flags, keycaps, ...) is stored in a character trie. A compiled
+character class finds the runs of characters emoji are made of, and the
+trie matches the longest emoji at each position of a run, so a document is
+scanned in linear time and multi-codepoint emoji are matched as a unit.
+
+The matcher is built once per process, under a lock on first use (emoji_matcher).
+"""
+import re
+import threading
+
+from ._base import LazyModule
+
+emoji = LazyModule('emoji')
+
+# languages of the emoji package whose emoji are matched
+LANGUAGES = ['en', 'es', 'pt', 'it']
+
+# trie key marking the end of an emoji
+_END = ''
+
+# characters demojize drops outside of emoji
+_VARIATION_SELECTORS = {0xfe0e: None, 0xfe0f: None}
+
+_matcher = None
+_lock = threading.Lock()
+
+
+def _char_class(chars, gap=16):
+    """Character class matching runs of chars (and of code points at most gap apart)"""
+
+    ranges = []
+    for code in sorted({ord(char) for char in chars}):
+        if ranges and code - ranges[-1][1] <= gap:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return '[' + ''.join(re.escape(chr(start)) if start == end else f'{re.escape(chr(start))}-{re.escape(chr(end))}'
+                         for start, end in ranges) + ']+'
+
+
+class EmojiMatcher:
+    """Longest-match emoji scanner
+
+    Parameters
+    ----------
+    emojis : iterable of strings
+        emoji sequences to match
+    names : dict, default=None
+        emoji -> name used by demojize (emoji without a name are kept)
+    """
+
+    def __init__(self, emojis, names=None):
+
+        emojis = list(emojis)
+        self.__trie = {}
+        for em in emojis:
+            node = self.__trie
+            for char in em:
+                node = node.setdefault(char, {})
+            node[_END] = True
+        self.__runs = re.compile(_char_class(char for em in emojis for char in em))
+        self.__names = names or {}
+
+
+    def __reduce__(self):
+        """Worker processes use their own process-wide matcher"""
+
+        return (emoji_matcher, ())
+
+
+    def spans(self, text):
+        """(start, end) of every emoji in text, longest match first, left to right"""
+
+        # every emoji has a non-ASCII code point
+        if text.isascii():
+            return []
+
+        trie = self.__trie
+        spans = []
+        for run in self.__runs.finditer(text):
+            i, end = run.span()
+            while i < end:
+                node, j, last = trie.get(text[i]), i, 0
+                while node is not None:
+                    j += 1
+                    if _END in node:
+                        last = j
+                    if j == end:
+                        break
+                    node = node.get(text[j])
+                if last:
+                    spans.append((i, last))
+                    i = last
+                else:
+                    i += 1
+        return spans
+
+
+    def findall(self, text):
+        """Emoji in text, in order"""
+
+        return [text[start:end] for start, end in self.spans(text)]
+
+
+    def contains(self, text):
+
+        return bool(self.spans(text))
+
+
+    def sub(self, repl, text, spans=None):
+        """Replace every emoji in text with repl (string, or callable on the emoji)"""
+
+        spans = self.spans(text) if spans is None else spans
+        if not spans:
+            return text
+
+        pieces, last = [], 0
+        for start, end in spans:
+            pieces.append(text[last:start])
+            pieces.append(repl(text[start:end]) if callable(repl) else repl)
+            last = end
+        pieces.append(text[last:])
+        return ''.join(pieces)
+
+
+    def demojize(self, text, spans=None, space_out=False):
+        """emoji.demojize(text, delimiters=('', '')): emoji replaced by their name,
+        variation selectors outside of emoji dropped (space_out: a space before each name)"""
+
+        spans = self.spans(text) if spans is None else spans
+        if not spans:
+            return text.translate(_VARIATION_SELECTORS)
+
+        names = self.__names
+        pieces, last = [], 0
+        for start, end in spans:
+            em = text[start:end]
+            pieces.append(text[last:start].translate(_VARIATION_SELECTORS))
+            if space_out:
+                pieces.append(' ')
+            pieces.append(names.get(em, em))
+            last = end
+        pieces.append(text[last:].translate(_VARIATION_SELECTORS))
+        return ''.join(pieces)
+
+
+def emoji_matcher():
+    """EmojiMatcher of the emoji package, built once per process"""
+
+    global _matcher
+    if _matcher is None:
+        with _lock:
+            if _matcher is None:
+                unicode_emoji = getattr(emoji, 'UNICODE_EMOJI', None)
+                if unicode_emoji is not None:
+                    emojis = set().union(*(unicode_emoji[language] for language in LANGUAGES))
+                    names = {em: name[1:-1] for em, name in unicode_emoji['en'].items()}
+                else:
+                    emojis = set(emoji.EMOJI_DATA)
+                    names = {em: data['en'][1:-1] for em, data in emoji.EMOJI_DATA.items() if 'en' in data}
+                _matcher = EmojiMatcher(emojis, names)
+    return _matcher
@@ -0,0 +1,141 @@
+"""HTML cleaning engine of htmlRecast
+
+Documents are cleaned in three tiers:
+
+* no '<' and no '&': nothing to clean, the document is returned as is
+* entities only: html.unescape (entities of the unescaped text are
+  decoded once more, as they would be by parsing it)
+* markup: the text of the document is streamed out of html.parser,
+  no document tree is built
+
+Text of <script> / <style> elements can be dropped and block level
+elements (paragraphs, line breaks, list items, ...) can be separated.
+"""
+from html import unescape
+from html.parser import HTMLParser
+
+# elements whose text is dropped (drop_scripts=True)
+SCRIPT_TAGS = frozenset(['script', 'style', 'template'])
+
+# elements separated by block_separator
+BLOCK_TAGS = frozenset([
+    'address', 'article', 'aside', 'blockquote', 'br', 'caption', 'dd', 'details', 'dialog', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr',
+    'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead',
+    'title', 'tr', 'ul'
+])
+
+
+class _TextExtractor(HTMLParser):
+    """html.parser handler collecting the text of a document"""
+
+    def __init__(self, drop_scripts, block_separator):
+
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self.__drop = SCRIPT_TAGS if drop_scripts else frozenset()
+        self.__separator = block_separator
+        self.pieces = []
+        self.__dropped = 0
+
+
+    def reset(self):
+
+        HTMLParser.reset(self)
+        self.pieces = []
+        self.__dropped = 0
+
+
+    def __separate(self):
+        """block boundary: a single separator in place of the whitespace around it"""
+
+        if self.__separator is None or not self.pieces or self.pieces[-1] is self.__separator:
+            return
+        if self.pieces[-1].isspace():
+            self.pieces[-1] = self.__separator
+        else:
+            self.pieces.append(self.__separator)
+
+
+    def handle_starttag(self, tag, attrs):
+
+        if tag in self.__drop:
+            self.__dropped += 1
+        elif tag in BLOCK_TAGS:
+            self.__separate()
+
+
+    def handle_endtag(self, tag):
+
+        if tag in self.__drop:
+            self.__dropped = max(self.__dropped - 1, 0)
+        elif tag in BLOCK_TAGS:
+            self.__separate()
+
+
+    def handle_data(self, data):
+
+        if self.__dropped:
+            return
+        if self.pieces and self.pieces[-1] is self.__separator and data.isspace():
+            return
+        self.pieces.append(data)
+
+
+class HTMLCleaner:
+    """Text of HTML documents
+
+    Parameters
+    ----------
+    drop_scripts : bool, default=True
+        drop the text of <script>, <style> and <template> elements
+    block_separator : string, default=None
+        inserted between block level elements (e.g. ' ' or '\\n'),
+        None joins their text as is
+    """
+
+    def __init__(self, drop_scripts=True, block_separator=None):
+
+        self.__drop_scripts = drop_scripts
+        self.__block_separator = block_separator
+        self.__parser = _TextExtractor(drop_scripts, block_separator)
+
+
+    def __reduce__(self):
+
+        return (HTMLCleaner, (self.__drop_scripts, self.__block_separator))
+
+
+    def markup_text(self, text):
+        """Text of a document holding markup"""
+
+        parser = self.__parser
+        parser.feed(text)
+        parser.close()
+        pieces = parser.pieces
+        if pieces and pieces[-1] is self.__block_separator:
+            pieces.pop()
+        if pieces and pieces[0] is self.__block_separator:
+            pieces = pieces[1:]
+        ntext = ''.join(pieces)
+        parser.reset()
+        return ntext
+
+
+    def clean(self, text):
+        """Text of a document, entities unescaped and markup removed
+
+        Returns
+        -------
+        ntext : string
+        """
+
+        if '<' not in text:
+            if '&' not in text:
+                return text
+            text = unescape(text)
+            if '<' not in text:
+                # entities left by unescape are decoded once more, as parsing the markup would
+                return unescape(text) if '&' in text else text
+        else:
+            text = unescape(text)
+        return self.markup_text(text)
@@ -0,0 +1,479 @@
+"""Compiled RecastPipeline: every stage runs on one document before the next
+
+Recasts that only rewrite strings describe their process as a list of ops
+(TextFormatter._recast_ops), adjacent ones are fused into a single stage:
+    ('sub', pattern, repl)      re.sub(pattern, repl, text)
+    ('replace', old, new)       text.replace(old, new)
+    ('translate', table)        text.translate(table)
+    ('map', func)               func(text), func replacing every character on its own
+    ('squeeze',)                text.replace(' '*4, ' ').replace(' '*3, ' ').replace(' '*2, ' ').strip()
+                                in a single pass
+    ('collapse',)               ' '.join(text.split())
+    ('strip',)                  text.strip()
+    ('call', func)              func(text)
+
+Within a fused stage adjacent single character replacements, translate
+tables and character maps are composed into one table (a CharTable once a
+map is involved), so they run as a single str.translate call. Whitespace
+collapsing drops the space squeezing and stripping right before it, and
+repeated collapsing; squeezing already strips. Character level ops that
+leave whitespace alone (case maps, tables not touching whitespace) run
+before a squeeze right ahead of them, so they join the table of the ops
+before it. Regex substitutions are kept in order, each one compiled once.
+"""
+import re
+import time
+from functools import partial
+from operator import methodcaller
+
+from ._base import TextFormatter, _n_workers
+from ._profile import StageProfile, _nbytes
+from ._charmap import CharTable, squeeze_spaces
+
+# ops replacing every character on their own, composed into a single table
+_CHAR_OPS = ('translate', 'map')
+
+
+def _collapse(text):
+
+    return ' '.join(text.split())
+
+
+def _table(table):
+    """str.translate table with string values ('' for deleted characters)"""
+
+    return {key: '' if value is None else chr(value) if isinstance(value, int) else value for key, value in table.items()}
+
+
+def _compose(first, second):
+    """Table translating like first followed by second"""
+
+    table = {key: value.translate(second) for key, value in first.items()}
+    for key, value in second.items():
+        table.setdefault(key, value)
+    return table
+
+
+def _squeezes(op):
+    """Check if op shortens runs of spaces (a collapse afterwards makes it redundant)"""
+
+    return op[0] in ('strip', 'squeeze') or (op[0] == 'replace' and len(op[1]) > 1 and op[1].strip(' ') == '' and op[2] == ' ')
+
+
+def _keeps_whitespace(op):
+    """Check if a character level op neither makes nor changes whitespace (it commutes with squeezing)"""
+
+    if op[0] == 'map':
+        return op[1] is str.lower or op[1] is str.upper
+    return not any(chr(key).isspace() or any(char.isspace() for char in value) for key, value in op[1].items())
+
+
+def _char_stage(ops):
+    """Single translate op of adjacent character level ops"""
+
+    composed = []
+    for op in ops:
+        if op[0] == 'translate' and composed and composed[-1][0] == 'translate':
+            composed[-1] = ('translate', _compose(composed[-1][1], op[1]))
+        else:
+            composed.append(op)
+
+    if len(composed) == 1:
+        return composed[0]
+    return ('translate', CharTable(composed))
+
+
+def _optimize(ops):
+
+    merged = []
+    for op in ops:
+
+        if op[0] == 'replace' and len(op[1]) == 1:
+            op = ('translate', {ord(op[1]): op[2]})
+        if op[0] == 'translate':
+            op = ('translate', _table(op[1]))
+
+        last = merged[-1][0] if merged else None
+        if op[0] in _CHAR_OPS:
+            if last == 'squeeze' and len(merged) > 1 and merged[-2][0] == 'chars' and _keeps_whitespace(op):
+                merged[-2][1].append(op)
+            elif last == 'chars':
+                merged[-1][1].append(op)
+            else:
+                merged.append(('chars', [op]))
+        elif op[0] == 'collapse':
+            while merged and _squeezes(merged[-1]):
+                merged.pop()
+            if not merged or merged[-1][0] != 'collapse':
+                merged.append(op)
+        elif op[0] == 'strip' and last in ('collapse', 'squeeze', 'strip'):
+            continue
+        else:
+            merged.append(op)
+
+    return [_char_stage(op[1]) if op[0] == 'chars' else op for op in merged]
+
+
+def _step(op):
+
+    if op[0] == 'sub':
+        return partial(re.compile(op[1]).sub, op[2])
+    elif op[0] == 'replace':
+        return methodcaller('replace', op[1], op[2])
+    elif op[0] == 'translate':
+        if isinstance(op[1], CharTable):
+            return op[1].translate
+        return methodcaller('translate', op[1])
+    elif op[0] == 'map':
+        return op[1]
+    elif op[0] == 'squeeze':
+        return squeeze_spaces
+    elif op[0] == 'collapse':
+        return _collapse
+    elif op[0] == 'strip':
+        return methodcaller('strip')
+    elif op[0] == 'call':
+        return op[1]
+    raise ValueError(f'Unknown recast op {op[0]!r}')
+
+
+class FusedStage:
+    """Single stage running the string rewrite ops of adjacent recasts
+
+    Parameters
+    ----------
+    ops : list of tuples
+    """
+
+    def __init__(self, ops):
+
+        self.ops_ = _optimize(ops)
+        self.__steps = [_step(op) for op in self.ops_]
+
+
+    def __call__(self, text):
+
+        for step in self.__steps:
+            text = step(text)
+        return text
+
+
+def compile_stages(recastFuncs):
+    """Stages of a compiled pipeline
+
+    Returns
+    -------
+    stages : list of (recasts, stage, side_output)
+        recasts covered by the stage, single document callable,
+        attribute the stage's extracted values go to (None if it does not extract)
+    """
+
+    stages, ops, fused = [], [], []
+
+    def flush():
+        if fused:
+            stages.append((list(fused), FusedStage(ops), None))
+            ops.clear()
+            fused.clear()
+
+    for rec in recastFuncs:
+        rec_ops = rec._recast_ops()
+        if rec_ops is not None:
+            ops.extend(rec_ops)
+            fused.append(rec)
+        else:
+            flush()
+            stages.append(([rec], rec._document_recast(), rec._side_output()))
+    flush()
+
+    return stages
+
+
+def _read(iterable, stage_profile):
+    """Documents of iterable, counting them as stage input"""
+
+    for text in iterable:
+        stage_profile.docs += 1
+        stage_profile.bytes_in += _nbytes(text)
+        yield text
+
+
+def _waited(results, stage_profile, extracting):
+    """Results of worker processes, counting the time spent waiting on them as the stage's time"""
+
+    results = iter(results)
+    while True:
+        start, cpu_start = time.perf_counter(), time.process_time()
+        result = next(results, None)
+        stage_profile.wall_time += time.perf_counter() - start
+        stage_profile.cpu_time += time.process_time() - cpu_start
+        if result is None:
+            return
+        stage_profile.bytes_out += _nbytes(result[0] if extracting else result)
+        yield result
+
+
+class CompiledPipeline(TextFormatter):
+    """Run recasts one document at a time (RecastPipeline compiled=True / streaming)
+
+    Only the intermediate strings of the current document are kept alive,
+    and adjacent string rewriting recasts run as one fused stage.
+
+    Values extracted by intermediate stages (process='extract_remove', ...)
+    are set on the recast's side output attribute (url_, mention_, ...);
+    when the last stage extracts, (ntext, extracted) is returned.
+
+    Parameters
+    ----------
+    recastFuncs : list of Recast objects
+    verbose : int (0, 1, -1), default=1
+    n_jobs : int, default=1 (-1 uses all cores)
+    chunksize : int, default=None
+    profile : RecastProfile, default=None
+        records every compiled stage, or the whole pipeline as one stage
+        when documents are recast in worker processes (documents modified
+        are not counted when streaming from worker processes)
+    """
+
+    def __init__(self, recastFuncs, verbose=1, n_jobs=1, chunksize=None, profile=None):
+
+        TextFormatter.__init__(self, n_jobs, chunksize)
+        self.__setup = False
+        self.__recasts = list(recastFuncs)
+        self.__verbose_status = True
+        self.__verbose = verbose
+        if self.__verbose == -1:
+            self.__verbose_status = False
+        self.stages_ = compile_stages(self.__recasts)
+        self.__extracting = [i for i, (_, _, attr) in enumerate(self.stages_) if attr is not None]
+        self.__profile = profile
+        self.__stage_profiles = None
+
+
+    def setup(self, text):
+        """Change the input text type to supported type
+        Parameters
+        ----------
+        text : string / list of strings / pandas.core.series.Series
+
+        Returns
+        -------
+        self : object
+        """
+
+        self._dtype = type(text)
+        self._text = text
+        self._TextFormatter__text_formatter()
+        self.__setup = True
+
+
+    def __base_recast(self, text):
+        """Run every stage on a single document
+
+        Returns
+        -------
+        ntext : string / list of strings
+            Processed text
+        ntext, extracted : string / list of strings, tuple (a stage extracts)
+            Processed text, values extracted by each extracting stage
+        """
+
+        extracted = []
+        for _, stage, attr in self.stages_:
+            text = stage(text)
+            if attr is not None:
+                text, values = text
+                extracted.append(values)
+
+        if self.__extracting:
+            return text, tuple(extracted)
+        return text
+
+
+    def __profiled_recast(self, text):
+        """__base_recast, adding each stage's measurements to its StageProfile"""
+
+        extracted = []
+        for (_, stage, attr), stage_profile in zip(self.stages_, self.__stage_profiles):
+            start, cpu_start = time.perf_counter(), time.process_time()
+            ntext = stage(text)
+            wall_time, cpu_time = time.perf_counter() - start, time.process_time() - cpu_start
+            if attr is not None:
+                ntext, values = ntext
+                extracted.append(values)
+            stage_profile.add(text, ntext, wall_time, cpu_time)
+            text = ntext
+
+        if self.__extracting:
+            return text, tuple(extracted)
+        return text
+
+
+    def __stage_name(self, recasts):
+
+        return ' + '.join(type(rec).__name__ for rec in recasts)
+
+
+    def __per_stage(self, count=None):
+        """Whether the profile records every stage (documents are recast in this process)"""
+
+        n_jobs = _n_workers(self._n_jobs)
+        if count is not None:
+            n_jobs = min(n_jobs, count)
+        return self.__profile is not None and n_jobs <= 1
+
+
+    def __start_profile(self):
+
+        self.__stage_profiles = [StageProfile(self.__stage_name(recasts)) for recasts, _, _ in self.stages_]
+
+
+    def __finish_profile(self):
+
+        for stage_profile in self.__stage_profiles:
+            self.__profile._record(stage_profile)
+        self.__stage_profiles = None
+
+
+    def _document_recast(self):
+        """Single document recast used by streaming pipelines"""
+
+        if self.__stage_profiles is not None:
+            return self.__profiled_recast
+        return self.__base_recast
+
+
+    def recast_iter(self, iterable):
+        """Lazily run the pipeline on every document of an iterable
+
+        Parameters
+        ----------
+        iterable : iterable of strings (list, generator, file, pandas.Series, ...)
+
+        Yields
+        ------
+        ntext : string / list of strings
+            Processed document
+        ntext, extracted : string / list of strings, dict (a stage extracts)
+            Processed document, values extracted from it keyed by side output attribute (url_, ...)
+        """
+
+        attrs = [self.stages_[i][2] for i in self.__extracting]
+        stage_profile = None
+        if self.__per_stage():
+            self.__start_profile()
+        elif self.__profile is not None:
+            stage_profile = StageProfile(f'{self.__stage_name(self.__recasts)} (n_jobs={_n_workers(self._n_jobs)})')
+            iterable = _read(iterable, stage_profile)
+
+        results = TextFormatter.recast_iter(self, iterable)
+        if stage_profile is not None:
+            results = _waited(results, stage_profile, bool(attrs))
+
+        for result in results:
+            if attrs:
+                ntext, extracted = result
+                yield ntext, dict(zip(attrs, extracted))
+            else:
+                yield result
+
+        if self.__stage_profiles is not None:
+            self.__finish_profile()
+        elif stage_profile is not None:
+            self.__profile._record(stage_profile)
+
+
+    def __set_side_outputs(self, extracted, single=False):
+        """Set the values extracted by each stage on its recast
+
+        Returns
+        -------
+        values extracted by the last stage, None if it does not extract
+        """
+
+        last = None
+        for j, i in enumerate(self.__extracting):
+            values = extracted[j] if single else [doc[j] for doc in extracted]
+            recasts, _, attr = self.stages_[i]
+            setattr(recasts[0], attr, values)
+            if i == len(self.stages_) - 1:
+                last = values
+        return last
+
+
+    def recast(self):
+        """Run the pipeline on the setup text
+
+        Returns
+        -------
+        ntext : string / list of strings / pandas.core.series.Series
+            Processed text
+        ntext, extracted : (last stage extracts)
+            Processed text, Extracted values
+        """
+
+        try:
+            assert(self.__setup)
+        except:
+            print(f'method setup needs to be called before recast')
+
+        if self.__profile is None:
+            return self.__recast(self.__base_recast)
+
+        if not self.__per_stage(self._count):
+            name = f'{self.__stage_name(self.__recasts)} (n_jobs={min(_n_workers(self._n_jobs), self._count)})'
+            return self.__profile._measure(name, lambda text: self.__recast(self.__base_recast), self._text)
+
+        self.__start_profile()
+        result = self.__recast(self.__profiled_recast)
+        self.__finish_profile()
+        return result
+
+
+    def __recast(self, base_recast):
+
+        if self._dtype == str:
+
+            result = base_recast(self._text)
+            if not self.__extracting:
+                return result
+            ntext, extracted = result
+            last = self.__set_side_outputs(extracted, single=True)
+
+        elif self._dtype == list:
+
+            strings = self.stages_[-1][0][-1]._recast_strings()
+            postfix = {'RecastPipeline': f'{len(self.__recasts)} recasts, {len(self.stages_)} compiled stages'}
+
+            if not self.__extracting:
+                return self._TextFormatter__recast_text(base_recast, self.__verbose, self.__verbose_status,
+                                                        postfix, strings=strings)
+
+            ntext, extracted = self._TextFormatter__recast_text(base_recast, self.__verbose, self.__verbose_status,
+                                                                postfix, extract=True, strings=strings)
+            last = self.__set_side_outputs(extracted)
+            if last is not None:
+                last = self._TextFormatter__text_output(last, strings=False)
+
+        return ntext if last is None else (ntext, last)
+
+
+    def setup_recast(self, text):
+        """Change the input text type to supported type
+        and
+        Run the pipeline on the setup text
+
+        Parameters
+        ----------
+        text : string / list of strings / pandas.core.series.Series
+
+        Returns
+        -------
+        ntext : string / list of strings / pandas.core.series.Series
+            Processed text
+        ntext, extracted : (last stage extracts)
+            Processed text, Extracted values
+        """
+
+        self.setup(text)
+        return self.recast()
@@ -0,0 +1,196 @@
+"""Opt-in stage level profiling for TextRecast and RecastPipeline"""
+import time
+
+
+def _documents(text):
+
+    if isinstance(text, str):
+        return [text]
+    return text
+
+
+def _nbytes(document):
+    """UTF-8 size of a document, or of the tokens / values a stage returned for it"""
+
+    if isinstance(document, str):
+        return len(document.encode('utf-8'))
+    if isinstance(document, (list, tuple)):
+        return sum(_nbytes(value) for value in document)
+    return len(str(document).encode('utf-8'))
+
+
+class StageProfile:
+    """Measurements of a single TextRecast / RecastPipeline stage
+
+    Attributes
+    ----------
+    name : string
+        recast(s) run by the stage
+    wall_time : float
+        seconds
+    cpu_time : float
+        seconds of CPU time of this process
+    docs : int
+        documents recast
+    bytes_in : int
+        UTF-8 bytes of the input documents
+    bytes_out : int
+        UTF-8 bytes of the output documents (tokens / extracted values for those processes)
+    docs_modified : int
+        documents the stage changed
+    """
+
+    def __init__(self, name):
+
+        self.name = name
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.docs = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.docs_modified = 0
+
+
+    def add(self, text, ntext, wall_time, cpu_time):
+        """Account for a recast of text (document(s)) into ntext"""
+
+        documents, ndocuments = _documents(text), _documents(ntext)
+        self.wall_time += wall_time
+        self.cpu_time += cpu_time
+        for document, ndocument in zip(documents, ndocuments):
+            self.docs += 1
+            self.bytes_in += _nbytes(document)
+            self.bytes_out += _nbytes(ndocument)
+            self.docs_modified += document != ndocument
+
+
+    def as_dict(self):
+
+        return {'name': self.name, 'wall_time': self.wall_time, 'cpu_time': self.cpu_time, 'docs': self.docs,
+                'bytes_in': self.bytes_in, 'bytes_out': self.bytes_out, 'docs_modified': self.docs_modified}
+
+
+    def __repr__(self):
+
+        return (f'StageProfile({self.name!r}, wall_time={self.wall_time:.4f}, cpu_time={self.cpu_time:.4f}, docs={self.docs}, '
+                f'bytes_in={self.bytes_in}, bytes_out={self.bytes_out}, docs_modified={self.docs_modified})')
+
+
+class RecastProfile:
+    """Stage level report of a TextRecast / RecastPipeline run
+
+    Pass an instance as profile= to record every stage of the run in it,
+    stages of later runs are appended.
+
+    Parameters
+    ----------
+    callback : callable, default=None
+        called with each StageProfile as soon as its stage completes
+
+    Attributes
+    ----------
+    stages_ : list of StageProfile
+
+    Examples
+    --------
+    >>> from swachhdata.text import RecastProfile, RecastPipeline, urlRecast, CaseRecast
+    >>> profile = RecastProfile()
+    >>> text = RecastPipeline(texts, [urlRecast(), CaseRecast()], profile=profile)
+    >>> print(profile)
+    >>> profile.to_frame().sort_values('wall_time')
+    """
+
+    def __init__(self, callback=None):
+
+        self.stages_ = []
+        self.__callback = callback
+
+
+    def _record(self, stage):
+
+        self.stages_.append(stage)
+        if self.__callback is not None:
+            self.__callback(stage)
+
+
+    def _measure(self, name, recast, text):
+        """Run recast(text) as a stage
+
+        Returns
+        -------
+        recast(text)
+        """
+
+        stage = StageProfile(name)
+        start, cpu_start = time.perf_counter(), time.process_time()
+        result = recast(text)
+        wall_time, cpu_time = time.perf_counter() - start, time.process_time() - cpu_start
+
+        ntext = result[0] if isinstance(result, tuple) else result
+        stage.add(text, ntext, wall_time, cpu_time)
+        self._record(stage)
+        return result
+
+
+    @property
+    def wall_time(self):
+
+        return sum(stage.wall_time for stage in self.stages_)
+
+
+    @property
+    def dedup_ratio(self):
+        """Share of duplicate documents of the deduplicated runs (dedup=True), None if there were none"""
+
+        stages = [stage for stage in self.stages_ if stage.name == 'dedup']
+        docs = sum(stage.docs for stage in stages)
+        if not docs:
+            return None
+        return sum(stage.docs_modified for stage in stages) / docs
+
+
+    def no_op_stages(self):
+        """Stages that did not modify any document"""
+
+        return [stage for stage in self.stages_ if stage.docs and not stage.docs_modified]
+
+
+    def dominant_stage(self):
+        """Stage with the largest wall time, None if nothing was recorded"""
+
+        return max(self.stages_, key=lambda stage: stage.wall_time, default=None)
+
+
+    def to_frame(self):
+        """Stages as a pandas.DataFrame"""
+
+        import pandas
+        return pandas.DataFrame([stage.as_dict() for stage in self.stages_],
+                                columns=['name', 'wall_time', 'cpu_time', 'docs', 'bytes_in', 'bytes_out', 'docs_modified'])
+
+
+    def __str__(self):
+
+        lines = [f'{"stage":<40} {"wall s":>9} {"cpu s":>9} {"docs":>10} {"MB in":>9} {"MB out":>9} {"modified":>10}']
+        for stage in self.stages_:
+            lines.append(f'{stage.name[:40]:<40} {stage.wall_time:>9.3f} {stage.cpu_time:>9.3f} {stage.docs:>10} '
+                         f'{stage.bytes_in / 1e6:>9.2f} {stage.bytes_out / 1e6:>9.2f} {stage.docs_modified:>10}')
+        return '\n'.join(lines)
+
+
+def measure(profile, name, recast, text):
+    """recast(text), recorded as a stage of profile when profiling"""
+
+    if profile is None:
+        return recast(text)
+    return profile._measure(name, recast, text)
+
+
+def as_profile(profile):
+    """RecastProfile for the profile= argument (None, a RecastProfile or a callback)"""
+
+    if profile is None or isinstance(profile, RecastProfile):
+        return profile
+    if callable(profile):
+        return RecastProfile(callback=profile)
+    raise TypeError(f'Expected profile input RecastProfile or callable, input type received {type(profile)}')
@@ -0,0 +1,270 @@
+"""Process-wide registries of the resources shared by every recast
+
+Stop words are kept as one frozenset per (package, language), loaded on
+first use and shared by every StopWordsRecast and TextRecast call.
+
+spacy models are kept as one Language object per (model, disabled
+components) in spacy_models, shared by every TokenisationRecast and
+LemmatizationRecast until released.
+
+The nltk part of speech tagger, WordNet lemmatizer and stemmers are loaded
+once; lemmas, stems and num2words conversions (one cache per language) are
+memoized in bounded LRU caches that live across recast calls. Every
+resource is built under a lock on first use, so threads share one copy.
+"""
+import gc
+import threading
+from functools import lru_cache, partial
+
+from ._base import LazyModule
+from ..resources import RESOURCES, configure_nltk, require
+
+nltk = LazyModule('nltk', setup=configure_nltk)
+spacy = LazyModule('spacy')
+spacy_util = LazyModule('spacy.util')
+gensim_preprocessing = LazyModule('gensim.parsing.preprocessing')
+num2words = LazyModule('num2words')
+
+# nltk stopwords corpus names of the spacy language codes
+LANGUAGES = {
+    'ar': 'arabic', 'da': 'danish', 'de': 'german', 'el': 'greek', 'en': 'english', 'es': 'spanish',
+    'fi': 'finnish', 'fr': 'french', 'hu': 'hungarian', 'id': 'indonesian', 'it': 'italian', 'nb': 'norwegian',
+    'nl': 'dutch', 'pt': 'portuguese', 'ro': 'romanian', 'ru': 'russian', 'sv': 'swedish', 'tr': 'turkish'
+}
+
+# (word, part of speech) -> lemma entries kept by wordnet_lemma
+LEMMA_CACHE_SIZE = 2 ** 17
+
+# (method, word) -> stem entries kept by stem
+STEM_CACHE_SIZE = 2 ** 17
+
+# number -> words entries kept per language by number_words
+NUMBER_CACHE_SIZE = 2 ** 14
+
+# WordNet part of speech of the first letter of a Penn Treebank tag (noun otherwise)
+WORDNET_POS = {'J': 'a', 'N': 'n', 'V': 'v', 'R': 'r'}
+
+_stopwords = {}
+_nltk_tagger = None
+_wordnet_lemmatizer = None
+_stemmers = {}
+_number_words = {}
+
+# guards the first load of the resources above, shared by threads
+_lock = threading.Lock()
+
+
+def _language_code(language):
+
+    for code, name in LANGUAGES.items():
+        if language == name:
+            return code
+    return language
+
+
+def _load_stopwords(package, language):
+
+    if package == 'nltk':
+        return nltk.corpus.stopwords.words(LANGUAGES.get(language, language))
+
+    elif package == 'spacy':
+        # the language defaults hold the stop list, no model pipeline is loaded
+        return spacy_util.get_lang_class(_language_code(language)).Defaults.stop_words
+
+    elif package == 'gensim':
+        if _language_code(language) != 'en':
+            raise ValueError(f'gensim only has english stop words, language received {language!r}')
+        return gensim_preprocessing.STOPWORDS
+
+    raise ValueError(f'Unknown stop words package {package!r}')
+
+
+def stopwords(package, language='english'):
+    """Stop words of package ('nltk', 'spacy', 'gensim') for language
+
+    Parameters
+    ----------
+    package : string
+    language : string, nltk name ('english') or code ('en')
+
+    Returns
+    -------
+    stopwords : frozenset
+    """
+
+    key = (package, _language_code(language))
+    words = _stopwords.get(key)
+    if words is None:
+        with _lock:
+            words = _stopwords.get(key)
+            if words is None:
+                words = _stopwords[key] = frozenset(_load_stopwords(*key))
+    return words
+
+
+def nltk_tagger():
+    """nltk PerceptronTagger (the tagger of nltk.pos_tag), loaded once per process"""
+
+    global _nltk_tagger
+    if _nltk_tagger is None:
+        with _lock:
+            if _nltk_tagger is None:
+                _nltk_tagger = nltk.tag.PerceptronTagger()
+    return _nltk_tagger
+
+
+def wordnet_pos(tag):
+    """WordNet part of speech of a Penn Treebank tag"""
+
+    return WORDNET_POS.get(tag[:1].upper(), 'n')
+
+
+@lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def word_tag(word):
+    """Tag of word tagged on its own"""
+
+    return nltk_tagger().tag([word])[0][1]
+
+
+@lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def wordnet_lemma(word, pos):
+    """WordNetLemmatizer().lemmatize(word, pos), memoized"""
+
+    return wordnet_lemmatizer().lemmatize(word, pos)
+
+
+def wordnet_lemmatizer():
+    """nltk WordNetLemmatizer with the WordNet corpus loaded, created once per process"""
+
+    global _wordnet_lemmatizer
+    if _wordnet_lemmatizer is None:
+        with _lock:
+            if _wordnet_lemmatizer is None:
+                # the corpus loads itself on first access, which threads must not race on
+                nltk.corpus.wordnet.ensure_loaded()
+                _wordnet_lemmatizer = nltk.stem.WordNetLemmatizer()
+    return _wordnet_lemmatizer
+
+
+def stemmer(method):
+    """nltk stemmer of method ('porter', 'snowball'), created once per process"""
+
+    if method not in _stemmers:
+        with _lock:
+            if method not in _stemmers:
+                if method == 'porter':
+                    _stemmers[method] = nltk.stem.porter.PorterStemmer()
+                elif method == 'snowball':
+                    _stemmers[method] = nltk.stem.snowball.SnowballStemmer('english')
+                else:
+                    raise ValueError(f'Unknown stemming method {method!r}')
+    return _stemmers[method]
+
+
+@lru_cache(maxsize=STEM_CACHE_SIZE)
+def stem(method, word):
+    """stemmer(method).stem(word), memoized"""
+
+    return stemmer(method).stem(word)
+
+
+def number_words(lang='en'):
+    """num2words.num2words for lang, memoized per number in a bounded cache of the language
+
+    Returns
+    -------
+    words : callable, int -> string
+    """
+
+    words = _number_words.get(lang)
+    if words is None:
+        with _lock:
+            words = _number_words.get(lang)
+            if words is None:
+                words = _number_words[lang] = lru_cache(maxsize=NUMBER_CACHE_SIZE)(partial(num2words.num2words, lang=lang))
+    return words
+
+
+def _model_path(model):
+    """Location spacy.load loads model from: the data directory resolved by
+    swachhdata.resources for the models it knows, model itself otherwise"""
+
+    if RESOURCES.get(model, {}).get('package') == 'spacy':
+        return require(model)[model]
+    return model
+
+
+class ModelRegistry:
+    """Shared spacy models, loaded once per process
+
+    Every (model, disabled components) pair is loaded on first use and the
+    same Language object is returned to every recast and TextRecast call
+    until it is released. Worker processes hold their own registry.
+
+    Examples
+    --------
+    >>> from swachhdata.text import spacy_models
+    >>> spacy_models.warm('en_core_web_sm')
+    >>> # ... recasts using package='spacy' share the loaded model
+    >>> spacy_models.release()
+    """
+
+    def __init__(self):
+
+        self.__models = {}
+        self.__lock = threading.Lock()
+
+
+    def get(self, model='en_core_web_sm', disable=()):
+        """Shared Language object of model, loaded without the disable components
+
+        Parameters
+        ----------
+        model : string, spacy model name or path
+        disable : iterable of strings, pipeline components not loaded
+
+        Returns
+        -------
+        nlp : spacy.language.Language
+        """
+
+        key = (model, frozenset(disable))
+        nlp = self.__models.get(key)
+        if nlp is None:
+            with self.__lock:
+                nlp = self.__models.get(key)
+                if nlp is None:
+                    nlp = self.__models[key] = spacy.load(_model_path(model), disable=sorted(key[1]))
+        return nlp
+
+
+    def warm(self, model='en_core_web_sm', disable=()):
+        """Load model ahead of the first recast
+
+        Returns
+        -------
+        self : object
+        """
+
+        self.get(model, disable)
+        return self
+
+
+    def loaded(self):
+        """(model, disabled components) of the loaded models"""
+
+        return list(self.__models)
+
+
+    def release(self, model=None):
+        """Drop the loaded model(s) (all of them if model is None) to free their memory,
+        they are loaded again on next use"""
+
+        with self.__lock:
+            for key in list(self.__models):
+                if model is None or key[0] == model:
+                    del self.__models[key]
+        gc.collect()
+
+
+spacy_models = ModelRegistry()
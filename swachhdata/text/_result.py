@@ -0,0 +1,190 @@
+"""Result of a TextRecast call: the processed text and the values extracted from it
+
+Extracted values are held column-wise, as an Arrow list array is: one flat
+list of the values of every document and the offsets of each document's
+values in it, instead of a Python list per document.
+"""
+from array import array
+
+from ._base import LazyModule, _is_series
+
+pandas = LazyModule('pandas')
+pyarrow = LazyModule('pyarrow', extra='arrow')
+
+# TextRecast recasts and the attribute of the result holding their extracted values
+EXTRACTIONS = {'urlRecast': 'url', 'MentionRecast': 'mention', 'EmojiRecast': 'emoji',
+               'HashtagRecast': 'hashtag', 'NumberRecast': 'number', 'TokenisationRecast': 'token'}
+
+
+class Extraction:
+    """Values extracted from every document, stored column-wise
+
+    Parameters
+    ----------
+    values : list
+        values of every document, one document after the other
+    offsets : array.array ('q')
+        values of document i are values[offsets[i]:offsets[i + 1]]
+    index : pandas.Index, default=None
+        index of the documents (pandas.Series input)
+
+    Examples
+    --------
+    >>> extraction = Extraction.from_rows([['#a', '#b'], [], ['#c']])
+    >>> len(extraction), extraction[0], extraction.counts()
+    (3, ['#a', '#b'], [2, 0, 1])
+    >>> extraction.tolist()
+    [['#a', '#b'], [], ['#c']]
+    """
+
+    def __init__(self, values, offsets, index=None):
+
+        self.values = values
+        self.offsets = offsets
+        self.index = index
+
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Extraction of per document lists of values
+
+        Parameters
+        ----------
+        rows : list / pandas.Series of lists of values
+
+        Returns
+        -------
+        extraction : Extraction
+        """
+
+        index = None
+        if _is_series(rows):
+            index = rows.index
+            rows = rows.array
+
+        values = []
+        offsets = array('q', [0])
+        for row in rows:
+            values.extend(row)
+            offsets.append(len(values))
+        return cls(values, offsets, index)
+
+
+    def __len__(self):
+
+        return len(self.offsets) - 1
+
+
+    def __getitem__(self, i):
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('Extraction index out of range')
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+
+    def __iter__(self):
+
+        values, offsets = self.values, self.offsets
+        for i in range(len(self)):
+            yield values[offsets[i]:offsets[i + 1]]
+
+
+    def __repr__(self):
+
+        return f'Extraction(documents={len(self)}, values={len(self.values)})'
+
+
+    def counts(self):
+        """Number of values extracted from each document"""
+
+        return [stop - start for start, stop in zip(self.offsets, self.offsets[1:])]
+
+
+    def tolist(self):
+        """List of the values of each document"""
+
+        return list(self)
+
+
+    def to_series(self):
+        """pandas.Series of the values of each document (with the index of the input Series)"""
+
+        return pandas.Series(self.tolist(), index=self.index, dtype=object)
+
+
+    def to_arrow(self):
+        """pyarrow.LargeListArray of the values of each document, built from the
+        flat values and offsets without a per document copy"""
+
+        return pyarrow.LargeListArray.from_arrays(pyarrow.array(self.offsets, type=pyarrow.int64()),
+                                                  pyarrow.array(self.values))
+
+
+class TextRecastResult:
+    """Text processed by TextRecast and the values extracted by its recasts
+
+    Every TextRecast call returns its own result, nothing is shared with
+    other calls.
+
+    Attributes
+    ----------
+    text : string / list of strings / pandas.core.series.Series
+        Processed text
+    url, mention, emoji, hashtag, number, token : Extraction / list
+        values extracted by urlRecast, MentionRecast, EmojiRecast,
+        HashtagRecast, NumberRecast (process='extract*') and
+        TokenisationRecast, an Extraction for list / pandas.Series input,
+        the list of values for string input, None if not extracted
+    dedup_ratio : float
+        share of the documents that were duplicates (dedup=True),
+        None if the documents were not deduplicated
+    """
+
+    def __init__(self, text, extracted=None, dedup_ratio=None):
+
+        self.text = text
+        self.dedup_ratio = dedup_ratio
+        self.url = None
+        self.mention = None
+        self.emoji = None
+        self.hashtag = None
+        self.number = None
+        self.token = None
+        for name, values in (extracted or {}).items():
+            setattr(self, name, values)
+
+
+    @classmethod
+    def from_recast(cls, text, extracted, single=False, dedup_ratio=None):
+        """Result of the recast text and the per document values extracted from it
+
+        Parameters
+        ----------
+        text : string / list of strings / pandas.core.series.Series
+        extracted : dict, attribute -> per document lists of values
+        single : bool, default=False
+            text is a single document, values are kept as its list
+        dedup_ratio : float, default=None
+        """
+
+        if not single:
+            extracted = {name: Extraction.from_rows(rows) for name, rows in extracted.items()}
+        return cls(text, extracted, dedup_ratio)
+
+
+    def __repr__(self):
+
+        return f'TextRecastResult(documents={1 if isinstance(self.text, str) else len(self.text)}, extracted={list(self.extracted())})'
+
+
+    def extracted(self):
+        """Extracted values of the recasts that extracted them
+
+        Returns
+        -------
+        extracted : dict, attribute ('url', ...) -> Extraction / list
+        """
+
+        return {name: getattr(self, name) for name in EXTRACTIONS.values() if getattr(self, name) is not None}
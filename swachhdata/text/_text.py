@@ -1,26 +1,35 @@
 import re
-import pandas
-from tqdm.auto import trange, tqdm
-from bs4 import BeautifulSoup
-from html import unescape
-import contractions
-import emoji
-from emoji import UNICODE_EMOJI
-import nltk
-nltk.download('popular', quiet=True)
-import spacy
-from gensim.parsing.preprocessing import remove_stopwords
-import num2words
-import unicodedata
 import string
 import json
-import textblob
-import tweepy
-from tweepy import OAuthHandler
-from tweepy.streaming import StreamListener
-from tweepy import Stream
+from functools import partial
+
+from ._base import TextFormatter, LazyModule, _lazy_import, _is_series, _n_workers, _chunks, _batches, _parallel_map, trange, tqdm
+from ._pipeline import CompiledPipeline
+from ._profile import RecastProfile, StageProfile, measure, as_profile
+from ._emoji import emoji_matcher
+from ._contractions import contraction_engine
+from ._html import HTMLCleaner
+from ._charmap import (ESCAPE_TABLE, PUNCTUATION_TABLE, ALPHABET_PROCESSES, alphabet_ops, keep_alpha, squeeze_spaces,
+                       unicode_punctuation_table)
+from ._dedup import Deduplicated
+from ._result import TextRecastResult, Extraction
+from ..resources import require_recast, configure_nltk
+from . import _vectorized, _registry
+from ._registry import spacy_models
+
+pandas = LazyModule('pandas')
+nltk = LazyModule('nltk', setup=configure_nltk)
+num2words = LazyModule('num2words')
+tweepy = LazyModule('tweepy')
+pyarrow = LazyModule('pyarrow', extra='arrow')
+pyarrow_parquet = LazyModule('pyarrow.parquet', extra='arrow')
+
+
+# spacy model shared by the spacy backed recasts (see swachhdata.text._registry.spacy_models)
+SPACY_MODEL = 'en_core_web_sm'
+# components LemmatizationRecast does not run
+LEMMATIZER_DISABLE = ['parser', 'ner']
 
-from ._base import TextFormatter
 
 class urlRecast(TextFormatter):
     """Recast text data by removing or extracting URLs.
@@ -41,6 +50,9 @@ class urlRecast(TextFormatter):
     ----------
     process: string ('remove', 'extract', 'extract_remove'), default='remove'
     verbose: int (0, 1, -1), default=0
+    backend: string ('python', 'vectorized'), default='python' ('vectorized' needs pip install swachhdata[arrow])
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
 
     Attributes
     ----------
@@ -87,20 +99,39 @@ class urlRecast(TextFormatter):
     >>> url.setup_recast(text)
     'You can have a look at our catalogue at in the services tab'
     ['www.samplewebsite.com']
+    >>> 
+    >>> # streaming, any iterable of strings (e.g. a file too large for memory)
+    >>> from swachhdata.text import urlRecast
+    >>> url = urlRecast(process='extract_remove')
+    >>> for ntext, urls in url.recast_iter(open('tweets.txt')):
+    ...     pass
     >>>
     """
 
-    def __init__(self, process='remove', verbose=0):
+    # hosts a URL can start with, the IPv6 forms are only tried on texts
+    # containing a hex-colon run (every IPv6 form has a hex digit or ':' before a ':')
+    _DOMAIN = r'(?:www\.)?(?:[\da-z\.-]+)\.(?:[a-z]{2,6})'
+    _IPV4 = r'(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)'
+    _IPV6 = r'(?:(?:[0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,7}:|(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,5}(?::[0-9a-fA-F]{1,4}){1,2}|(?:[0-9a-fA-F]{1,4}:){1,4}(?::[0-9a-fA-F]{1,4}){1,3}|(?:[0-9a-fA-F]{1,4}:){1,3}(?::[0-9a-fA-F]{1,4}){1,4}|(?:[0-9a-fA-F]{1,4}:){1,2}(?::[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:(?:(?::[0-9a-fA-F]{1,4}){1,6})|:(?:(?::[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(?::[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(?:ffff(?::0{1,4}){0,1}:){0,1}(?:(?:25[0-5]|(?:2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(?:25[0-5]|(?:2[0-4]|1{0,1}[0-9]){0,1}[0-9])|(?:[0-9a-fA-F]{1,4}:){1,4}:(?:(?:25[0-5]|(?:2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(?:25[0-5]|(?:2[0-4]|1{0,1}[0-9]){0,1}[0-9]))'
+    _PORT = r'(?::[0-9]{1,4}|[1-5][0-9]{4}|6[0-4][0-9]{3}|65[0-4][0-9]{2}|655[0-2][0-9]|6553[0-5])?'
+
+    _REGEX = r'\b((?:https?://)?(?:' + _DOMAIN + '|' + _IPV4 + '|' + _IPV6 + ')' + _PORT + r'(?:/[\w\.-]*)*/?)\b'
+    _URL = re.compile(_REGEX)
+    _URL_NO_IPV6 = re.compile(r'\b((?:https?://)?(?:' + _DOMAIN + '|' + _IPV4 + ')' + _PORT + r'(?:/[\w\.-]*)*/?)\b')
+    _IPV6_HINT = re.compile(r'[0-9a-fA-F]:|::')
 
-        TextFormatter.__init__(self)
+    def __init__(self, process='remove', verbose=0, backend='python', n_jobs=1, chunksize=None):
+
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__process = process
         self.__verbose_status = True
         self.__verbose = verbose
         if self.__verbose == -1:
             self.__verbose_status = False
+        self.__backend = backend
         self.url_ = None
-        self.__regex = r'\b((?:https?://)?(?:(?:www\.)?(?:[\da-z\.-]+)\.(?:[a-z]{2,6})|(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)|(?:(?:[0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,7}:|(?:[0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|(?:[0-9a-fA-F]{1,4}:){1,5}(?::[0-9a-fA-F]{1,4}){1,2}|(?:[0-9a-fA-F]{1,4}:){1,4}(?::[0-9a-fA-F]{1,4}){1,3}|(?:[0-9a-fA-F]{1,4}:){1,3}(?::[0-9a-fA-F]{1,4}){1,4}|(?:[0-9a-fA-F]{1,4}:){1,2}(?::[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:(?:(?::[0-9a-fA-F]{1,4}){1,6})|:(?:(?::[0-9a-fA-F]{1,4}){1,7}|:)|fe80:(?::[0-9a-fA-F]{0,4}){0,4}%[0-9a-zA-Z]{1,}|::(?:ffff(?::0{1,4}){0,1}:){0,1}(?:(?:25[0-5]|(?:2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(?:25[0-5]|(?:2[0-4]|1{0,1}[0-9]){0,1}[0-9])|(?:[0-9a-fA-F]{1,4}:){1,4}:(?:(?:25[0-5]|(?:2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(?:25[0-5]|(?:2[0-4]|1{0,1}[0-9]){0,1}[0-9])))(?::[0-9]{1,4}|[1-5][0-9]{4}|6[0-4][0-9]{3}|65[0-4][0-9]{2}|655[0-2][0-9]|6553[0-5])?(?:/[\w\.-]*)*/?)\b'
+        self.__regex = self._REGEX
         self.get_regex_ = self.__regex
 
         try:
@@ -113,6 +144,14 @@ class urlRecast(TextFormatter):
         except:
             print(f'Expected verbose input type <class \'int\'>, input type received {type(self.__verbose)}')
 
+        try:
+            assert(self.__backend in ['python', 'vectorized'])
+        except:
+            print(f'Expected backend input \'python\' or \'vectorized\', input received {self.__backend}')
+
+        if self.__backend == 'vectorized':
+            _lazy_import(pyarrow)
+
 
     def setup(self, text):
         """Change the input text type to supported type
@@ -131,6 +170,20 @@ class urlRecast(TextFormatter):
         self.__setup = True
     
     
+    def __url_pattern(self, text):
+        """Compiled URL pattern to scan text with, None if text cannot contain a URL
+
+        Every URL has a '.' (domain, IPv4) or a ':' (IPv6), the IPv6 forms
+        are only tried when text has a hex-colon run.
+        """
+
+        if '.' not in text and ':' not in text:
+            return None
+        if self._IPV6_HINT.search(text) is None:
+            return self._URL_NO_IPV6
+        return self._URL
+
+
     def __base_recast(self, text):
         """Perform selected process on the setup text
 
@@ -144,26 +197,76 @@ class urlRecast(TextFormatter):
             Processed text, Extracted URL
         """
 
+        if '...' in text:
+            text = text.replace('...', '')
+        url = self.__url_pattern(text)
+
+        if self.__process == 'remove':
+            return text if url is None else url.sub('', text)
+
+        elif self.__process == 'extract':
+            urls = [] if url is None else url.findall(text)
+            self.url_ = urls
+            return urls
+
+        elif self.__process == 'extract_remove':
+            urls = []
+            if url is not None:
+                text = url.sub(lambda match: urls.append(match.group(1)) or '', text)
+            self.url_ = urls
+            return text, urls
+
+
+    def __column_recast(self, texts):
+        """Perform selected process on all setup documents at once (backend='vectorized')
+
+        Returns
+        -------
+        ntext : pyarrow string array (process='remove')
+            Processed text
+        url : list of lists of strings (process='extract')
+            Extracted URLs
+        ntext, url : pyarrow string array, list of lists of strings (process='extract_remove')
+            Processed text, Extracted URLs
+        """
+
+        texts = _vectorized.sub(texts, r'\.{3}', '')
+
         if self.__process == 'remove':
-            ntext = ' '.join(re.sub('([@][A-Za-z0-9._:-]+)', ' ', text).split())
-            text = re.sub(r'\.{3}', '', text)
-            ntext = re.sub(self.__regex, '', text)
-            return ntext
+            return _vectorized.sub(texts, self.__regex, '', ascii_only=True)
 
         elif self.__process == 'extract':
-            text = re.sub(r'\.{3}', '', text)
-            url = re.findall(self.__regex, text)
-            self.url_ = url
-            return url
+            return _vectorized.findall(texts, self.__regex, ascii_only=True)
 
         elif self.__process == 'extract_remove':
-            text = re.sub(r'\.{3}', '', text)
-            url = re.findall(self.__regex, text)
-            ntext = re.sub(self.__regex, '', text)
-            self.url_ = url
+            url = _vectorized.findall(texts, self.__regex, ascii_only=True)
+            ntext = _vectorized.sub(texts, self.__regex, '', ascii_only=True)
             return ntext, url
 
 
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines"""
+
+        if self.__process == 'remove':
+            return [('call', self.__base_recast)]
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
+    def _side_output(self):
+
+        return 'url_' if self.__process == 'extract_remove' else None
+
+
+    def _recast_strings(self):
+
+        return self.__process != 'extract'
+
+
     def recast(self):
         """Perform selected process on the setup text
 
@@ -186,46 +289,21 @@ class urlRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                if self.__process == 'remove' or self.__process == 'extract':
-                    ntext = []
-                    for text in self._text:
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process == 'extract_remove':
-                    ntext, urls = [], []
-                    for text in self._text:
-                        text, url = self.__base_recast(text)
-                        ntext.append(text)
-                        urls.append(url)
-                    self.url_ = urls
-                    return ntext, urls
-                    
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                if self.__process == 'remove' or self.__process == 'extract':
-                    ntext = []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'urlRecast process': self.__process})
-                        text = self._text[i]
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process == 'extract_remove':
-                    ntext, urls = [], []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'urlRecast process': self.__process})
-                        text = self._text[i]
-                        text, url = self.__base_recast(text)
-                        ntext.append(text)
-                        urls.append(url)
-                    self.url_ = urls
-                    return ntext, urls
+            postfix = {'urlRecast process': self.__process}
+            column_recast = self.__column_recast if self.__backend == 'vectorized' else None
+
+            if self.__process == 'remove' or self.__process == 'extract':
+                ntext = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                         postfix, strings=self.__process != 'extract', column_recast=column_recast)
+                if self.__process == 'extract':
+                    self.url_ = ntext
+                return ntext
+
+            elif self.__process == 'extract_remove':
+                ntext, urls = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                                postfix, extract=True, column_recast=column_recast)
+                self.url_ = urls
+                return ntext, urls
 
 
     def setup_recast(self, text):
@@ -257,11 +335,20 @@ class urlRecast(TextFormatter):
 class htmlRecast(TextFormatter):
     """Recast text data by removing HTML tags.
 
-    uses lxml from BeautifulSoup to clean up html tags
+    documents without markup skip the parser: no '<' and no '&' are returned
+    as is, entity only documents are unescaped, the text of the others is
+    streamed out of html.parser (no document tree is built)
     
     Parameters
     ----------
     verbose: int (0, 1, -1), default=0
+    drop_scripts: bool, default=True
+        drop the text of <script>, <style> and <template> elements
+    block_separator: string, default=None
+        separator of block level elements (e.g. ' ' or '\\n', replaces the whitespace
+        around them), None joins their text as is
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
     
     Examples
@@ -275,22 +362,40 @@ class htmlRecast(TextFormatter):
     >>> # OR
     >>> rec.setup_recast(text)
     'Click Here to have a look at the menu in the services tab'
+    >>> # block_separator
+    >>> rec = htmlRecast(block_separator=' ')
+    >>> rec.setup_recast('<p>First review</p><p>Second review</p>')
+    'First review Second review'
     """
 
-    def __init__(self, verbose=0):
+    def __init__(self, verbose=0, drop_scripts=True, block_separator=None, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
+        self.__drop_scripts = drop_scripts
+        self.__block_separator = block_separator
         self.__verbose_status = True
         self.__verbose = verbose
         if self.__verbose == -1:
             self.__verbose_status = False
 
+        try:
+            assert(isinstance(self.__drop_scripts, bool))
+        except:
+            print(f'Expected drop_scripts input type <class \'bool\'>, input type received {type(self.__drop_scripts)}')
+
+        try:
+            assert(self.__block_separator is None or isinstance(self.__block_separator, str))
+        except:
+            print(f'Expected block_separator input type <class \'str\'>, input type received {type(self.__block_separator)}')
+
         try:
             assert(isinstance(self.__verbose, int))
         except:
             print(f'Expected verbose input type <class \'int\'>, input type received {type(self.__verbose)}')
 
+        self.__cleaner = HTMLCleaner(self.__drop_scripts, self.__block_separator)
+
 
     def setup(self, text):
         """Change the input text type to supported type
@@ -318,11 +423,16 @@ class htmlRecast(TextFormatter):
             Processed text
         """
 
-        soup = BeautifulSoup(unescape(text), 'lxml')
-        ntext = soup.get_text()
+        ntext = self.__cleaner.clean(text)
         return ntext
 
 
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
     def recast(self):
         """Perform selected process on the setup text
 
@@ -343,22 +453,8 @@ class htmlRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    ntext.append(self.__base_recast(text))
-                return ntext
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({'htmlRecast process': 'removing'})
-                    text = self._text[i]
-                    ntext.append(self.__base_recast(text))
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {'htmlRecast process': 'removing'})
 
 
     def setup_recast(self, text):
@@ -389,6 +485,8 @@ class EscapeSequenceRecast(TextFormatter):
     Parameters
     ----------
     verbose: int (0, 1, -1), default=0
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
 
     Examples
@@ -405,9 +503,9 @@ class EscapeSequenceRecast(TextFormatter):
     """
 
 
-    def __init__(self, verbose=0):
+    def __init__(self, verbose=0, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__verbose_status = True
         self.__verbose = verbose
@@ -446,10 +544,22 @@ class EscapeSequenceRecast(TextFormatter):
             Processed text
         """
 
-        ntext = text.replace('\r', ' ').replace('\n', ' ').replace('\t', ' ').replace('\n', ' ').replace('\f', ' ')
+        ntext = text.translate(ESCAPE_TABLE)
         return ntext
 
 
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines"""
+
+        return [('translate', ESCAPE_TABLE)]
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
     def recast(self):
         """Perform selected process on the setup text
 
@@ -470,22 +580,8 @@ class EscapeSequenceRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    ntext.append(self.__base_recast(text))
-                return ntext
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({'EscapeSequenceRecast process': 'removing'})
-                    text = self._text[i]
-                    ntext.append(self.__base_recast(text))
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {'EscapeSequenceRecast process': 'removing'})
 
 
     def setup_recast(self, text):
@@ -526,6 +622,9 @@ class MentionRecast(TextFormatter):
     ----------
     process: string ('remove', 'extract', 'extract_remove'), default='remove'
     verbose: int (0, 1, -1), default=0
+    backend: string ('python', 'vectorized'), default='python' ('vectorized' needs pip install swachhdata[arrow])
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
 
     Attributes
     ----------
@@ -574,15 +673,16 @@ class MentionRecast(TextFormatter):
     ['@jondoe']
     """
 
-    def __init__(self, process='remove', verbose=0):
+    def __init__(self, process='remove', verbose=0, backend='python', n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__process = process
         self.__verbose_status = True
         self.__verbose = verbose
         if self.__verbose == -1:
             self.__verbose_status = False
+        self.__backend = backend
         self.mention_ = None
         self.__regex = '([@][A-Za-z0-9._:-]+)'
         self.get_regex_ = self.__regex
@@ -597,6 +697,14 @@ class MentionRecast(TextFormatter):
         except:
             print(f'Expected verbose input type <class \'int\'>, input type received {type(self.__verbose)}')
 
+        try:
+            assert(self.__backend in ['python', 'vectorized'])
+        except:
+            print(f'Expected backend input \'python\' or \'vectorized\', input received {self.__backend}')
+
+        if self.__backend == 'vectorized':
+            _lazy_import(pyarrow)
+
 
     def setup(self, text):
         """Change the input text type to supported type
@@ -643,6 +751,54 @@ class MentionRecast(TextFormatter):
             return ntext, mention
 
 
+    def __column_recast(self, texts):
+        """Perform selected process on all setup documents at once (backend='vectorized')
+
+        Returns
+        -------
+        ntext : pyarrow string array (process='remove')
+            Processed text
+        mention : list of lists of strings (process='extract')
+            Extracted Mention(s)
+        ntext, mention : pyarrow string array, list of lists of strings (process='extract_remove')
+            Processed text, Extracted Mention(s)
+        """
+
+        if self.__process == 'remove':
+            return _vectorized.collapse_whitespace(_vectorized.sub(texts, self.__regex, ' '))
+
+        elif self.__process == 'extract':
+            return _vectorized.findall(texts, self.__regex)
+
+        elif self.__process == 'extract_remove':
+            mention = _vectorized.findall(texts, self.__regex)
+            ntext = _vectorized.collapse_whitespace(_vectorized.sub(texts, self.__regex, ' '))
+            return ntext, mention
+
+
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines"""
+
+        if self.__process == 'remove':
+            return [('sub', self.__regex, ' '), ('collapse',)]
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
+    def _side_output(self):
+
+        return 'mention_' if self.__process == 'extract_remove' else None
+
+
+    def _recast_strings(self):
+
+        return self.__process != 'extract'
+
+
     def recast(self):
         """Perform selected process on the setup text
 
@@ -666,46 +822,21 @@ class MentionRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                if self.__process == 'remove' or self.__process == 'extract':
-                    ntext = []
-                    for text in self._text:
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process == 'extract_remove':
-                    ntext, mentions = [], []
-                    for text in self._text:
-                        text, mention = self.__base_recast(text)
-                        ntext.append(text)
-                        mentions.append(mention)
-                    self.mention_ = mentions
-                    return ntext, mentions
-                    
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                if self.__process == 'remove' or self.__process == 'extract':
-                    ntext = []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'MentionRecast process': self.__process})
-                        text = self._text[i]
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process == 'extract_remove':
-                    ntext, mentions = [], []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'MentionRecast process': self.__process})
-                        text = self._text[i]
-                        text, mention = self.__base_recast(text)
-                        ntext.append(text)
-                        mentions.append(mention)
-                    self.mention_ = mentions
-                    return ntext, mentions
+            postfix = {'MentionRecast process': self.__process}
+            column_recast = self.__column_recast if self.__backend == 'vectorized' else None
+
+            if self.__process == 'remove' or self.__process == 'extract':
+                ntext = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                         postfix, strings=self.__process != 'extract', column_recast=column_recast)
+                if self.__process == 'extract':
+                    self.mention_ = ntext
+                return ntext
+
+            elif self.__process == 'extract_remove':
+                ntext, mentions = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                                postfix, extract=True, column_recast=column_recast)
+                self.mention_ = mentions
+                return ntext, mentions
 
 
     def setup_recast(self, text):
@@ -740,6 +871,11 @@ class ContractionsRecast(TextFormatter):
     Parameters
     ----------
     verbose: int (0, 1, -1), default=0
+    mappings: dict, default=None
+        additional contraction -> expansion mappings (e.g. domain slang),
+        taking precedence over those of the contractions package
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
 
     Examples
@@ -754,23 +890,35 @@ class ContractionsRecast(TextFormatter):
     >>> # OR
     >>> rec.setup_recast(text)
     'They are going to wildlife sanctuary, I guess Jon is going to be there too.'
+    >>> # mappings
+    >>> rec = ContractionsRecast(mappings={'brb': 'be right back'})
+    >>> rec.setup_recast('BRB, can't talk')
+    'BE RIGHT BACK, cannot talk'
     """
 
 
-    def __init__(self, verbose=0):
+    def __init__(self, verbose=0, mappings=None, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
+        self.__mappings = mappings
         self.__verbose_status = True
         self.__verbose = verbose
         if self.__verbose == -1:
             self.__verbose_status = False
 
+        try:
+            assert(self.__mappings is None or isinstance(self.__mappings, dict))
+        except:
+            print(f'Expected mappings input type <class \'dict\'>, input type received {type(self.__mappings)}')
+
         try:
             assert(isinstance(self.__verbose, int))
         except:
             print(f'Expected verbose input type <class \'int\'>, input type received {type(self.__verbose)}')
 
+        self.__engine = contraction_engine(self.__mappings)
+
 
     def setup(self, text):
         """Change the input text type to supported type
@@ -798,10 +946,16 @@ class ContractionsRecast(TextFormatter):
             Processed text
         """
 
-        ntext = contractions.fix(text)
+        ntext = self.__engine.fix(text)
         return ntext
 
 
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
     def recast(self):
         """Perform selected process on the setup text
 
@@ -822,22 +976,8 @@ class ContractionsRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    ntext.append(self.__base_recast(text))
-                return ntext
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({'ContractionsRecast process': 'mapping Contractions'})
-                    text = self._text[i]
-                    ntext.append(self.__base_recast(text))
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {'ContractionsRecast process': 'mapping Contractions'})
 
 
     def setup_recast(self, text):
@@ -874,6 +1014,8 @@ class CaseRecast(TextFormatter):
     ----------
     process: str ('lower', 'upper', 'fupper'), default='lower'
     verbose: int (0, 1, -1), default=0
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
 
 
     Examples
@@ -912,9 +1054,9 @@ class CaseRecast(TextFormatter):
     'You Can Have A Look At Our Catalogue In The Services Tab'
     """
 
-    def __init__(self, process='lower', verbose=0):
+    def __init__(self, process='lower', verbose=0, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__process = process
         self.__verbose_status = True
@@ -973,6 +1115,25 @@ class CaseRecast(TextFormatter):
             return text.title()
 
 
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines"""
+
+        if self.__process == 'lower':
+            return [('map', str.lower)]
+
+        elif self.__process == 'upper':
+            return [('map', str.upper)]
+
+        elif self.__process == 'fupper':
+            return [('call', str.title)]
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
     def recast(self):
         """Perform selected process on the setup text
 
@@ -992,22 +1153,8 @@ class CaseRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    ntext.append(self.__base_recast(text))
-                return ntext
-                    
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({'CaseRecast process': self.__process})
-                    text = self._text[i]
-                    ntext.append(self.__base_recast(text))
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {'CaseRecast process': self.__process})
 
 
     def setup_recast(self, text):
@@ -1040,11 +1187,21 @@ class EmojiRecast(TextFormatter):
     process: string ('remove', 'replace', 'extract', 'extract_remove', 'extract_replace'), default='remove'
     space_out = bool (True, False), default=False
     verbose: int (0, 1, -1), default=0
+    keep_words: bool (True, False), default=False
+        remove only the emoji, not the words containing them (process='remove' / 'extract_remove')
+    return_spans: bool (True, False), default=False
+        extract (emoji, start, end) tuples, offsets into the input document
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
 
     Attributes
     ----------
     emoji_ : list of emoji(s)
         extracted emoji(s)
+
+    Multi-codepoint emoji (ZWJ sequences, skin tones, flags, keycaps) are
+    matched as a single emoji, longest match first, by a matcher shared by
+    every EmojiRecast of the process (see swachhdata.text._emoji).
     
 
     Examples
@@ -1107,18 +1264,20 @@ class EmojiRecast(TextFormatter):
     ['😊']
     """
 
-    def __init__(self, process='remove', space_out=False, verbose=0):
+    def __init__(self, process='remove', space_out=False, verbose=0, keep_words=False, return_spans=False, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__process = process
         self.__space_out = space_out
+        self.__keep_words = keep_words
+        self.__return_spans = return_spans
         self.__verbose_status = True
         self.__verbose = verbose
         if self.__verbose == -1:
             self.__verbose_status = False
         self.emoji_ = None
-        self.__emojis_list = list(UNICODE_EMOJI['en'].keys()) + list(UNICODE_EMOJI['es'].keys()) + list(UNICODE_EMOJI['pt'].keys()) + list(UNICODE_EMOJI['it'].keys())
+        self.__emojis = emoji_matcher()
 
         try:
             assert(isinstance(self.__process, str))
@@ -1164,44 +1323,70 @@ class EmojiRecast(TextFormatter):
         ntext, emoji : string, list of strings (process='extract_remove' / process='extract_replace')
             Processed text, Extracted Emojis
         """
-        if self.__space_out:
-            spaced = ''
-            for char in text:
-                if char in self.__emojis_list:
-                    spaced += ' '
-                spaced += char
-            text = spaced
-            text = re.sub(' +', ' ', text)
-        
-        if self.__process == 'remove':
-            allchars = [str for str in text]
-            emoji_list = [c for c in allchars if c in self.__emojis_list]
-            text = ' '.join([str for str in text.split() if not any(j in str for j in emoji_list)])
-            return text
+        spans = self.__emojis.spans(text)
 
-        elif self.__process == 'replace':
-            text = emoji.demojize(text, delimiters=('', ''))
+        if self.__process in ['extract', 'extract_remove', 'extract_replace']:
+            if self.__return_spans:
+                emoji_list = [(text[start:end], start, end) for start, end in spans]
+            else:
+                emoji_list = [text[start:end] for start, end in spans]
+            self.emoji_ = emoji_list
+            if self.__process == 'extract':
+                return emoji_list
+
+        if self.__process in ['remove', 'extract_remove']:
+            text = self.__remove(text, spans)
+        else:
+            text = self.__emojis.demojize(text, spans, space_out=self.__space_out)
+            if self.__space_out:
+                text = re.sub(' +', ' ', text)
+
+        if self.__process in ['remove', 'replace']:
             return text
+        return text, emoji_list
 
-        elif self.__process == 'extract':
-            allchars = [str for str in text]
-            emoji_list = [c for c in allchars if c in self.__emojis_list]
-            self.emoji_ = emoji_list
-            return emoji_list
-        
-        elif self.__process == 'extract_remove':
-            allchars = [str for str in text]
-            emoji_list = [c for c in allchars if c in self.__emojis_list]
-            text = ' '.join([str for str in text.split() if not any(j in str for j in emoji_list)])
-            self.emoji_ = emoji_list
-            return text, emoji_list
-        
-        elif self.__process == 'extract_replace':
-            allchars = [str for str in text]
-            emoji_list = [c for c in allchars if c in self.__emojis_list]
-            text = emoji.demojize(text, delimiters=('', ''))
-            self.emoji_ = emoji_list
-            return text, emoji_list
+
+    def __remove(self, text, spans):
+        """Drop the words containing an emoji (only the emoji with keep_words,
+        with space_out a word keeps the characters before its first emoji)
+
+        Words are whitespace separated, spans never cross whitespace.
+        """
+
+        if not spans:
+            return ' '.join(text.split())
+
+        if self.__keep_words:
+            return ' '.join(self.__emojis.sub(' ' if self.__space_out else '', text, spans).split())
+
+        words = []
+        i, count = 0, len(spans)
+        for word in re.finditer(r'\S+', text):
+            start, end = word.span()
+            while i < count and spans[i][1] <= start:
+                i += 1
+            if i < count and spans[i][0] < end:
+                if self.__space_out and spans[i][0] > start:
+                    words.append(text[start:spans[i][0]])
+            else:
+                words.append(word.group())
+        return ' '.join(words)
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
+    def _side_output(self):
+
+        return 'emoji_' if self.__process in ['extract_remove', 'extract_replace'] else None
+
+
+    def _recast_strings(self):
+
+        return self.__process != 'extract'
 
 
     def recast(self):
@@ -1228,46 +1413,20 @@ class EmojiRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                if self.__process in ['remove', 'replace', 'extract']:
-                    ntext = []
-                    for text in self._text:
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process in ['extract_remove', 'extract_replace']:
-                    ntext, emoji_list = [], []
-                    for text in self._text:
-                        text, emoji = self.__base_recast(text)
-                        ntext.append(text)
-                        emoji_list.append(emoji)
-                    self.url_ = emoji_list
-                    return ntext, emoji_list
-                    
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                if self.__process in ['remove', 'replace', 'extract']:
-                    ntext = []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'EmojiRecast process': self.__process})
-                        text = self._text[i]
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process in ['extract_remove', 'extract_replace']:
-                    ntext, emoji_list = [], []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'EmojiRecast process': self.__process})
-                        text = self._text[i]
-                        text, emoji = self.__base_recast(text)
-                        ntext.append(text)
-                        emoji_list.append(emoji)
-                    self.url_ = emoji_list
-                    return ntext, emoji_list
+            postfix = {'EmojiRecast process': self.__process}
+
+            if self.__process in ['remove', 'replace', 'extract']:
+                ntext = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                         postfix, strings=self.__process != 'extract')
+                if self.__process == 'extract':
+                    self.emoji_ = ntext
+                return ntext
+
+            elif self.__process in ['extract_remove', 'extract_replace']:
+                ntext, emoji_list = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                                postfix, extract=True)
+                self.emoji_ = emoji_list
+                return ntext, emoji_list
 
 
     def setup_recast(self, text):
@@ -1309,6 +1468,9 @@ class HashtagRecast(TextFormatter):
     ----------
     process: string ('remove', 'extract', 'extract_remove'), default='remove'
     verbose: int (0, 1, -1), default=0
+    backend: string ('python', 'vectorized'), default='python' ('vectorized' needs pip install swachhdata[arrow])
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
 
     Attributes
     ----------
@@ -1357,15 +1519,16 @@ class HashtagRecast(TextFormatter):
     ['#samplephoto']
     """
 
-    def __init__(self, process='remove', verbose=0):
+    def __init__(self, process='remove', verbose=0, backend='python', n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__process = process
         self.__verbose_status = True
         self.__verbose = verbose
         if self.__verbose == -1:
             self.__verbose_status = False
+        self.__backend = backend
         self.hashtag_ = None
         self.__regex = '([#][A-Za-z0-9_]+)'
         self.get_regex_ = self.__regex
@@ -1380,6 +1543,14 @@ class HashtagRecast(TextFormatter):
         except:
             print(f'Expected verbose input type <class \'int\'>, input type received {type(self.__verbose)}')
 
+        try:
+            assert(self.__backend in ['python', 'vectorized'])
+        except:
+            print(f'Expected backend input \'python\' or \'vectorized\', input received {self.__backend}')
+
+        if self.__backend == 'vectorized':
+            _lazy_import(pyarrow)
+
 
     def setup(self, text):
         """Change the input text type to supported type
@@ -1427,6 +1598,54 @@ class HashtagRecast(TextFormatter):
             return text, hashtag
 
 
+    def __column_recast(self, texts):
+        """Perform selected process on all setup documents at once (backend='vectorized')
+
+        Returns
+        -------
+        ntext : pyarrow string array (process='remove')
+            Processed text
+        hashtag : list of lists of strings (process='extract')
+            Extracted Hashtag(s)
+        ntext, hashtag : pyarrow string array, list of lists of strings (process='extract_remove')
+            Processed text, Extracted Hashtag(s)
+        """
+
+        if self.__process == 'remove':
+            return _vectorized.collapse_whitespace(_vectorized.sub(texts, self.__regex, ' '))
+
+        elif self.__process == 'extract':
+            return _vectorized.findall(texts, self.__regex)
+
+        elif self.__process == 'extract_remove':
+            hashtag = _vectorized.findall(texts, self.__regex)
+            ntext = _vectorized.collapse_whitespace(_vectorized.sub(texts, self.__regex, ' '))
+            return ntext, hashtag
+
+
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines"""
+
+        if self.__process == 'remove':
+            return [('sub', '([#][A-Za-z0-9_]+)', ' '), ('collapse',)]
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
+    def _side_output(self):
+
+        return 'hashtag_' if self.__process == 'extract_remove' else None
+
+
+    def _recast_strings(self):
+
+        return self.__process != 'extract'
+
+
     def recast(self):
         """Perform selected process on the setup text
 
@@ -1450,46 +1669,21 @@ class HashtagRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                if self.__process == 'remove' or self.__process == 'extract':
-                    ntext = []
-                    for text in self._text:
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process == 'extract_remove':
-                    ntext, hashtags = [], []
-                    for text in self._text:
-                        text, hashtag = self.__base_recast(text)
-                        ntext.append(text)
-                        hashtags.append(hashtag)
-                        self.hashtags_ = hashtags
-                    return ntext, hashtags
-                    
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                if self.__process == 'remove' or self.__process == 'extract':
-                    ntext = []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'HashtagRecast process': self.__process})
-                        text = self._text[i]
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process == 'extract_remove':
-                    ntext, hashtags = [], []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'HashtagRecast process': self.__process})
-                        text = self._text[i]
-                        text, hashtag = self.__base_recast(text)
-                        ntext.append(text)
-                        hashtags.append(hashtag)
-                        self.hashtags_ = hashtags
-                    return ntext, hashtags
+            postfix = {'HashtagRecast process': self.__process}
+            column_recast = self.__column_recast if self.__backend == 'vectorized' else None
+
+            if self.__process == 'remove' or self.__process == 'extract':
+                ntext = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                         postfix, strings=self.__process != 'extract', column_recast=column_recast)
+                if self.__process == 'extract':
+                    self.hashtag_ = ntext
+                return ntext
+
+            elif self.__process == 'extract_remove':
+                ntext, hashtags = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                                postfix, extract=True, column_recast=column_recast)
+                self.hashtag_ = hashtags
+                return ntext, hashtags
 
 
     def setup_recast(self, text):
@@ -1525,6 +1719,8 @@ class ShortWordsRecast(TextFormatter):
     ----------
     min_length int (>0), default=3
     verbose: int (0, 1, -1), default=0
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
 
     Examples
@@ -1541,9 +1737,9 @@ class ShortWordsRecast(TextFormatter):
     'have look catalogue services'
     """
 
-    def __init__(self, min_length=3, verbose=0):
+    def __init__(self, min_length=3, verbose=0, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__min_length = min_length
         self.__verbose_status = True
@@ -1596,6 +1792,12 @@ class ShortWordsRecast(TextFormatter):
         return ntext
 
 
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
     def recast(self):
         """Perform selected process on the setup text
 
@@ -1616,22 +1818,8 @@ class ShortWordsRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    ntext.append(self.__base_recast(text))
-                return ntext
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({'ShortWordsRecast [removing] min_length': self.__min_length})
-                    text = self._text[i]
-                    ntext.append(self.__base_recast(text))
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {'ShortWordsRecast [removing] min_length': self.__min_length})
 
 
     def setup_recast(self, text):
@@ -1664,6 +1852,10 @@ class StopWordsRecast(TextFormatter):
     package: str ('nltk', 'spacy', 'gensim', 'custom'), default='nltk'
     stopwords: list (package='custom'), list of stopwords 
     verbose: int (0, 1, -1), default=0
+    language: str, default='english'
+        nltk name ('english') or language code ('en') of the stop words
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
 
 
     Examples
@@ -1677,13 +1869,18 @@ class StopWordsRecast(TextFormatter):
     >>> # OR
     >>> rec.setup_recast(text)
     'You look catalogue services tab'
+
+    Stop words are loaded once per process and (package, language), and
+    shared by every StopWordsRecast (see swachhdata.text._registry);
+    package='spacy' reads the language's stop list without loading a model.
     """
 
-    def __init__(self, package='nltk', stopwords=None, verbose=0):
+    def __init__(self, package='nltk', stopwords=None, verbose=0, language='english', n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__package = package
+        self.__language = language
         self.__stopWords = None
         self.__verbose_status = True
         self.__verbose = verbose
@@ -1691,12 +1888,16 @@ class StopWordsRecast(TextFormatter):
         if self.__verbose == -1:
             self.__verbose_status = False
 
+        require_recast('StopWordsRecast', self.__package)
+
         if self.__package == 'custom':
-            self.__stopWords = stopwords
             try:
-                assert(isinstance(self.__stopWords, list))
+                assert(isinstance(stopwords, list))
             except:
-                print(f'Expected stopWords input type <class \'list\'>, input type received {type(self.__stopWords)}')
+                print(f'Expected stopWords input type <class \'list\'>, input type received {type(stopwords)}')
+            self.__stopWords = frozenset(stopwords or ())
+        else:
+            self.__setup_package()
 
         try:
             assert(isinstance(self.__package, str))
@@ -1727,13 +1928,8 @@ class StopWordsRecast(TextFormatter):
     
     def __setup_package(self):
 
-        if self.__package == 'nltk':
-            from nltk.corpus import stopwords
-            self.__stopWords = set(stopwords.words('english'))
-
-        elif self.__package == 'spacy':
-            sp = spacy.load('en_core_web_sm')
-            self.__stopWords = sp.Defaults.stop_words
+        if self.__package != 'custom':
+            self.__stopWords = _registry.stopwords(self.__package, self.__language)
 
 
     def __base_recast(self, text):
@@ -1745,33 +1941,19 @@ class StopWordsRecast(TextFormatter):
             Processed text
         """
 
-        if self.__package == 'nltk':
-            ntext = []
-            for word in text.split():
-                if word not in self.__stopWords:
-                    ntext.append(word)
-            ntext = ' '.join(ntext)
-            return ntext
+        ntext = []
+        for word in text.split():
+            if word not in self.__stopWords:
+                ntext.append(word)
+        ntext = ' '.join(ntext)
+        return ntext
 
-        elif self.__package == 'spacy':
-            ntext = []
-            for word in text.split():
-                if word not in self.__stopWords:
-                    ntext.append(word)
-            ntext = ' '.join(ntext)
-            return ntext
-
-        elif self.__package == 'gensim':
-            text = remove_stopwords(text)
-            return text
-        
-        elif self.__package == 'custom':
-            ntext = []
-            for word in text.split():
-                if word not in self.__stopWords:
-                    ntext.append(word)
-            ntext = ' '.join(ntext)
-            return ntext
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        self.__setup_package()
+        return self.__base_recast
 
 
     def recast(self):
@@ -1795,24 +1977,8 @@ class StopWordsRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    text = self.__base_recast(text)
-                    ntext.append(text)
-                return ntext
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({f'StopWordsRecast [removing] package': self.__package})
-                    text = self._text[i]
-                    text = self.__base_recast(text)
-                    ntext.append(text)
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {f'StopWordsRecast [removing] package': self.__package})
 
 
     def setup_recast(self, text):
@@ -1851,6 +2017,11 @@ class NumberRecast(TextFormatter):
     process: string ('remove', 'replace', 'extract', 'extract_remove', 'extract_replace'), default='remove'
     seperator = str (',', '.'), default=None
     verbose: int (0, 1, -1), default=0
+    backend: string ('python', 'vectorized'), default='python' ('vectorized' needs pip install swachhdata[arrow])
+    lang: str, default='en'
+        num2words language of the words numbers are replaced with
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
 
     Attributes
     ----------
@@ -1918,17 +2089,25 @@ class NumberRecast(TextFormatter):
     ['1', '123456']
     """
 
-    def __init__(self, process='remove', seperator=None, verbose=0):
+    def __init__(self, process='remove', seperator=None, verbose=0, backend='python', lang='en', n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__process = process
         self.__seperator = seperator
+        self.__lang = lang
         self.__verbose_status = True
         self.__verbose = verbose
         if self.__verbose == -1:
             self.__verbose_status = False
+        self.__backend = backend
         self.number_ = None
+        if self.__process in ['replace', 'extract_replace']:
+            _lazy_import(num2words)
+            try:
+                assert(self.__lang in num2words.CONVERTER_CLASSES)
+            except:
+                print(f'Expected lang input one of num2words languages, input received {self.__lang}')
 
         try:
             assert(isinstance(self.__process, str))
@@ -1940,6 +2119,14 @@ class NumberRecast(TextFormatter):
         except:
             print(f'Expected verbose input type <class \'int\'>, input type received {type(self.__verbose)}')
 
+        try:
+            assert(self.__backend in ['python', 'vectorized'])
+        except:
+            print(f'Expected backend input \'python\' or \'vectorized\', input received {self.__backend}')
+
+        if self.__backend == 'vectorized':
+            _lazy_import(pyarrow)
+
 
     def setup(self, text):
         """Change the input text type to supported type
@@ -1958,6 +2145,30 @@ class NumberRecast(TextFormatter):
         self.__setup = True
     
     
+    def __number_words(self, match):
+        """Words of a matched number, memoized per language"""
+
+        return _registry.number_words(self.__lang)(int(match.group(0)))
+
+
+    def __extract_replace(self, text):
+        """Extract and replace numbers in a single scan"""
+
+        numbers = []
+        words = _registry.number_words(self.__lang)
+
+        def replace(match):
+            number = match.group(0)
+            if number.isascii():
+                numbers.append(number)
+            else:
+                # \d also matches non ASCII digits, extraction keeps ASCII ones
+                numbers.extend(re.findall(r'[0-9]+', number))
+            return words(int(number))
+
+        return re.sub(r'(\d+)', replace, text, 0), numbers
+
+
     def __base_recast(self, text):
         """Perform selected process on the setup text
 
@@ -1980,7 +2191,7 @@ class NumberRecast(TextFormatter):
             return re.sub(r'[0-9]+', '', text, 0)
 
         elif self.__process == 'replace':
-            return re.sub(r'(\d+)', lambda x: num2words.num2words(int(x.group(0))), text, 0)
+            return re.sub(r'(\d+)', self.__number_words, text, 0)
 
         elif self.__process == 'extract':
             return re.findall(r'[0-9]+', text, 0)
@@ -1991,74 +2202,122 @@ class NumberRecast(TextFormatter):
             return text, self.number_
         
         elif self.__process == 'extract_replace':
-            self.number_ = re.findall(r'[0-9]+', text, 0)
-            text = re.sub(r'(\d+)', lambda x: num2words.num2words(int(x.group(0))), text, 0)
+            text, self.number_ = self.__extract_replace(text)
             return text, self.number_
 
 
-    def recast(self):
-        """Perform selected process on the setup text
+    def __column_recast(self, texts):
+        """Perform selected process on all setup documents at once (backend='vectorized')
+
+        replace / extract_replace call num2words per number, so their substitution
+        runs per document.
 
         Returns
         -------
-        ntext : string (process='remove' / process='replace')
+        ntext : pyarrow string array (process='remove' / process='replace')
             Processed text
-        number : list of strings (process='extract')
+        number : list of lists of strings (process='extract')
             Extracted Number(s)
-        ntext, number : string, list of strings (process='extract_remove' / process='extract_replace')
+        ntext, number : pyarrow string array, list of lists of strings (process='extract_remove' / process='extract_replace')
             Processed text, Extracted Number(s)
         """
-        
-        try:
-            assert(self.__setup)
-        except:
-            print(f'method setup needs to be called before recast')
-        
+
+        # (?<!\B)[,](?!\B) is \b[,]\b, which RE2 supports
+        if self.__seperator == ',':
+            texts = _vectorized.sub(texts, r'\b[,]\b', '', ascii_only=True)
+
+        if self.__seperator == '.':
+            texts = _vectorized.sub(texts, r'\b[.]\b', '', ascii_only=True)
+
+        if self.__process == 'remove':
+            return _vectorized.sub(texts, r'[0-9]+', '')
+
+        elif self.__process == 'replace':
+            return _vectorized.sub(texts, r'(\d+)', self.__number_words)
+
+        elif self.__process == 'extract':
+            return _vectorized.findall(texts, r'[0-9]+')
+
+        elif self.__process == 'extract_remove':
+            number = _vectorized.findall(texts, r'[0-9]+')
+            return _vectorized.sub(texts, r'[0-9]+', ''), number
+
+        elif self.__process == 'extract_replace':
+            number = _vectorized.findall(texts, r'[0-9]+')
+            return _vectorized.sub(texts, r'(\d+)', self.__number_words), number
+
+
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines"""
+
+        ops = []
+        if self.__seperator == ',':
+            ops.append(('sub', r'(?<!\B)[,](?!\B)', ''))
+
+        if self.__seperator == '.':
+            ops.append(('sub', r'(?<!\B)[.](?!\B)', ''))
+
+        if self.__process == 'remove':
+            return ops + [('sub', r'[0-9]+', '')]
+
+        elif self.__process == 'replace':
+            return ops + [('sub', r'(\d+)', self.__number_words)]
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
+    def _side_output(self):
+
+        return 'number_' if self.__process in ['extract_remove', 'extract_replace'] else None
+
+
+    def _recast_strings(self):
+
+        return self.__process != 'extract'
+
+
+    def recast(self):
+        """Perform selected process on the setup text
+
+        Returns
+        -------
+        ntext : string (process='remove' / process='replace')
+            Processed text
+        number : list of strings (process='extract')
+            Extracted Number(s)
+        ntext, number : string, list of strings (process='extract_remove' / process='extract_replace')
+            Processed text, Extracted Number(s)
+        """
+        
+        try:
+            assert(self.__setup)
+        except:
+            print(f'method setup needs to be called before recast')
+        
         if self._dtype == str:
             return self.__base_recast(self._text)
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                if self.__process in ['remove', 'replace', 'extract']:
-                    ntext = []
-                    for text in self._text:
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process in ['extract_remove', 'extract_replace']:
-                    ntext, number_list = [], []
-                    for text in self._text:
-                        text, number = self.__base_recast(text)
-                        ntext.append(text)
-                        number_list.append(number)
-                    self.number_ = number_list
-                    return ntext, number_list
-                    
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                if self.__process in ['remove', 'replace', 'extract']:
-                    ntext = []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'NumberRecast process': self.__process})
-                        text = self._text[i]
-                        ntext.append(self.__base_recast(text))
-                    return ntext
-
-                elif self.__process in ['extract_remove', 'extract_replace']:
-                    ntext, number_list = [], []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'NumberRecast process': self.__process})
-                        text = self._text[i]
-                        text, number = self.__base_recast(text)
-                        ntext.append(text)
-                        number_list.append(number)
-                    self.number_ = number_list
-                    return ntext, number_list
+            postfix = {'NumberRecast process': self.__process}
+            column_recast = self.__column_recast if self.__backend == 'vectorized' else None
+
+            if self.__process in ['remove', 'replace', 'extract']:
+                ntext = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                         postfix, strings=self.__process != 'extract', column_recast=column_recast)
+                if self.__process == 'extract':
+                    self.number_ = ntext
+                return ntext
+
+            elif self.__process in ['extract_remove', 'extract_replace']:
+                ntext, number_list = self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                                postfix, extract=True, column_recast=column_recast)
+                self.number_ = number_list
+                return ntext, number_list
 
 
     def setup_recast(self, text):
@@ -2094,6 +2353,8 @@ class AlphabetRecast(TextFormatter):
     ----------
     process: string / list ('all', 'keep_alpha', 'rem_non_ascii', 'rem_acc_char', or combination in a list), default='all'
     verbose: int (0, 1, -1), default=0
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
 
     Examples
@@ -2110,9 +2371,9 @@ class AlphabetRecast(TextFormatter):
     'It was past lunch time so the   of us dropped by The Main Street Cafe  for a late lunch '
     """
 
-    def __init__(self, process='all', verbose=0):
+    def __init__(self, process='all', verbose=0, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__process = process
         self.__verbose_status = True
@@ -2120,11 +2381,16 @@ class AlphabetRecast(TextFormatter):
         if self.__verbose == -1:
             self.__verbose_status = False
 
-        # try:
-        #     assert(isinstance(self.__process, str))
-        # except:
-        #     print(f'Expected process input type <class \'str\'>, input type received {type(self.__process)}')
-        
+        processes = [self.__process] if isinstance(self.__process, str) else list(self.__process)
+        try:
+            assert(all(process in ALPHABET_PROCESSES for process in processes))
+        except:
+            print(f'Expected process input from {ALPHABET_PROCESSES} or a list of them, input received {self.__process}')
+
+        # the processes compiled into one per document transform
+        self.__ops = alphabet_ops([process for process in processes if process in ALPHABET_PROCESSES])
+        self.__steps = [op[1] for op in self.__ops]
+
         try:
             assert(isinstance(self.__verbose, int))
         except:
@@ -2148,29 +2414,24 @@ class AlphabetRecast(TextFormatter):
         self.__setup = True
     
     
-    def __base_recast(self, text, process):
-        """Perform selected process on the setup text
+    def __process_recast(self, text):
+        """Perform the selected process(es), in order, on a single text"""
 
-        Returns
-        -------
-        ntext : string
-            Processed text
-        """
+        for step in self.__steps:
+            text = step(text)
+        return text
 
-        if process == 'all':
-            text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
-            text = re.sub(r'[^\x00-\x7F]+', ' ', text)
-            text = re.sub(r'[^a-zA-Z]', ' ', text, 0)
-            return text
 
-        elif process == 'keep_alpha':
-            return re.sub(r'[^a-zA-Z]', ' ', text, 0)
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines"""
+
+        return list(self.__ops)
 
-        elif process == 'rem_non_ascii':
-            return re.sub(r'[^\x00-\x7F]+', ' ', text)
 
-        elif process == 'rem_acc_char':
-            return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__process_recast
 
 
     def recast(self):
@@ -2187,57 +2448,13 @@ class AlphabetRecast(TextFormatter):
         except:
             print(f'method setup needs to be called before recast')
         
-        if isinstance(self.__process, list):
-
-            for process in self.__process:
-
-                if self._dtype == str:
-                    self._text = self.__base_recast(self._text, process)
-
-                elif self._dtype == list:
-
-                    if self.__verbose == 0:
-
-                        ntext = []
-                        for text in self._text:
-                            ntext.append(self.__base_recast(text, process))
-                        self._text = ntext
-
-                    if self.__verbose == 1 or self.__verbose == -1:
-
-                        ntext = []
-                        progress_bar = trange(self._count, leave=False)
-                        for i in progress_bar:
-                            progress_bar.set_postfix({'AlphabetRecast process': process})
-                            text = self._text[i]
-                            ntext.append(self.__base_recast(text, process))
-                        self._text = ntext
-            
-            return self._text
-        
-        elif isinstance(self.__process, str):
-
-            if self._dtype == str:
-                return self.__base_recast(self._text, self.__process)
-
-            elif self._dtype == list:
-
-                if self.__verbose == 0:
-
-                    ntext = []
-                    for text in self._text:
-                        ntext.append(self.__base_recast(text, self.__process))
-                    return ntext
+        if self._dtype == str:
+            return self.__process_recast(self._text)
 
-                if self.__verbose == 1 or self.__verbose == -1:
+        elif self._dtype == list:
 
-                    ntext = []
-                    progress_bar = trange(self._count, leave=self.__verbose_status)
-                    for i in progress_bar:
-                        progress_bar.set_postfix({'AlphabetRecast process': self.__process})
-                        text = self._text[i]
-                        ntext.append(self.__base_recast(text, self.__process))
-                    return ntext
+            return self._TextFormatter__recast_text(self.__process_recast, self.__verbose, self.__verbose_status,
+                                                    {'AlphabetRecast process': self.__process})
 
 
     def setup_recast(self, text):
@@ -2268,6 +2485,12 @@ class PunctuationRecast(TextFormatter):
     Parameters
     ----------
     verbose: int (0, 1, -1), default=0
+    backend: string ('python', 'vectorized'), default='python' ('vectorized' needs pip install swachhdata[arrow])
+    unicode: bool, default=False
+        also remove the characters of the Unicode punctuation categories
+        (e.g. « » “ ” … ¿ 、), not only string.punctuation
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
 
     Examples
@@ -2283,20 +2506,37 @@ class PunctuationRecast(TextFormatter):
     'Have you fed that dog I told you Don t feed that dog'
     """
 
-    def __init__(self, verbose=0):
+    def __init__(self, verbose=0, backend='python', unicode=False, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
+        self.__unicode = unicode
         self.__verbose_status = True
         self.__verbose = verbose
         if self.__verbose == -1:
             self.__verbose_status = False
+        self.__backend = backend
         
         try:
             assert(isinstance(self.__verbose, int))
         except:
             print(f'Expected verbose input type <class \'int\'>, input type received {type(self.__verbose)}')
 
+        try:
+            assert(self.__backend in ['python', 'vectorized'])
+        except:
+            print(f'Expected backend input \'python\' or \'vectorized\', input received {self.__backend}')
+
+        try:
+            assert(isinstance(self.__unicode, bool))
+        except:
+            print(f'Expected unicode input type <class \'bool\'>, input type received {type(self.__unicode)}')
+
+        self.__table = unicode_punctuation_table() if self.__unicode else PUNCTUATION_TABLE
+
+        if self.__backend == 'vectorized':
+            _lazy_import(pyarrow)
+
 
     def setup(self, text):
         """Change the input text type to supported type
@@ -2323,7 +2563,32 @@ class PunctuationRecast(TextFormatter):
         ntext : string
             Processed text
         """
-        return text.translate(str.maketrans(string.punctuation, ' ' * len(string.punctuation))).replace(' '*4, ' ').replace(' '*3, ' ').replace(' '*2, ' ').strip()
+        return squeeze_spaces(text.translate(self.__table))
+
+
+    def __column_recast(self, texts):
+        """Perform selected process on all setup documents at once (backend='vectorized')
+
+        Returns
+        -------
+        ntext : pyarrow string array
+            Processed text
+        """
+
+        texts = _vectorized.translate(texts, ''.join(map(chr, self.__table)), ' ')
+        return _vectorized.squeeze_spaces(texts)
+
+
+    def _recast_ops(self):
+        """String rewrite ops of the selected process, fused by compiled pipelines"""
+
+        return [('translate', self.__table), ('squeeze',)]
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
 
 
     def recast(self):
@@ -2346,22 +2611,9 @@ class PunctuationRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    ntext.append(self.__base_recast(text))
-                return ntext
-
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({'PunctuationRecast process': 'removing'})
-                    text = self._text[i]
-                    ntext.append(self.__base_recast(text))
-                return ntext
+            column_recast = self.__column_recast if self.__backend == 'vectorized' else None
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {'PunctuationRecast process': 'removing'}, column_recast=column_recast)
 
 
     def setup_recast(self, text):
@@ -2398,6 +2650,12 @@ class TokenisationRecast(TextFormatter):
     package: string ('nltk', 'spacy'), default='nltk'
     method: string ('word', 'sentence'), default=None
     verbose: int (0, 1, -1), default=0
+    batch_size: int, default=1000
+        documents per spacy nlp.pipe batch (package='spacy')
+    n_process: int, default=1
+        processes used by spacy nlp.pipe (package='spacy')
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
 
     Examples
@@ -2425,21 +2683,26 @@ class TokenisationRecast(TextFormatter):
     ['Grabbing her umbrella, Kate raced out of the house.', 'Confused by her sister’s sudden change in mood, Jill stayed quiet.']
     """
 
+    def __init__(self, package='nltk', method=None, verbose=0, batch_size=1000, n_process=1, n_jobs=1, chunksize=None):
 
-    def __init__(self, package='nltk', method=None, verbose=0):
-
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__package = package
         self.__method = method
+        self.__batch_size = batch_size
+        self.__n_process = n_process
         self.__verbose_status = True
         self.__verbose = verbose
 
         if self.__verbose == -1:
             self.__verbose_status = False
 
+        require_recast('TokenisationRecast', self.__package)
+        if self.__package == 'nltk':
+            _lazy_import(nltk)
+
         elif self.__package == 'spacy':
-            self.__sp = spacy.load('en_core_web_sm')
+            spacy_models.warm(SPACY_MODEL)
 
         try:
             assert(isinstance(self.__package, str))
@@ -2485,9 +2748,7 @@ class TokenisationRecast(TextFormatter):
             return sent_tokenize(text)
 
 
-    def __spacy_tokenize(self, text):
-
-        text = self.__sp(text)
+    def __spacy_tokens(self, text):
 
         if self.__method == 'word':
             return [word.text for word in text]
@@ -2496,6 +2757,19 @@ class TokenisationRecast(TextFormatter):
             return [sentence for sentence in text.sents]
 
 
+    def __spacy_tokenize(self, text):
+
+        return self.__spacy_tokens(spacy_models.get(SPACY_MODEL)(text))
+
+
+    def __spacy_pipe(self, texts):
+        """Tokenise documents in nlp.pipe batches, in order"""
+
+        nlp = spacy_models.get(SPACY_MODEL)
+        for text in nlp.pipe(texts, batch_size=self.__batch_size, n_process=self.__n_process):
+            yield self.__spacy_tokens(text)
+
+
     def __base_recast(self, text):
         """Perform selected process on the setup text
 
@@ -2512,6 +2786,22 @@ class TokenisationRecast(TextFormatter):
             return self.__spacy_tokenize(text)
 
 
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
+    def _batch_recast(self):
+
+        return self.__spacy_pipe if self.__package == 'spacy' else None
+
+
+    def _recast_strings(self):
+
+        return False
+
+
     def recast(self):
         """Perform selected process on the setup text
         
@@ -2531,24 +2821,8 @@ class TokenisationRecast(TextFormatter):
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    text = self.__base_recast(text)
-                    ntext.append(text)
-                return ntext
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({f'TokenisationRecast {self.__package} process': f'{self.__method} tokenisation'})
-                    text = self._text[i]
-                    text = self.__base_recast(text)
-                    ntext.append(text)
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {f'TokenisationRecast {self.__package} process': f'{self.__method} tokenisation'}, strings=False)
 
 
     def setup_recast(self, text):
@@ -2581,6 +2855,13 @@ class StemmingRecast(TextFormatter):
     package: string ('nltk', 'extract', 'extract_remove'), default='nltk'
     method: string ('porter', 'snowball')
     verbose: int (0, 1, -1), default=0
+    vocabulary: bool (True, False), default=True
+        stem the unique words of batch_size documents once and rebuild the
+        documents from them (list / pandas.Series / streaming input)
+    batch_size: int, default=10000
+        documents per vocabulary batch
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
 
     Examples
@@ -2606,21 +2887,29 @@ class StemmingRecast(TextFormatter):
     >>> # OR
     >>> rec.setup_recast(text)
     'you can have a look at our catalogu at www.samplewebsite.com in the servic tab'
+
+    The stemmer is created once per process and stems are memoized in a
+    bounded cache shared across calls (see swachhdata.text._registry).
     """
 
 
-    def __init__(self, package='nltk', method='porter', verbose=0):
+    def __init__(self, package='nltk', method='porter', verbose=0, vocabulary=True, batch_size=10000, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__package = package
         self.__method = method
+        self.__vocabulary = vocabulary
+        self.__batch_size = batch_size
         self.__verbose_status = True
         self.__verbose = verbose
 
         if self.__verbose == -1:
             self.__verbose_status = False
 
+        if self.__package == 'nltk':
+            _lazy_import(nltk)
+
         try:
             assert(isinstance(self.__package, str))
         except:
@@ -2663,47 +2952,46 @@ class StemmingRecast(TextFormatter):
             Processed text
         """
 
-        if (self.__verbose == 1 or self.__verbose == -1) and self._dtype == str:
-
-            if self.__method == 'porter':
-                from nltk.stem.porter import PorterStemmer
-                porter_stemmer = PorterStemmer()
-                words = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({f'StemmingRecast process': f'{self.__method} stemmer'})
-                    word = text.split()[i]
-                    words.append(porter_stemmer.stem(word))
-                return ' '.join(words)
-
-            elif self.__method == 'snowball':
-                from nltk.stem.snowball import SnowballStemmer
-                snowball_stemmer = SnowballStemmer('english')
-                words = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({f'StemmingRecast process': f'{self.__method} stemmer'})
-                    word = text.split()[i]
-                    words.append(snowball_stemmer.stem(word))
-                return ' '.join(words)
-        
-        else:
+        stem = partial(_registry.stem, self.__method)
+        return ' '.join([stem(word) for word in text.split()])
+
 
-            if self.__method == 'porter':
-                from nltk.stem.porter import PorterStemmer
-                porter_stemmer = PorterStemmer()
-                words = []
-                for word in text.split():
-                    words.append(porter_stemmer.stem(word))
-                return ' '.join(words)
+    def __verbose_recast(self, text):
+        """Perform selected process on the setup string, with a progress bar over its words
 
-            elif self.__method == 'snowball':
-                from nltk.stem.snowball import SnowballStemmer
-                snowball_stemmer = SnowballStemmer('english')
-                words = []
-                for word in text.split():
-                    words.append(snowball_stemmer.stem(word))
-                return ' '.join(words)
+        Returns
+        -------
+        ntext : string
+            Processed text
+        """
+
+        stem = partial(_registry.stem, self.__method)
+        words = text.split()
+        progress_bar = trange(self._count, leave=self.__verbose_status)
+        progress_bar.set_postfix({f'StemmingRecast process': f'{self.__method} stemmer'})
+        return ' '.join([stem(words[i]) for i in progress_bar])
+
+
+    def __vocabulary_recast(self, texts):
+        """Stem the vocabulary of batch_size documents at a time, yield the documents in order"""
+
+        stem = partial(_registry.stem, self.__method)
+        for batch in _batches(texts, self.__batch_size):
+            words = [text.split() for text in batch]
+            stems = {word: stem(word) for word in set().union(*words)}
+            for doc in words:
+                yield ' '.join(map(stems.__getitem__, doc))
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
+    def _batch_recast(self):
+
+        return self.__vocabulary_recast if self.__vocabulary else None
 
 
     def recast(self):
@@ -2720,29 +3008,16 @@ class StemmingRecast(TextFormatter):
         except:
             print(f'method setup needs to be called before recast')
 
-        if self._dtype == str:
+        if self._dtype == str and (self.__verbose == 1 or self.__verbose == -1):
+            return self.__verbose_recast(self._text)
+
+        elif self._dtype == str:
             return self.__base_recast(self._text)
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    text = self.__base_recast(text)
-                    ntext.append(text)
-                return ntext
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({f'StemmingRecast process': f'{self.__method} stemmer'})
-                    text = self._text[i]
-                    text = self.__base_recast(text)
-                    ntext.append(text)
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {f'StemmingRecast process': f'{self.__method} stemmer'})
 
 
     def setup_recast(self, text):
@@ -2774,6 +3049,16 @@ class LemmatizationRecast(TextFormatter):
     ----------
     package: string ('nltk', 'spacy'), default='nltk'
     verbose: int (0, 1, -1), default=0
+    pos_context: bool (True, False), default=False
+        opt in to tagging the words of a document together, in context, for
+        more accurate lemmas (package='nltk'); the default tags every word
+        on its own
+    batch_size: int, default=1000
+        documents per spacy nlp.pipe / nltk tag_sents batch
+    n_process: int, default=1
+        processes used by spacy nlp.pipe (package='spacy')
+    n_jobs: int, default=1 (-1 uses all cores)
+    chunksize: int, default=None
     
 
     Examples
@@ -2787,22 +3072,32 @@ class LemmatizationRecast(TextFormatter):
     >>> # OR
     >>> rec.setup_recast(text)
     'You can have a look at our catalogue at www.samplewebsite.com in the service tab'
-    """
 
+    With package='nltk' the tagger and lemmatizer are loaded once per
+    process and lemmas are memoized per (word, part of speech) in a bounded
+    cache shared by every LemmatizationRecast (see swachhdata.text._registry).
+    """
 
-    def __init__(self, package='nltk', verbose=0):
+    def __init__(self, package='nltk', verbose=0, pos_context=False, batch_size=1000, n_process=1, n_jobs=1, chunksize=None):
 
-        TextFormatter.__init__(self)
+        TextFormatter.__init__(self, n_jobs, chunksize)
         self.__setup = False
         self.__package = package
+        self.__pos_context = pos_context
+        self.__batch_size = batch_size
+        self.__n_process = n_process
         self.__verbose_status = True
         self.__verbose = verbose
 
         if self.__verbose == -1:
             self.__verbose_status = False
+
+        require_recast('LemmatizationRecast', self.__package)
+        if self.__package == 'nltk':
+            _lazy_import(nltk)
         
         elif self.__package == 'spacy':
-            self.__sp = spacy.load('en', disable=['parser', 'ner'])
+            spacy_models.warm(SPACY_MODEL)
 
         try:
             assert(isinstance(self.__package, str))
@@ -2832,16 +3127,45 @@ class LemmatizationRecast(TextFormatter):
         self.__setup = True
 
 
-    def __get_wordnet_pos(self, word):
-        from nltk.corpus import wordnet
+    def __spacy_lemmatize(self, text):
+
+        # the shared model, without running the components lemmas do not need
+        text = spacy_models.get(SPACY_MODEL)(text, disable=LEMMATIZER_DISABLE)
+        return ' '.join([token.lemma_ for token in text])
+
+
+    def __spacy_pipe(self, texts):
+        """Lemmatize documents in nlp.pipe batches, in order"""
 
-        tag = nltk.pos_tag([word])[0][1][0].upper()
-        tag_dict = {'J': wordnet.ADJ,
-                    'N': wordnet.NOUN,
-                    'V': wordnet.VERB,
-                    'R': wordnet.ADV}
+        nlp = spacy_models.get(SPACY_MODEL)
+        for text in nlp.pipe(texts, batch_size=self.__batch_size, n_process=self.__n_process, disable=LEMMATIZER_DISABLE):
+            yield ' '.join([token.lemma_ for token in text])
 
-        return tag_dict.get(tag, wordnet.NOUN)
+
+    def __nltk_tag(self, words):
+        """(word, tag) of every word"""
+
+        if self.__pos_context:
+            return _registry.nltk_tagger().tag(words)
+        return [(word, _registry.word_tag(word)) for word in words]
+
+
+    def __nltk_lemmatize(self, tagged):
+
+        return ' '.join([_registry.wordnet_lemma(word, _registry.wordnet_pos(tag)) for word, tag in tagged])
+
+
+    def __nltk_pipe(self, texts):
+        """Lemmatize documents, tagging batch_size documents at a time, in order"""
+
+        for batch in _batches(texts, self.__batch_size):
+            words = [text.split() for text in batch]
+            if self.__pos_context:
+                tagged = _registry.nltk_tagger().tag_sents(words)
+            else:
+                tagged = [self.__nltk_tag(doc) for doc in words]
+            for doc in tagged:
+                yield self.__nltk_lemmatize(doc)
 
 
     def __base_recast(self, text):
@@ -2853,36 +3177,47 @@ class LemmatizationRecast(TextFormatter):
             Processed text
         """
 
-        if (self.__verbose == 1 or self.__verbose == -1) and self._dtype == str:
-
-            if self.__package == 'nltk':
-                import nltk
-                from nltk.stem import WordNetLemmatizer
-                lemmatizer = WordNetLemmatizer()
-                words = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({f'LemmatizationRecast process': f'{self.__package} lemmatizer'})
-                    w = text.split()[i]
-                    words.append(lemmatizer.lemmatize(w, self.__get_wordnet_pos(w)))
-                return ' '.join(words)
-            
-            elif self.__package == 'spacy':
-                text = self.__sp(text)
-                return ' '.join([token.lemma_ for token in text])
+        if self.__package == 'nltk':
+            return self.__nltk_lemmatize(self.__nltk_tag(text.split()))
         
-        else:
-            
-            if self.__package == 'nltk':
-                import nltk
-                from nltk.stem import WordNetLemmatizer
-                lemmatizer = WordNetLemmatizer()
-                text = ' '.join([lemmatizer.lemmatize(w, self.__get_wordnet_pos(w)) for w in text.split()])
-                return text
-            
-            elif self.__package == 'spacy':
-                text = self.__sp(text)
-                return ' '.join([token.lemma_ for token in text])
+        elif self.__package == 'spacy':
+            return self.__spacy_lemmatize(text)
+
+
+    def __verbose_recast(self, text):
+        """Perform selected process on the setup string, with a progress bar over its words
+
+        Returns
+        -------
+        ntext : string
+            Processed text
+        """
+
+        if self.__package == 'nltk':
+            tagged = self.__nltk_tag(text.split())
+            words = []
+            progress_bar = trange(self._count, leave=self.__verbose_status)
+            progress_bar.set_postfix({f'LemmatizationRecast process': f'{self.__package} lemmatizer'})
+            for i in progress_bar:
+                word, tag = tagged[i]
+                words.append(_registry.wordnet_lemma(word, _registry.wordnet_pos(tag)))
+            return ' '.join(words)
+        
+        elif self.__package == 'spacy':
+            return self.__spacy_lemmatize(text)
+
+
+    def _document_recast(self):
+        """Single document recast used by compiled and streaming pipelines"""
+
+        return self.__base_recast
+
+
+    def _batch_recast(self):
+
+        if self.__package == 'spacy':
+            return self.__spacy_pipe
+        return self.__nltk_pipe
 
 
     def recast(self):
@@ -2899,29 +3234,16 @@ class LemmatizationRecast(TextFormatter):
         except:
             print(f'method setup needs to be called before recast')
 
-        if self._dtype == str:
+        if self._dtype == str and (self.__verbose == 1 or self.__verbose == -1):
+            return self.__verbose_recast(self._text)
+
+        elif self._dtype == str:
             return self.__base_recast(self._text)
 
         elif self._dtype == list:
 
-            if self.__verbose == 0:
-
-                ntext = []
-                for text in self._text:
-                    text = self.__base_recast(text)
-                    ntext.append(text)
-                return ntext
-            
-            if self.__verbose == 1 or self.__verbose == -1:
-
-                ntext = []
-                progress_bar = trange(self._count, leave=self.__verbose_status)
-                for i in progress_bar:
-                    progress_bar.set_postfix({f'LemmatizationRecast process': f'{self.__package} lemmatizer'})
-                    text = self._text[i]
-                    text = self.__base_recast(text)
-                    ntext.append(text)
-                return ntext
+            return self._TextFormatter__recast_text(self.__base_recast, self.__verbose, self.__verbose_status,
+                                                    {f'LemmatizationRecast process': f'{self.__package} lemmatizer'})
 
 
     def setup_recast(self, text):
@@ -2946,49 +3268,102 @@ class LemmatizationRecast(TextFormatter):
 ##############################################################################################################
 
 
-def TextRecast(text, **kwargs):
+def TextRecast(text, n_jobs=1, chunksize=None, profile=None, dedup=False, **kwargs):
     """TextRecast: wrapper function for Recast classes.
     
     Parameters
     ----------
     text : string / list of strings / pandas.core.series.Series
+    n_jobs : int, default=1
+        worker processes used by every recast (-1 uses all cores)
+    chunksize : int, default=None
+        documents sent to a worker at a time
+    profile : RecastProfile / callable, default=None
+        record wall time, CPU time, document count, bytes in / out and
+        documents modified of every recast in the RecastProfile, a
+        callable is called with the StageProfile of each recast once it completes
+    dedup : bool, default=False
+        recast every distinct document once (list / pandas.Series input),
+        documents and extracted values are fanned back out to every copy;
+        the share of duplicates is recorded in profile (RecastProfile.dedup_ratio)
     **kwargs
 
     kwargs Template
     ----------
     { urlRecast = {'process': 'extract_remove'},
-      htmlRecast = True,
+      htmlRecast = True,  # or {'drop_scripts': True, 'block_separator': ' '}
       EscapeSequenceRecast = True,
       MentionRecast = {'process': 'extract_remove'},
-      ContractionsRecast = True,
+      ContractionsRecast = True,  # or {'mappings': {'brb': 'be right back'}}
       CaseRecast = {'process': 'lower'},
       EmojiRecast = {'process': 'extract_remove', 'space_out': False},
       HashtagRecast = {'process': 'extract_remove'},
       ShortWordsRecast = {'min_length': 3},
-      StopWordsRecast = {'package': 'nltk', 'space_out': None},
+      StopWordsRecast = {'package': 'nltk', 'stopwords': None, 'language': 'english'},
       NumberRecast = {'process': 'remove', 'seperator': None},
       AlphabetRecast = {'process': 'all'},
-      PunctuationRecast = True,
+      PunctuationRecast = True,  # or {'unicode': True}
       StemmingRecast = {'package': 'nltk', 'method': 'porter'},
-      LemmatizationRecast = {'package':'nltk'},
+      LemmatizationRecast = {'package':'nltk'},  # or {'package': 'nltk', 'pos_context': True}
       TokenisationRecast = {'package': 'nltk', 'method': 'sentence' }
 
-    Attributes
-    ----------
-    * url
-    * mention
-    * emoji
-    * hashtag
-    * token
-    * number
-
     Returns
     ---------
-    ntext : string / list of strings
-            Processed text
+    result : TextRecastResult
+        result.text: Processed text
+        result.url, result.mention, result.emoji, result.hashtag,
+        result.number, result.token: values extracted by the recasts,
+        an Extraction (flat values and per document offsets) for list /
+        pandas.Series input, None if not extracted
+        result.dedup_ratio: share of duplicate documents (dedup=True),
+        with or without profile, None otherwise
+
+    Concurrency
+    -----------
+    TextRecast keeps no state between calls: recasts are created per call
+    and the text and extracted values are only held by the returned result,
+    so concurrent calls from threads (or asyncio executors) do not see
+    each other's outputs. Process-wide resources (stop words, stemmers,
+    the nltk tagger and WordNet, emoji and contraction engines, resolved
+    resource paths) are built once under a lock and only read afterwards,
+    so calls of every recast other than the spacy ones are thread safe.
+    spacy models write to their Vocab and StringStore while processing,
+    so concurrent calls sharing a spacy model (TokenisationRecast and
+    LemmatizationRecast with package='spacy') are not guaranteed to be
+    safe, run those from processes (n_jobs) instead.
+
+    Examples
+    --------
+    >>> from swachhdata.text import TextRecast
+    >>> result = TextRecast(text, urlRecast={'process': 'extract_remove'}, CaseRecast={'process': 'lower'})
+    >>> result.text
+    >>> result.url.tolist()  # or result.url[0], result.url.to_series(), result.url.to_arrow()
+    """
+
+    profile = as_profile(profile)
+
+    dedup_ratio = None
+    if dedup and (isinstance(text, list) or _is_series(text)):
+        unique = Deduplicated(text, profile)
+        dedup_ratio = unique.ratio_
+        ntext, extracted = _text_recast(unique.unique_, n_jobs, chunksize, profile, kwargs)
+        ntext, extracted = unique.expand(ntext), {name: unique.expand(rows) for name, rows in extracted.items()}
+    else:
+        ntext, extracted = _text_recast(text, n_jobs, chunksize, profile, kwargs)
+
+    return TextRecastResult.from_recast(ntext, extracted, single=isinstance(text, str), dedup_ratio=dedup_ratio)
+
+
+def _text_recast(text, n_jobs, chunksize, profile, kwargs):
+    """Run the recasts of kwargs on text
+
+    Returns
+    -------
+    ntext, extracted : processed text, dict of the values extracted by each recast
     """
 
     verbose=-1
+    extracted = {}
 
     ccount = 0 # complete count
     rcount = len(kwargs) # recast count
@@ -3002,15 +3377,14 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'urlRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        global url
         if kwargs['urlRecast']['process'] == 'extract_remove':
-           text, url  = urlRecast(kwargs['urlRecast']['process'], verbose=verbose).setup_recast(text)
+           text, extracted['url']  = measure(profile, 'urlRecast', urlRecast(kwargs['urlRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
 
         elif kwargs['urlRecast']['process'] == 'extract':
-            url  = urlRecast(kwargs['urlRecast']['process'], verbose=verbose).setup_recast(text)
+            extracted['url']  = measure(profile, 'urlRecast', urlRecast(kwargs['urlRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         
         elif kwargs['urlRecast']['process'] == 'remove':
-           text = urlRecast(kwargs['urlRecast']['process'], verbose=verbose).setup_recast(text) 
+           text = measure(profile, 'urlRecast', urlRecast(kwargs['urlRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text) 
 
         pbar.update(tcount)
 
@@ -3019,7 +3393,8 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'htmlRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = htmlRecast(verbose=verbose).setup_recast(text)
+        options = kwargs['htmlRecast'] if isinstance(kwargs['htmlRecast'], dict) else {}
+        text = measure(profile, 'htmlRecast', htmlRecast(verbose=verbose, drop_scripts=options.get('drop_scripts', True), block_separator=options.get('block_separator'), n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
     
     if 'EscapeSequenceRecast' in kwargs:
@@ -3027,7 +3402,7 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'EscapeSequenceRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = EscapeSequenceRecast(verbose=verbose).setup_recast(text)
+        text = measure(profile, 'EscapeSequenceRecast', EscapeSequenceRecast(verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
     
     if 'MentionRecast' in kwargs:
@@ -3035,15 +3410,14 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'MentionRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        global mention
         if kwargs['MentionRecast']['process'] == 'extract_remove':
-           text, mention  = MentionRecast(kwargs['MentionRecast']['process'], verbose=verbose).setup_recast(text)
+           text, extracted['mention']  = measure(profile, 'MentionRecast', MentionRecast(kwargs['MentionRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
 
         elif kwargs['MentionRecast']['process'] == 'extract':
-            mention  = MentionRecast(kwargs['MentionRecast']['process'], verbose=verbose).setup_recast(text)
+            extracted['mention']  = measure(profile, 'MentionRecast', MentionRecast(kwargs['MentionRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         
         elif kwargs['MentionRecast']['process'] == 'remove':
-           text = MentionRecast(kwargs['MentionRecast']['process'], verbose=verbose).setup_recast(text)
+           text = measure(profile, 'MentionRecast', MentionRecast(kwargs['MentionRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
 
         pbar.update(tcount)
 
@@ -3052,7 +3426,8 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'ContractionsRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = ContractionsRecast(verbose=verbose).setup_recast(text)
+        mappings = kwargs['ContractionsRecast'].get('mappings') if isinstance(kwargs['ContractionsRecast'], dict) else None
+        text = measure(profile, 'ContractionsRecast', ContractionsRecast(verbose=verbose, mappings=mappings, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
     
     if 'CaseRecast' in kwargs:
@@ -3060,7 +3435,7 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'CaseRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = CaseRecast(kwargs['CaseRecast']['process'], verbose=verbose).setup_recast(text)
+        text = measure(profile, 'CaseRecast', CaseRecast(kwargs['CaseRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
     
     if 'EmojiRecast' in kwargs:
@@ -3068,15 +3443,14 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'EmojiRecast || TextRecast No': f'{ccount}/{rcount}'})
         
-        global emoji
         if kwargs['EmojiRecast']['process'] == 'extract_remove':
-           text, emoji  = EmojiRecast(kwargs['EmojiRecast']['process'], kwargs['EmojiRecast']['space_out'], verbose=verbose).setup_recast(text)
+           text, extracted['emoji']  = measure(profile, 'EmojiRecast', EmojiRecast(kwargs['EmojiRecast']['process'], kwargs['EmojiRecast']['space_out'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
 
         elif kwargs['EmojiRecast']['process'] == 'extract':
-            emoji  = EmojiRecast(kwargs['EmojiRecast']['process'], kwargs['EmojiRecast']['space_out'], verbose=verbose).setup_recast(text)
+            extracted['emoji']  = measure(profile, 'EmojiRecast', EmojiRecast(kwargs['EmojiRecast']['process'], kwargs['EmojiRecast']['space_out'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         
         elif kwargs['EmojiRecast']['process'] == 'remove':
-           text = EmojiRecast(kwargs['EmojiRecast']['process'], kwargs['EmojiRecast']['space_out'], verbose=verbose).setup_recast(text)
+           text = measure(profile, 'EmojiRecast', EmojiRecast(kwargs['EmojiRecast']['process'], kwargs['EmojiRecast']['space_out'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
 
         pbar.update(tcount)
     
@@ -3085,15 +3459,14 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'HashtagRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        global hashtag
         if kwargs['HashtagRecast']['process'] == 'extract_remove':
-           text, hashtag  = HashtagRecast(kwargs['HashtagRecast']['process'], verbose=verbose).setup_recast(text)
+           text, extracted['hashtag']  = measure(profile, 'HashtagRecast', HashtagRecast(kwargs['HashtagRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
 
         elif kwargs['HashtagRecast']['process'] == 'extract':
-            hashtag  = HashtagRecast(kwargs['HashtagRecast']['process'], verbose=verbose).setup_recast(text)
+            extracted['hashtag']  = measure(profile, 'HashtagRecast', HashtagRecast(kwargs['HashtagRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         
         elif kwargs['HashtagRecast']['process'] == 'remove':
-           text = HashtagRecast(kwargs['HashtagRecast']['process'], verbose=verbose).setup_recast(text)
+           text = measure(profile, 'HashtagRecast', HashtagRecast(kwargs['HashtagRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         
         pbar.update(tcount)
     
@@ -3102,7 +3475,7 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'ShortWordsRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = ShortWordsRecast(kwargs['ShortWordsRecast']['min_length'], verbose=verbose).setup_recast(text)
+        text = measure(profile, 'ShortWordsRecast', ShortWordsRecast(kwargs['ShortWordsRecast']['min_length'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
 
     if 'StopWordsRecast' in kwargs:
@@ -3110,7 +3483,7 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'StopWordsRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = StopWordsRecast(kwargs['StopWordsRecast']['package'], kwargs['StopWordsRecast']['stopwords'], verbose=verbose).setup_recast(text)
+        text = measure(profile, 'StopWordsRecast', StopWordsRecast(kwargs['StopWordsRecast']['package'], kwargs['StopWordsRecast'].get('stopwords'), verbose=verbose, language=kwargs['StopWordsRecast'].get('language', 'english'), n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
 
     if 'NumberRecast' in kwargs:
@@ -3118,15 +3491,14 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'NumberRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        global number
         if kwargs['NumberRecast']['process'] == 'extract_remove' or kwargs['NumberRecast']['process'] == 'extract_replace':
-           text, number  = NumberRecast(kwargs['NumberRecast']['process'], kwargs['NumberRecast']['seperator'], verbose=verbose).setup_recast(text)
+           text, extracted['number']  = measure(profile, 'NumberRecast', NumberRecast(kwargs['NumberRecast']['process'], kwargs['NumberRecast']['seperator'], verbose=verbose, lang=kwargs['NumberRecast'].get('lang', 'en'), n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
 
         elif kwargs['NumberRecast']['process'] == 'extract':
-            number  = NumberRecast(kwargs['NumberRecast']['process'], kwargs['NumberRecast']['seperator'], verbose=verbose).setup_recast(text)
+            extracted['number']  = measure(profile, 'NumberRecast', NumberRecast(kwargs['NumberRecast']['process'], kwargs['NumberRecast']['seperator'], verbose=verbose, lang=kwargs['NumberRecast'].get('lang', 'en'), n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         
         elif kwargs['NumberRecast']['process'] == 'remove' or kwargs['NumberRecast']['process'] == 'replace':
-           text = NumberRecast(kwargs['NumberRecast']['process'], kwargs['NumberRecast']['seperator'], verbose=verbose).setup_recast(text)
+           text = measure(profile, 'NumberRecast', NumberRecast(kwargs['NumberRecast']['process'], kwargs['NumberRecast']['seperator'], verbose=verbose, lang=kwargs['NumberRecast'].get('lang', 'en'), n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         
         pbar.update(tcount)
 
@@ -3135,7 +3507,7 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'AlphabetRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = AlphabetRecast(kwargs['AlphabetRecast']['process'], verbose=verbose).setup_recast(text)
+        text = measure(profile, 'AlphabetRecast', AlphabetRecast(kwargs['AlphabetRecast']['process'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
 
     if 'PunctuationRecast' in kwargs:
@@ -3143,7 +3515,8 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'PunctuationRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = PunctuationRecast(verbose=verbose).setup_recast(text)
+        options = kwargs['PunctuationRecast'] if isinstance(kwargs['PunctuationRecast'], dict) else {}
+        text = measure(profile, 'PunctuationRecast', PunctuationRecast(verbose=verbose, unicode=options.get('unicode', False), n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
 
     if 'StemmingRecast' in kwargs:
@@ -3151,7 +3524,7 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'StemmingRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = StemmingRecast(kwargs['StemmingRecast']['package'], kwargs['StemmingRecast']['method'], verbose=verbose).setup_recast(text)
+        text = measure(profile, 'StemmingRecast', StemmingRecast(kwargs['StemmingRecast']['package'], kwargs['StemmingRecast']['method'], verbose=verbose, n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
 
     if 'LemmatizationRecast' in kwargs:
@@ -3159,7 +3532,7 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'LemmatizationRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        text = LemmatizationRecast(kwargs['LemmatizationRecast']['package'], verbose=verbose).setup_recast(text)
+        text = measure(profile, 'LemmatizationRecast', LemmatizationRecast(kwargs['LemmatizationRecast']['package'], verbose=verbose, pos_context=kwargs['LemmatizationRecast'].get('pos_context', False), batch_size=kwargs['LemmatizationRecast'].get('batch_size', 1000), n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
 
     if 'TokenisationRecast' in kwargs:
@@ -3167,19 +3540,54 @@ def TextRecast(text, **kwargs):
         ccount +=  1
         pbar.set_postfix({'TokenisationRecast || TextRecast No': f'{ccount}/{rcount}'})
 
-        global token
-        token = TokenisationRecast(kwargs['TokenisationRecast']['package'], kwargs['TokenisationRecast']['method'], verbose=verbose).setup_recast(text)
+        extracted['token'] = measure(profile, 'TokenisationRecast', TokenisationRecast(kwargs['TokenisationRecast']['package'], kwargs['TokenisationRecast']['method'], verbose=verbose, batch_size=kwargs['TokenisationRecast'].get('batch_size', 1000), n_jobs=n_jobs, chunksize=chunksize).setup_recast, text)
         pbar.update(tcount)
 
     pbar.set_postfix({'TextRecast Complete! || TextRecast No': f'{ccount}/{rcount}'})
     pbar.close()
-    
-    return text
+
+    return text, extracted
 
 
 ##############################################################################################################
 
 
+# columns of the tweets collected by TweetExtractor.extract
+TWEET_COLUMNS = ['ID', 'User', 'Tweets', 'fav_count', 'rt_count', 'tweet_date']
+
+
+class _TweetWriter:
+    """Writes chunks of column buffers to a CSV file (appended) or a Parquet file (one row group each)"""
+
+    def __init__(self, path, file_format):
+
+        self.__path = path
+        self.__format = file_format
+        self.__parquet = None
+        self.written = False
+
+
+    def write(self, buffers):
+
+        if self.__format == 'parquet':
+            if self.__parquet is None:
+                table = pyarrow.Table.from_pydict(buffers)
+                self.__parquet = pyarrow_parquet.ParquetWriter(self.__path, table.schema)
+            else:
+                table = pyarrow.Table.from_pydict(buffers, schema=self.__parquet.schema)
+            self.__parquet.write_table(table)
+        else:
+            pandas.DataFrame(buffers, columns=TWEET_COLUMNS).to_csv(self.__path, mode='a' if self.written else 'w',
+                                                                   header=not self.written, index=False)
+        self.written = True
+
+
+    def close(self):
+
+        if self.__parquet is not None:
+            self.__parquet.close()
+
+
 class TweetExtractor:
     """TweetExtractor: wrapper function for tweepy.Cursor, helps you fetch tweets from twitter
     
@@ -3202,7 +3610,9 @@ class TweetExtractor:
                 'access_token': 'xxx',
                 'access_token_secret': 'xxx'}
     >>> tweets = TweetExtractor(keys)
-    >>> df = tweets.extract('keyword', count=100, file_name='my_tweets', verbose=1)
+    >>> df = tweets.extract('keyword', count=100, verbose=1)
+    >>> # OR stream them to my_tweets.parquet, 10000 tweets at a time
+    >>> tweets.extract('keyword', count=100000, file_name='my_tweets', file_format='parquet', chunk_size=10000)
     """
     
     def __init__(self, keys):
@@ -3214,57 +3624,206 @@ class TweetExtractor:
         self.__auth.set_access_token(self.__access_token, self.__access_token_secret)
         self.__api = tweepy.API(self.__auth)
     
-    def extract(self, keyword, count, file_name=None, verbose=0):
+    def extract(self, keyword, count, file_name=None, verbose=0, file_format='csv', chunk_size=10000):
         """Extract Tweets based on parameters
+
+        Tweets are collected into a buffer per column. With file_name they
+        are written out every chunk_size tweets (appended to the CSV file,
+        or as a row group of the Parquet file), so memory is bounded by
+        chunk_size, otherwise the DataFrame is built once at the end.
+
         Parameters
         ----------
         keyword : string
         count : int
         file_name : string
+            written to file_name.csv / file_name.parquet
         verbose : int (0 / 1)
+        file_format : string ('csv', 'parquet'), default='csv'
+            'parquet' needs pip install swachhdata[arrow]
+        chunk_size : int, default=10000
+            tweets kept in memory before they are written to file_name
 
         Returns
         -------
         df : pandas.DataFrame if file_name not mentioned
         """
+
+        try:
+            assert(file_format in ['csv', 'parquet'])
+        except:
+            print(f'Expected file_format input \'csv\' or \'parquet\', input received {file_format}')
+
+        try:
+            assert(isinstance(chunk_size, int) and chunk_size > 0)
+        except:
+            print(f'Expected chunk_size input a positive <class \'int\'>, input received {chunk_size}')
+
+        if file_name is not None and file_format == 'parquet':
+            # fail before any tweet is fetched
+            _lazy_import(pyarrow, pyarrow_parquet)
+
+        buffers = {column: [] for column in TWEET_COLUMNS}
+        writer = _TweetWriter(f'{file_name}.{file_format}', file_format) if file_name is not None else None
+
         i = 0
-        df = pandas.DataFrame(columns = ['ID', 'User', 'Tweets','fav_count', 'rt_count', 'tweet_date'])
         if verbose==1:
             pbar = tqdm(total=count)
         for tweet in tweepy.Cursor(self.__api.search, q=keyword, count=100, lang='en', tweet_mode='extended').items():
-            df.loc[i,'ID'] = tweet.id
-            df.loc[i,'Tweets'] = tweet.full_text
-            df.loc[i,'User'] = tweet.user.name
-            df.loc[i,'fav_count'] = tweet.favorite_count
-            df.loc[i,'rt_count'] = tweet.retweet_count
-            df.loc[i,'tweet_date'] = tweet.created_at
+            buffers['ID'].append(tweet.id)
+            buffers['User'].append(tweet.user.name)
+            buffers['Tweets'].append(tweet.full_text)
+            buffers['fav_count'].append(tweet.favorite_count)
+            buffers['rt_count'].append(tweet.retweet_count)
+            buffers['tweet_date'].append(tweet.created_at)
             i+=1
             if verbose==1:
                 pbar.update(1)
+            if writer is not None and len(buffers['ID']) == chunk_size:
+                writer.write(buffers)
+                buffers = {column: [] for column in TWEET_COLUMNS}
             if i==count:
                 break
-            else:
-                pass
-        if file_name!=None:
-            df.to_csv(f'{file_name}.csv', index=False)
+        if verbose==1:
+            pbar.close()
+
+        if writer is not None:
+            if buffers['ID'] or not writer.written:
+                writer.write(buffers)
+            writer.close()
         else:
-            return df
+            return pandas.DataFrame(buffers, columns=TWEET_COLUMNS)
 
 
 ##############################################################################################################
 
       
-def RecastPipeline(text, recastFuncs, **kwargs):
+SIDE_OUTPUTS = ['url_', 'mention_', 'emoji_', 'hashtag_', 'number_']
+
+
+def _pipeline_chunk(recastFuncs, text):
+    """Run every recast on a chunk of documents (in a worker process)
+
+    Returns
+    -------
+    text, side_outputs : recast chunk, list of {attribute: value} per recast
+    """
+
+    for rec in recastFuncs:
+        text = rec.setup_recast(text)
+    side_outputs = [{attr: getattr(rec, attr) for attr in SIDE_OUTPUTS if getattr(rec, attr, None) is not None}
+                    for rec in recastFuncs]
+    return text, side_outputs
+
+
+def _concat(values):
+    """Join per-chunk lists / pandas.Series / tuples of them back together, in order"""
+
+    if isinstance(values[0], tuple):
+        return tuple(_concat(list(value)) for value in zip(*values))
+    if _is_series(values[0]):
+        return pandas.concat(values)
+    return [value for chunk in values for value in chunk]
+
+
+def _parallel_pipeline(recastFuncs, n_jobs, chunksize, text):
+    """Run the pipeline on chunks of text in a pool of n_jobs worker processes"""
+
+    tcount = len(text)
+    chunksize = chunksize or -(-tcount // (n_jobs * 4))
+    chunks = _chunks(text.iloc if _is_series(text) else list(text), tcount, chunksize)
+
+    texts, side_outputs = [], []
+    pbar = tqdm(total=tcount)
+    for ntext, outputs in _parallel_map(partial(_pipeline_chunk, recastFuncs), chunks, n_jobs):
+        texts.append(ntext)
+        side_outputs.append(outputs)
+        pbar.update(len(ntext[0] if isinstance(ntext, tuple) else ntext))
+    pbar.close()
+
+    for i, rec in enumerate(recastFuncs):
+        for attr in side_outputs[0][i]:
+            setattr(rec, attr, _concat([outputs[i][attr] for outputs in side_outputs]))
+
+    return _concat(texts)
+
+
+def RecastPipeline(text, recastFuncs, n_jobs=1, chunksize=None, compiled=False, stream=False, profile=None, dedup=False, **kwargs):
+    """RecastPipeline: run Recast objects one after the other on text.
+
+    Parameters
+    ----------
+    text : string / list of strings / pandas.core.series.Series / iterable of strings
+    recastFuncs : list of Recast objects
+    n_jobs : int, default=1
+        worker processes (-1 uses all cores), each worker runs the whole
+        pipeline on its chunks of documents
+    chunksize : int, default=None
+        documents sent to a worker at a time
+        (None splits the text into 4 chunks per worker)
+    compiled : bool, default=False
+        run every recast on a document before moving to the next one,
+        adjacent recasts that only substitute / replace strings are fused
+        into a single pass (see swachhdata.text._pipeline.CompiledPipeline)
+    stream : bool, default=False
+        return a generator recasting documents lazily, one at a time
+        (compiled), with constant memory; always used when text is any
+        other iterable, e.g. a generator over the lines of a file
+    profile : RecastProfile / callable, default=None
+        record wall time, CPU time, document count, bytes in / out and
+        documents modified of every stage in the RecastProfile, a callable
+        is called with the StageProfile of each stage once it completes;
+        with n_jobs the whole pipeline is recorded as one stage,
+        compiled pipelines record each compiled stage
+    dedup : bool, default=False
+        run the pipeline once per distinct document (list / pandas.Series
+        input), documents and side outputs are fanned back out to every
+        copy; the share of duplicates is set on every recast as dedup_ratio_
+        and recorded in profile (RecastProfile.dedup_ratio)
+
+    Side outputs (url_, mention_, emoji_, hashtag_, number_) of the recasts
+    are merged back from the workers in document order.
+
+    Returns
+    ---------
+    ntext : string / list of strings / pandas.core.series.Series
+            Processed text
+    generator (stream) : yields ntext, or (ntext, extracted) with extracted
+            the values extracted from the document keyed by side output
+            attribute (e.g. {'url_': [...]}) when a recast extracts
+    """
+
+    profile = as_profile(profile)
+    if dedup and not stream and (isinstance(text, list) or _is_series(text)):
+        unique = Deduplicated(text, profile)
+        ntext = RecastPipeline(unique.unique_, recastFuncs, n_jobs, chunksize, compiled, profile=profile, **kwargs)
+        for rec in recastFuncs:
+            for attr in SIDE_OUTPUTS:
+                if getattr(rec, attr, None) is not None:
+                    setattr(rec, attr, unique.expand(getattr(rec, attr)))
+            rec.dedup_ratio_ = unique.ratio_
+        return unique.expand(ntext)
+
+    if stream or not (isinstance(text, (str, list)) or _is_series(text)):
+        return CompiledPipeline(recastFuncs, n_jobs=n_jobs, chunksize=chunksize, profile=profile).recast_iter(text)
 
     ccount = 0 # complete count
     rcount = len(recastFuncs) # recast count
     tcount = len(text) # text length count
 
+    if compiled:
+        return CompiledPipeline(recastFuncs, n_jobs=n_jobs, chunksize=chunksize, profile=profile).setup_recast(text)
+
+    n_jobs = min(_n_workers(n_jobs), tcount)
+    if n_jobs > 1 and not isinstance(text, str):
+        name = ' + '.join(type(rec).__name__ for rec in recastFuncs)
+        return measure(profile, f'{name} (n_jobs={n_jobs})', partial(_parallel_pipeline, recastFuncs, n_jobs, chunksize), text)
+
     chunk_size = rcount * tcount
     pbar = tqdm(total=chunk_size)
 
     for rec in recastFuncs:
-        text = rec.setup_recast(text)
+        text = measure(profile, type(rec).__name__, rec.setup_recast, text)
         pbar.update(tcount)
     
     return text
@@ -0,0 +1,165 @@
+"""Columnar regex operations over a whole corpus for backend='vectorized'
+
+Patterns run as single pyarrow.compute (RE2) calls over an Arrow string
+array. Rows RE2 cannot reproduce exactly fall back to Python's re, so the
+output always matches the per-document backend:
+    * patterns RE2 does not support (e.g. lookarounds) and callable
+      replacements use re on every row
+    * patterns whose \\b, \\w, \\d are Unicode aware in re (ascii_only=True)
+      use RE2 for the ASCII rows and re for the remaining rows
+"""
+import re
+
+from ._base import LazyModule
+from ._charmap import SQUEEZED_RUN, squeeze_spaces as _squeeze_spaces
+
+pyarrow = LazyModule('pyarrow', extra='arrow')
+pc = LazyModule('pyarrow.compute', extra='arrow')
+
+# characters str.split() / str.strip() treat as whitespace
+WHITESPACE = '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000'
+
+# runs that ' '.join(text.split()) changes: 2+ whitespace characters or a single non-space one
+_WHITESPACE_RUN = '[{}]{{2,}}|[{}]'.format(''.join(f'\\x{{{ord(c):x}}}' for c in WHITESPACE),
+                                         ''.join(f'\\x{{{ord(c):x}}}' for c in WHITESPACE if c != ' '))
+
+# findall wraps matches in these markers, rows already containing them use re
+_OPEN, _CLOSE = '\x01', '\x02'
+
+_re2_support = {}
+
+
+def column(texts):
+    """Arrow string array of texts, without copying Arrow-backed pandas arrays"""
+
+    if isinstance(texts, (pyarrow.Array, pyarrow.ChunkedArray)):
+        return texts
+    if hasattr(texts, '__arrow_array__'):
+        return pyarrow.array(texts)
+    return pyarrow.array(texts, type=pyarrow.large_string())
+
+
+def re2_supported(pattern):
+    """Check if pyarrow.compute (RE2) can compile pattern"""
+
+    if pattern not in _re2_support:
+        try:
+            pc.replace_substring_regex(pyarrow.array([''], pyarrow.large_string()), pattern, '')
+            _re2_support[pattern] = True
+        except pyarrow.ArrowInvalid:
+            _re2_support[pattern] = False
+    return _re2_support[pattern]
+
+
+def _python(arr, func):
+    """Apply func to every row with Python"""
+
+    return pyarrow.array([None if text is None else func(text) for text in arr.to_pylist()], type=arr.type)
+
+
+def _fallback_rows(arr, ascii_only, marked=False):
+    """Boolean mask of the rows RE2 cannot recast exactly, None if there are none"""
+
+    mask = None
+    if ascii_only:
+        mask = pc.invert(pc.fill_null(pc.string_is_ascii(arr), True))
+    if marked:
+        has_marker = pc.or_(pc.match_substring(arr, _OPEN), pc.match_substring(arr, _CLOSE))
+        has_marker = pc.fill_null(has_marker, False)
+        mask = has_marker if mask is None else pc.or_(mask, has_marker)
+    if mask is None or not pc.any(mask).as_py():
+        return None
+    if isinstance(mask, pyarrow.ChunkedArray):
+        mask = mask.combine_chunks()
+    return mask
+
+
+def sub(arr, pattern, repl, ascii_only=False):
+    """Vectorized re.sub(pattern, repl, text) for every row
+
+    repl is either a literal string (no group references) or a callable.
+    """
+
+    regex = re.compile(pattern)
+    if callable(repl) or not re2_supported(pattern):
+        return _python(arr, lambda text: regex.sub(repl, text))
+
+    result = pc.replace_substring_regex(arr, pattern, repl.replace('\\', '\\\\'))
+    mask = _fallback_rows(arr, ascii_only)
+    if mask is None:
+        return result
+
+    rows = _python(pc.filter(arr, mask), lambda text: regex.sub(repl, text))
+    if isinstance(result, pyarrow.ChunkedArray):
+        result = result.combine_chunks()
+    return pc.replace_with_mask(result, mask, rows.cast(result.type))
+
+
+def findall(arr, pattern, ascii_only=False):
+    """Vectorized re.findall(pattern, text) for every row
+
+    pattern must have at most one capturing group.
+
+    Returns
+    -------
+    list of lists of strings
+    """
+
+    regex = re.compile(pattern)
+    if not re2_supported(pattern):
+        return [None if text is None else regex.findall(text) for text in arr.to_pylist()]
+
+    group = '\\1' if regex.groups else '\\0'
+    marked = pc.replace_substring_regex(arr, pattern, f'{_OPEN}{group}{_CLOSE}')
+    split = pc.split_pattern_regex(marked, f'[{_OPEN}{_CLOSE}]')
+    matches = pc.list_slice(split, 1, None, 2).to_pylist()
+
+    mask = _fallback_rows(arr, ascii_only, marked=True)
+    if mask is not None:
+        for i in pc.indices_nonzero(mask).to_pylist():
+            matches[i] = regex.findall(arr[i].as_py())
+    return matches
+
+
+def collapse_whitespace(arr):
+    """Vectorized ' '.join(text.split()) for every row"""
+
+    arr = pc.replace_substring_regex(arr, _WHITESPACE_RUN, ' ')
+    return pc.utf8_trim(arr, characters=' ')
+
+
+def squeeze_spaces(arr):
+    """Vectorized _charmap.squeeze_spaces for every row
+
+    Runs of up to SQUEEZED_RUN spaces become a single space in one RE2
+    pass, the rare rows holding a longer run use Python.
+    """
+
+    result = pc.replace_substring_regex(arr, ' {2,}', ' ')
+    mask = pc.fill_null(pc.match_substring(arr, ' ' * (SQUEEZED_RUN + 1)), False)
+    if pc.any(mask).as_py():
+        if isinstance(mask, pyarrow.ChunkedArray):
+            mask = mask.combine_chunks()
+        if isinstance(result, pyarrow.ChunkedArray):
+            result = result.combine_chunks()
+        rows = _python(pc.filter(arr, mask), _squeeze_spaces)
+        result = pc.replace_with_mask(result, mask, rows.cast(result.type))
+    return strip(result)
+
+
+def strip(arr):
+    """Vectorized text.strip() for every row"""
+
+    return pc.utf8_trim(arr, characters=WHITESPACE)
+
+
+def replace(arr, old, new):
+    """Vectorized text.replace(old, new) for every row"""
+
+    return pc.replace_substring(arr, old, new)
+
+
+def translate(arr, chars, new):
+    """Vectorized text.translate(str.maketrans(chars, new * len(chars))) for every row"""
+
+    return pc.replace_substring_regex(arr, '[' + ''.join(f'\\x{{{ord(c):x}}}' for c in chars) + ']', new)
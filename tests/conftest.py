@@ -0,0 +1,30 @@
+import random
+
+import pytest
+
+
+WORDS = ['the', 'a', 'we', 'are', 'going', 'to', 'have', 'lunch', 'at', 'our', 'favourite', 'place', 'today',
+         'Great', 'news', 'EVERYONE', 'running', 'quickly', 'services', 'catalogue', 'and', 'is', 'it',
+         'café', 'naïve', 'résumé', 'Zürich', 'ΟΔΟΣ', 'σοφός', 'İstanbul', 'straße', 'ﬁle', '½']
+EXTRAS = ['www.samplewebsite.com', 'https://example.org/path/page.html', 'http://a.b/c?d=1...', '192.168.1.1:8080/img.jpg',
+          '@jondoe', '@jane_doe', 'mail@example.com', '#python', '#DataCleaning', 'x#y',
+          '😀', '🍛', '☕️', '👍🏽', '🇮🇳', '❤', '© ®', '1,234', '12,34,567', '42', '3.14', '-7', '2nd', '٣',
+          "can't", "we're", "it's", "Y'all'd've", "DON'T", "ma'am", 'he’s', "’em", "I'm",
+          '<b>bold</b>', '<p>para</p>', '<br/>', '<script>var x = 1;</script>', '&amp;', '&lt;i&gt;', '&#39;',
+          '\n', '\t', '\r\n', '\f', '!!', '...', '?', '«quote»', '“smart”', '¿qué?', '—', '_', '\\', '   ']
+
+
+def make_corpus(docs, seed=0):
+    """docs synthetic tweet-like documents mixing plain words with urls, mentions,
+    hashtags, emoji, numbers, contractions, markup and non ASCII text"""
+
+    rng = random.Random(seed)
+    corpus = [' '.join(rng.choice(WORDS) if rng.random() < 0.7 else rng.choice(EXTRAS)
+                       for _ in range(rng.randint(1, 25))) for _ in range(docs)]
+    return corpus + ['', ' ', 'plain ascii text', 'Σ', 'ΑΣ.Σ ς', '\t\n', 'a  b   c']
+
+
+@pytest.fixture(scope='session')
+def corpus():
+
+    return make_corpus(400)
@@ -0,0 +1,46 @@
+"""AlphabetRecast process lists compiled into one transform give the output of the processes run in turn"""
+import re
+import unicodedata
+from itertools import product
+
+import pytest
+
+from swachhdata.text import AlphabetRecast
+
+
+PROCESSES = ['all', 'keep_alpha', 'rem_non_ascii', 'rem_acc_char']
+
+
+def _process(text, process):
+
+    if process in ('all', 'rem_acc_char'):
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
+    if process in ('all', 'rem_non_ascii'):
+        text = re.sub(r'[^\x00-\x7F]+', ' ', text)
+    if process in ('all', 'keep_alpha'):
+        text = re.sub(r'[^a-zA-Z]', ' ', text)
+    return text
+
+
+def _reference(text, processes):
+
+    for process in processes:
+        text = _process(text, process)
+    return text
+
+
+SEQUENCES = [list(processes) for n in (1, 2, 3) for processes in product(PROCESSES, repeat=n)]
+
+
+@pytest.mark.parametrize('processes', SEQUENCES, ids='-'.join)
+def test_matches_reference(processes, corpus):
+
+    process = processes[0] if len(processes) == 1 else processes
+    result = AlphabetRecast(process=process, verbose=-1).setup_recast(corpus)
+    assert result == [_reference(text, processes) for text in corpus]
+
+
+def test_unknown_process(capsys):
+
+    AlphabetRecast(process=['keep_alpha', 'lower'], verbose=-1)
+    assert 'lower' in capsys.readouterr().out
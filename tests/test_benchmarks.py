@@ -0,0 +1,21 @@
+"""Every benchmark case runs, or is skipped for a missing resource"""
+import pytest
+
+from benchmarks import bench_text
+
+
+@pytest.mark.parametrize('case', bench_text.CASES)
+def test_case_runs(case):
+
+    try:
+        result = bench_text.measure(case, 20)
+    except NotImplementedError as error:
+        pytest.skip(str(error))
+    assert result['seconds'] > 0
+    assert result['docs_per_sec'] > 0 and result['bytes_per_sec'] > 0 and result['peak_rss'] > 0
+
+
+def test_corpus_is_stable():
+
+    assert bench_text.corpus(50) == bench_text.corpus(50)
+    assert len(bench_text.corpus(50)) == 50
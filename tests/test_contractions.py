@@ -0,0 +1,61 @@
+"""ContractionEngine expands contractions as contractions.fix does"""
+import pytest
+
+contractions = pytest.importorskip('contractions')
+
+from swachhdata.text import ContractionsRecast
+from swachhdata.text._contractions import ContractionEngine
+
+
+def _fix(text):
+    """contractions.fix, None where textsearch fails on the document"""
+
+    try:
+        return contractions.fix(text)
+    except Exception:
+        return None
+
+
+@pytest.fixture(scope='module')
+def engine():
+
+    return ContractionEngine()
+
+
+def test_engine_matches_contractions(engine, corpus):
+
+    checked = 0
+    for document in corpus:
+        expected = _fix(document)
+        if expected is None:
+            continue
+        assert engine.fix(document) == expected, document
+        checked += 1
+    assert checked > len(corpus) // 2
+
+
+@pytest.mark.parametrize('document', ["can't", "CAN'T", "Can't", "we're going", "Y'all'd've", "it’s", "he’s ’em",
+                                      "I'm sure you'll", "don't, won't; shouldn't.", "cant can't't", "ma'am",
+                                      "lol brb idk", "x'y", "couldn't've", "'tis", "o'clock", "_can't_", "can'tx"])
+def test_engine_examples(engine, document):
+
+    assert engine.fix(document) == contractions.fix(document)
+
+
+def test_trie_matches_automaton(corpus):
+
+    # the trie matches documents when pyahocorasick is not installed
+    automaton, trie = ContractionEngine(), ContractionEngine()
+    trie._ContractionEngine__automaton = None
+    for document in corpus:
+        assert trie.fix(document) == automaton.fix(document), document
+
+
+def test_recast_mappings():
+
+    mappings = {'brb': 'be right back', "can't": 'can not'}
+    rec = ContractionsRecast(verbose=-1, mappings=mappings)
+    assert rec.setup_recast("BRB, can't talk") == "BE RIGHT BACK, can not talk"
+    assert rec.setup_recast(["Brb", "we're"]) == ["Be Right Back", "we are"]
+    # mappings of other recasts are not shared
+    assert ContractionsRecast(verbose=-1).setup_recast("can't") == contractions.fix("can't")
@@ -0,0 +1,69 @@
+"""dedup=True recasts every distinct document once and fans documents and extracted values back out to every copy"""
+import pytest
+
+pandas = pytest.importorskip('pandas')
+
+from swachhdata.text import (RecastPipeline, RecastProfile, TextRecast, urlRecast, CaseRecast, HashtagRecast,
+                             PunctuationRecast)
+
+
+KWARGS = dict(urlRecast={'process': 'extract_remove'}, CaseRecast={'process': 'lower'},
+              HashtagRecast={'process': 'extract_remove'})
+
+
+def _duplicated(corpus):
+
+    return corpus + corpus[:100] + corpus[:7]
+
+
+def _recasts():
+
+    return [CaseRecast(process='lower', verbose=-1), PunctuationRecast(verbose=-1),
+            urlRecast(process='extract_remove', verbose=-1)]
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_pipeline(compiled, corpus):
+
+    text = _duplicated(corpus)
+    serial, recasts = _recasts(), _recasts()
+    expected = RecastPipeline(text, serial, compiled=compiled)
+    profile = RecastProfile()
+    assert RecastPipeline(text, recasts, compiled=compiled, profile=profile, dedup=True) == expected
+    assert recasts[2].url_ == serial[2].url_
+    assert [rec.dedup_ratio_ for rec in recasts] == pytest.approx([profile.dedup_ratio] * 3)
+    assert profile.stages_[0].name == 'dedup'
+    assert profile.dedup_ratio == pytest.approx(1 - len(set(text)) / len(text))
+
+
+def test_pipeline_series(corpus):
+
+    text = pandas.Series(_duplicated(corpus), index=range(len(corpus) + 107, 0, -1), name='tweets', dtype='string')
+    expected = RecastPipeline(text, _recasts())
+    result = RecastPipeline(text, _recasts(), dedup=True)
+    assert result[0].equals(expected[0])
+    assert result[0].index.equals(text.index)
+    assert result[0].name == 'tweets' and result[0].dtype == text.dtype
+
+
+def test_text_recast(corpus):
+
+    text = _duplicated(corpus)
+    expected = TextRecast(text, **KWARGS)
+    profile = RecastProfile()
+    result = TextRecast(text, profile=profile, dedup=True, **KWARGS)
+    assert result.text == expected.text
+    assert result.url.tolist() == expected.url.tolist()
+    assert result.hashtag.tolist() == expected.hashtag.tolist()
+    assert profile.dedup_ratio == pytest.approx(1 - len(set(text)) / len(text))
+    assert expected.dedup_ratio is None
+    # without a profile too
+    assert TextRecast(text, dedup=True, **KWARGS).dedup_ratio == pytest.approx(profile.dedup_ratio)
+
+
+def test_no_duplicates(corpus):
+
+    profile = RecastProfile()
+    assert TextRecast(corpus, profile=profile, dedup=True, **KWARGS).text == TextRecast(corpus, **KWARGS).text
+    assert profile.dedup_ratio == 0.0
+    assert RecastProfile().dedup_ratio is None
@@ -0,0 +1,72 @@
+"""EmojiMatcher matches emoji as the emoji package does, multi-codepoint emoji as a unit"""
+import re
+
+import pytest
+
+emoji = pytest.importorskip('emoji')
+
+from swachhdata.text import EmojiRecast
+from swachhdata.text._emoji import emoji_matcher
+
+
+SEQUENCES = ['👍🏽', '🇮🇳', '👨‍👩‍👧', '🏳️‍🌈', '1️⃣', '❤']
+
+
+def test_demojize_matches_emoji(corpus):
+
+    matcher = emoji_matcher()
+    documents = corpus + [' '.join(SEQUENCES), 'x️y', '👍🏽👍', '☕️']
+    for document in documents:
+        assert matcher.demojize(document) == emoji.demojize(document, delimiters=('', '')), document
+
+
+def test_findall_matches_emoji(corpus):
+
+    matcher = emoji_matcher()
+    for document in corpus + SEQUENCES + ['☕️ ☕', '👍🏽👍']:
+        assert matcher.findall(document) == [match['emoji'] for match in emoji.emoji_list(document)], document
+
+
+@pytest.mark.parametrize('sequence', SEQUENCES)
+def test_sequence_is_one_emoji(sequence):
+
+    assert EmojiRecast(process='extract', verbose=-1).setup_recast(f'a {sequence} b') == [sequence]
+    assert EmojiRecast(process='remove', verbose=-1).setup_recast(f'a {sequence} b') == 'a b'
+
+
+def _reference(process, space_out, text):
+    """EmojiRecast as it rescanned the document for each step"""
+
+    matcher = emoji_matcher()
+    if space_out:
+        text = re.sub(' +', ' ', matcher.sub(lambda em: ' ' + em, text))
+    removed = ' '.join(word for word in text.split() if not matcher.contains(word))
+    return {'remove': removed, 'replace': matcher.demojize(text), 'extract': matcher.findall(text),
+            'extract_remove': (removed, matcher.findall(text)),
+            'extract_replace': (matcher.demojize(text), matcher.findall(text))}[process]
+
+
+@pytest.mark.parametrize('space_out', [False, True])
+@pytest.mark.parametrize('process', ['remove', 'replace', 'extract', 'extract_remove', 'extract_replace'])
+def test_span_scan_matches_reference(process, space_out, corpus):
+
+    documents = corpus + ['ab😀cd😀ef', '😀😀 x', 'x😀', '👍🏽👍 a']
+    result = EmojiRecast(process=process, space_out=space_out, verbose=-1).setup_recast(documents)
+    if isinstance(result, tuple):
+        result = list(zip(*result))
+    assert result == [_reference(process, space_out, text) for text in documents]
+
+
+def test_keep_words():
+
+    rec = EmojiRecast(process='extract_remove', keep_words=True, verbose=-1)
+    assert rec.setup_recast('great😀day  ok 👍🏽') == ('greatday ok', ['😀', '👍🏽'])
+
+
+def test_return_spans():
+
+    text = 'a 👍🏽 b🇮🇳'
+    spans = EmojiRecast(process='extract', return_spans=True, verbose=-1).setup_recast(text)
+    assert spans == [('👍🏽', 2, 4), ('🇮🇳', 6, 8)]
+    assert [text[start:end] for _, start, end in spans] == ['👍🏽', '🇮🇳']
+
@@ -0,0 +1,70 @@
+"""htmlRecast gives the text BeautifulSoup extracted from the unescaped documents"""
+from html import unescape
+
+import pytest
+
+bs4 = pytest.importorskip('bs4')
+pytest.importorskip('lxml')
+
+from swachhdata.text import htmlRecast
+from swachhdata.text._html import HTMLCleaner
+
+
+def _soup_text(text):
+    """text of the document as the BeautifulSoup htmlRecast extracted it"""
+
+    return bs4.BeautifulSoup(unescape(text), 'lxml').get_text()
+
+
+def _words(text):
+
+    return ' '.join(text.split())
+
+
+DOCUMENTS = ['<p>Hello <b>world</b></p>', 'no markup at all', 'fish &amp; chips', '&lt;i&gt;escaped&lt;/i&gt;',
+             '&amp;amp; twice', 'a < b and c > d', '<div>one</div><div>two</div>', '<ul><li>x</li><li>y</li></ul>',
+             '&#39;quoted&#39; &quot;text&quot;', 'caf&eacute; na&iuml;ve', '<a href="https://x.org">link</a> text',
+             'unclosed <b>bold', '<br/>line<br>break', '<p>para&nbsp;graph</p>', '<p>a</p><script>x = 1;</script>b',
+             '<style>p {}</style>styled', '']
+
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_cleaner_matches_soup(document):
+
+    assert _words(HTMLCleaner().clean(document)) == _words(_soup_text(document))
+
+
+def test_recast_matches_soup(corpus):
+
+    # get_text of BeautifulSoup (4.10+) leaves out the text of <script>, <style> and <template>
+    result = htmlRecast(verbose=-1).setup_recast(corpus)
+    assert [_words(text) for text in result] == [_words(_soup_text(text)) for text in corpus]
+
+
+def test_plain_documents_unchanged(corpus):
+
+    plain = [text for text in corpus if '<' not in text and '&' not in text]
+    assert htmlRecast(verbose=-1).setup_recast(plain) == plain
+
+
+def test_entities_only():
+
+    cleaner = HTMLCleaner()
+    assert cleaner.clean('fish &amp; chips') == 'fish & chips'
+    # entities left by unescape are decoded once more, as parsing them would
+    assert cleaner.clean('&amp;amp;') == '&'
+    assert cleaner.clean('&lt;b&gt;bold&lt;/b&gt;') == 'bold'
+
+
+def test_drop_scripts():
+
+    document = '<p>before</p><script>var x = 1;</script><style>p {}</style><p>after</p>'
+    assert htmlRecast(verbose=-1).setup_recast(document) == 'beforeafter'
+    assert htmlRecast(verbose=-1, drop_scripts=False).setup_recast(document) == 'beforevar x = 1;p {}after'
+
+
+def test_block_separator():
+
+    document = '<p>one</p>\n<p>two</p><ul><li>three</li><li>four</li></ul>'
+    assert htmlRecast(verbose=-1, block_separator=' ').setup_recast(document) == 'one two three four'
+    assert htmlRecast(verbose=-1).setup_recast(document) == 'one\ntwothreefour'
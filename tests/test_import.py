@@ -0,0 +1,39 @@
+"""The regex recasts import and construct without loading any heavy backend"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_import import REGEX_RECASTS
+
+
+HEAVY_MODULES = ['spacy', 'nltk', 'gensim', 'pandas', 'bs4', 'emoji', 'contractions', 'tweepy']
+
+
+def _loaded(code):
+    """heavy modules in sys.modules after running code in a fresh interpreter"""
+
+    check = f'{code}\nimport sys, json\nprint(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))'
+    result = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_text():
+
+    assert _loaded('import swachhdata.text') == []
+
+
+@pytest.mark.parametrize('recast', REGEX_RECASTS)
+def test_regex_recast_cold_start(recast):
+
+    assert _loaded(f'from swachhdata.text import {recast}\n{recast}()') == []
+
+
+def test_missing_extra():
+
+    # backend='vectorized' names the extra that installs pyarrow when it is missing
+    code = ("import sys\nsys.modules['pyarrow'] = None\nfrom swachhdata.text import urlRecast\n"
+            "try:\n    urlRecast(backend='vectorized')\nexcept ImportError as error:\n    print(error)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert 'pip install swachhdata[arrow]' in result.stdout
@@ -0,0 +1,45 @@
+"""LemmatizationRecast(nltk) gives the lemmas of nltk.pos_tag and WordNetLemmatizer, tagging words on their own
+or, with pos_context=True, whole documents"""
+import pytest
+
+nltk = pytest.importorskip('nltk')
+
+from swachhdata.resources import ResourceNotFoundError
+from swachhdata.text import LemmatizationRecast
+from swachhdata.text import _registry
+
+
+SENTENCES = [
+    'The striped bats are hanging on their feet for best',
+    'She was running to the meeting and saw the leaves falling',
+    'Our services are better than the ones we were offering before',
+    'I have been working on the catalogue in the service tab',
+]
+
+
+def _recast(corpus, **kwargs):
+
+    try:
+        return LemmatizationRecast('nltk', -1, **kwargs).setup_recast(corpus)
+    except (ResourceNotFoundError, LookupError) as error:
+        pytest.skip(str(error))
+
+
+def _lemmas(tagged):
+
+    lemmatizer = nltk.stem.WordNetLemmatizer()
+    return ' '.join(lemmatizer.lemmatize(word, _registry.wordnet_pos(tag)) for word, tag in tagged)
+
+
+def test_word_by_word(corpus):
+
+    result = _recast(SENTENCES + corpus[:50])
+    assert result == [_lemmas([nltk.pos_tag([word])[0] for word in text.split()]) for text in SENTENCES + corpus[:50]]
+
+
+@pytest.mark.parametrize('batch_size', [1, 1000])
+def test_pos_context(batch_size, corpus):
+
+    result = _recast(SENTENCES + corpus[:50], pos_context=True, batch_size=batch_size)
+    assert result == [_lemmas(nltk.pos_tag(text.split())) for text in SENTENCES + corpus[:50]]
+    assert _recast(SENTENCES[1], pos_context=True) == result[1]
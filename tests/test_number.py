@@ -0,0 +1,60 @@
+"""NumberRecast with memoized num2words and one scan for extract_replace gives the output of findall then sub"""
+import re
+
+import pytest
+
+num2words = pytest.importorskip('num2words')
+
+from swachhdata.text import NumberRecast
+
+
+PROCESSES = ['remove', 'replace', 'extract', 'extract_remove', 'extract_replace']
+
+
+def _reference(process, seperator, text, lang='en'):
+    """NumberRecast of a single document, one regular expression pass at a time"""
+
+    if seperator == ',':
+        text = re.sub(r'(?<!\B)[,](?!\B)', '', text)
+    elif seperator == '.':
+        text = re.sub(r'(?<!\B)[.](?!\B)', '', text)
+
+    words = lambda match: num2words.num2words(int(match.group(0)), lang=lang)
+    if process == 'remove':
+        return re.sub(r'[0-9]+', '', text)
+    elif process == 'replace':
+        return re.sub(r'(\d+)', words, text)
+    elif process == 'extract':
+        return re.findall(r'[0-9]+', text)
+    elif process == 'extract_remove':
+        return re.sub(r'[0-9]+', '', text), re.findall(r'[0-9]+', text)
+    return re.sub(r'(\d+)', words, text), re.findall(r'[0-9]+', text)
+
+
+def _expected(process, seperator, corpus):
+
+    results = [_reference(process, seperator, text) for text in corpus]
+    if process.startswith('extract_'):
+        return [text for text, _ in results], [numbers for _, numbers in results]
+    return results
+
+
+@pytest.mark.parametrize('process', PROCESSES)
+@pytest.mark.parametrize('seperator', [None, ',', '.'])
+def test_matches_reference(process, seperator, corpus):
+
+    assert NumberRecast(process, seperator, -1).setup_recast(corpus) == _expected(process, seperator, corpus)
+
+
+@pytest.mark.parametrize('process', PROCESSES)
+def test_single_document(process):
+
+    # digits of other scripts are replaced, only ASCII digits are extracted
+    text = 'order 12 of 5,000 for 3.5 and ٣ more'
+    assert NumberRecast(process, None, -1).setup_recast(text) == _reference(process, None, text)
+
+
+def test_lang():
+
+    assert NumberRecast('replace', None, -1, lang='fr').setup_recast('x 21') == _reference('replace', None, 'x 21', 'fr')
+    assert NumberRecast('replace', None, -1, lang='fr').setup_recast('x 21') != NumberRecast('replace').setup_recast('x 21')
@@ -0,0 +1,78 @@
+"""Recasts and pipelines run in worker processes (n_jobs > 1) give the serial output"""
+import pytest
+
+pandas = pytest.importorskip('pandas')
+
+from swachhdata.text import (RecastPipeline, TextRecast, urlRecast, htmlRecast, ContractionsRecast, CaseRecast,
+                             EmojiRecast, HashtagRecast, NumberRecast, PunctuationRecast)
+
+
+RECASTS = {
+    'url-extract_remove': lambda **kw: urlRecast(process='extract_remove', verbose=-1, **kw),
+    'html': lambda **kw: htmlRecast(verbose=-1, **kw),
+    'contractions': lambda **kw: ContractionsRecast(verbose=-1, mappings={'brb': 'be right back'}, **kw),
+    'emoji-extract_replace': lambda **kw: EmojiRecast(process='extract_replace', verbose=-1, **kw),
+    'number-replace': lambda **kw: NumberRecast(process='replace', verbose=-1, **kw),
+    'punctuation': lambda **kw: PunctuationRecast(verbose=-1, **kw),
+}
+
+
+@pytest.mark.parametrize('recast', RECASTS)
+def test_recast_n_jobs(recast, corpus):
+
+    expected = RECASTS[recast]().setup_recast(corpus)
+    assert RECASTS[recast](n_jobs=2, chunksize=64).setup_recast(corpus) == expected
+
+
+def test_recast_n_jobs_series(corpus):
+
+    text = pandas.Series(corpus, index=range(len(corpus), 0, -1), name='tweets')
+    expected = RECASTS['url-extract_remove']().setup_recast(text)
+    result = RECASTS['url-extract_remove'](n_jobs=2, chunksize=64).setup_recast(text)
+    for values, expected_values in zip(result, expected):
+        assert values.equals(expected_values)
+
+
+def _pipeline():
+
+    # extracting recasts last, the plain pipeline does not pass (ntext, extracted) on
+    return [urlRecast(process='extract_remove', verbose=-1), CaseRecast(process='lower', verbose=-1),
+            EmojiRecast(process='remove', verbose=-1), HashtagRecast(process='extract_remove', verbose=-1)]
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_pipeline_n_jobs(compiled, corpus):
+
+    serial = _pipeline()
+    expected = RecastPipeline(corpus, serial[:1], compiled=compiled)
+    expected = RecastPipeline(expected[0], serial[1:], compiled=compiled)
+
+    parallel = _pipeline()
+    result = RecastPipeline(corpus, parallel[:1], n_jobs=2, chunksize=64, compiled=compiled)
+    result = RecastPipeline(result[0], parallel[1:], n_jobs=2, chunksize=64, compiled=compiled)
+
+    assert result == expected
+    # side outputs of the workers are merged back in document order
+    assert parallel[0].url_ == serial[0].url_
+    assert parallel[3].hashtag_ == serial[3].hashtag_
+
+
+def test_compiled_pipeline_n_jobs_side_outputs(corpus):
+
+    serial, parallel = _pipeline(), _pipeline()
+    expected = RecastPipeline(corpus, serial, compiled=True)
+    assert RecastPipeline(corpus, parallel, n_jobs=2, chunksize=64, compiled=True) == expected
+    assert parallel[0].url_ == serial[0].url_
+    assert parallel[3].hashtag_ == serial[3].hashtag_
+
+
+def test_text_recast_n_jobs(corpus):
+
+    kwargs = dict(urlRecast={'process': 'extract_remove'}, htmlRecast=True, ContractionsRecast=True,
+                  CaseRecast={'process': 'lower'}, EmojiRecast={'process': 'extract_remove', 'space_out': False},
+                  NumberRecast={'process': 'replace', 'seperator': None}, PunctuationRecast=True)
+    expected = TextRecast(corpus, **kwargs)
+    result = TextRecast(corpus, n_jobs=2, chunksize=64, **kwargs)
+    assert result.text == expected.text
+    assert result.url.tolist() == expected.url.tolist()
+    assert result.emoji.tolist() == expected.emoji.tolist()
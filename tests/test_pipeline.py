@@ -0,0 +1,96 @@
+"""Compiled and streaming pipelines give the output of the recasts run one after the other"""
+import pytest
+
+from swachhdata.text import (RecastPipeline, urlRecast, htmlRecast, EscapeSequenceRecast, MentionRecast,
+                             ContractionsRecast, CaseRecast, EmojiRecast, HashtagRecast, ShortWordsRecast,
+                             NumberRecast, AlphabetRecast, PunctuationRecast)
+
+
+# factories of fresh recasts, each pipeline run gets its own
+PIPELINES = {
+    # character level recasts
+    'chars': lambda: [EscapeSequenceRecast(verbose=-1), CaseRecast(process='lower', verbose=-1),
+                      AlphabetRecast(process='keep_alpha', verbose=-1), PunctuationRecast(verbose=-1)],
+    'chars-unicode-upper': lambda: [PunctuationRecast(verbose=-1, unicode=True), EscapeSequenceRecast(verbose=-1),
+                                    CaseRecast(process='upper', verbose=-1)],
+    'chars-punctuation-first': lambda: [PunctuationRecast(verbose=-1), CaseRecast(process='lower', verbose=-1),
+                                        EscapeSequenceRecast(verbose=-1), PunctuationRecast(verbose=-1)],
+    'chars-alphabet-list': lambda: [CaseRecast(process='lower', verbose=-1),
+                                    AlphabetRecast(process=['rem_acc_char', 'keep_alpha'], verbose=-1),
+                                    PunctuationRecast(verbose=-1)],
+    # regex recasts with intermediate extracting stages
+    'regex': lambda: [urlRecast(process='extract_remove', verbose=-1), MentionRecast(process='remove', verbose=-1),
+                      HashtagRecast(process='extract_remove', verbose=-1),
+                      NumberRecast(process='replace', verbose=-1), CaseRecast(process='fupper', verbose=-1),
+                      PunctuationRecast(verbose=-1)],
+    # recasts compiled as whole document steps
+    'documents': lambda: [htmlRecast(verbose=-1), ContractionsRecast(verbose=-1),
+                          EmojiRecast(process='extract_remove', verbose=-1),
+                          ShortWordsRecast(min_length=3, verbose=-1), AlphabetRecast(process='all', verbose=-1)],
+    # the last stage extracts, (ntext, extracted) is returned
+    'extracting-last': lambda: [CaseRecast(process='lower', verbose=-1),
+                                NumberRecast(process='extract_replace', verbose=-1)],
+}
+
+SIDE_OUTPUTS = ['url_', 'mention_', 'emoji_', 'hashtag_', 'number_']
+
+
+def _side_outputs(recasts):
+
+    return [{attr: getattr(rec, attr) for attr in SIDE_OUTPUTS if getattr(rec, attr, None) is not None}
+            for rec in recasts]
+
+
+def _sequential(pipeline, text):
+    """Recasts run one after the other, the text of extracting stages passed on"""
+
+    recasts = PIPELINES[pipeline]()
+    for i, rec in enumerate(recasts):
+        result = rec.setup_recast(text)
+        if i == len(recasts) - 1:
+            return result, _side_outputs(recasts)
+        text = result[0] if isinstance(result, tuple) else result
+
+
+@pytest.mark.parametrize('pipeline', PIPELINES)
+def test_compiled_matches_sequential(pipeline, corpus):
+
+    expected, expected_side = _sequential(pipeline, corpus)
+    recasts = PIPELINES[pipeline]()
+    assert RecastPipeline(corpus, recasts, compiled=True) == expected
+    assert _side_outputs(recasts) == expected_side
+
+
+@pytest.mark.parametrize('pipeline', PIPELINES)
+def test_compiled_single_document(pipeline, corpus):
+
+    for document in corpus[:50]:
+        expected, _ = _sequential(pipeline, document)
+        assert RecastPipeline(document, PIPELINES[pipeline](), compiled=True) == expected
+
+
+def test_contextual_sigma():
+
+    # str.lower of a final sigma depends on its neighbours, fused tables must not change it
+    text = ['ΟΔΟΣ\tΣΟΦΟΣ', 'ΑΣ.Σ', 'Σ', 'σ\nΣ.', 'ΟΔΟΣ!']
+    expected, _ = _sequential('chars', text)
+    assert RecastPipeline(text, PIPELINES['chars'](), compiled=True) == expected
+
+
+@pytest.mark.parametrize('pipeline', ['chars', 'regex', 'documents'])
+def test_stream_matches_sequential(pipeline, corpus):
+
+    expected, _ = _sequential(pipeline, corpus)
+    results = list(RecastPipeline(iter(corpus), PIPELINES[pipeline](), stream=True))
+    if results and isinstance(results[0], tuple):
+        results = [ntext for ntext, _ in results]
+    assert results == expected
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_recast_iter(n_jobs, corpus):
+
+    # a single recast streamed document by document
+    ntext, extracted = urlRecast(process='extract_remove', verbose=-1).setup_recast(corpus)
+    rec = urlRecast(process='extract_remove', verbose=-1, n_jobs=n_jobs, chunksize=64)
+    assert list(rec.recast_iter(iter(corpus))) == list(zip(ntext, extracted))
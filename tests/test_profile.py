@@ -0,0 +1,59 @@
+"""Profiled runs give the unprofiled output and record every stage"""
+import pytest
+
+from swachhdata.text import (RecastProfile, RecastPipeline, TextRecast, urlRecast, CaseRecast, HashtagRecast,
+                             PunctuationRecast)
+
+
+def _recasts():
+
+    return [urlRecast(process='remove', verbose=-1), CaseRecast(process='lower', verbose=-1),
+            HashtagRecast(process='remove', verbose=-1), PunctuationRecast(verbose=-1)]
+
+
+def test_pipeline_profile(corpus):
+
+    profile = RecastProfile()
+    assert RecastPipeline(corpus, _recasts(), profile=profile) == RecastPipeline(corpus, _recasts())
+    assert [stage.name for stage in profile.stages_] == ['urlRecast', 'CaseRecast', 'HashtagRecast', 'PunctuationRecast']
+    assert profile.stages_[0].bytes_in == sum(len(text.encode('utf-8')) for text in corpus)
+    for stage, next_stage in zip(profile.stages_, profile.stages_[1:]):
+        assert next_stage.bytes_in == stage.bytes_out
+    for stage in profile.stages_:
+        assert stage.docs == len(corpus)
+        assert 0 < stage.docs_modified <= stage.docs
+        assert stage.wall_time >= 0 and stage.cpu_time >= 0
+    assert profile.dominant_stage() in profile.stages_
+    assert profile.wall_time == pytest.approx(sum(stage.wall_time for stage in profile.stages_))
+
+
+def test_no_op_stages():
+
+    profile = RecastProfile()
+    RecastPipeline(['plain text', 'more text'], _recasts(), profile=profile)
+    assert [stage.name for stage in profile.no_op_stages()] == ['urlRecast', 'CaseRecast', 'HashtagRecast',
+                                                                 'PunctuationRecast']
+
+
+def test_callback(corpus):
+
+    stages = []
+    kwargs = dict(urlRecast={'process': 'remove'}, CaseRecast={'process': 'lower'})
+    assert TextRecast(corpus, profile=stages.append, **kwargs).text == TextRecast(corpus, **kwargs).text
+    assert [stage.name for stage in stages] == ['urlRecast', 'CaseRecast']
+
+
+def test_to_frame(corpus):
+
+    pytest.importorskip('pandas')
+    profile = RecastProfile()
+    RecastPipeline(corpus, _recasts(), profile=profile)
+    frame = profile.to_frame()
+    assert list(frame['name']) == [stage.name for stage in profile.stages_]
+    assert list(frame['docs']) == [len(corpus)] * 4
+
+
+def test_invalid_profile():
+
+    with pytest.raises(TypeError):
+        RecastPipeline(['text'], _recasts(), profile='yes')
@@ -0,0 +1,76 @@
+"""PunctuationRecast removes string.punctuation, and with unicode=True the Unicode punctuation categories"""
+import random
+import string
+import unicodedata
+
+import pytest
+
+from swachhdata.text import PunctuationRecast, EscapeSequenceRecast, CaseRecast, AlphabetRecast
+from swachhdata.text._charmap import SQUEEZED_RUN, squeeze_spaces
+from swachhdata.text._pipeline import compile_stages
+
+
+def _spaced(docs, seed=0):
+    """documents mixing letters, punctuation, escape sequences and runs of 1 to 60 spaces"""
+
+    rng = random.Random(seed)
+    return [''.join(rng.choice(['a', 'b', '.', '!', '\n', '\t']) if rng.random() < 0.5 else ' ' * rng.randint(1, 60)
+                    for _ in range(rng.randint(0, 12))) for _ in range(docs)]
+
+
+def _reference(text, unicode=False):
+    """punctuation replaced with spaces, runs of spaces squeezed and the ends stripped"""
+
+    text = ''.join(' ' if char in string.punctuation or (unicode and unicodedata.category(char)[0] == 'P') else char
+                   for char in text)
+    return text.replace(' ' * 4, ' ').replace(' ' * 3, ' ').replace(' ' * 2, ' ').strip()
+
+
+@pytest.mark.parametrize('unicode', [False, True])
+def test_matches_reference(unicode, corpus):
+
+    assert PunctuationRecast(verbose=-1, unicode=unicode).setup_recast(corpus) == [_reference(text, unicode) for text in corpus]
+
+
+def test_unicode():
+
+    text = '«Quote» “this”… ¿qué? 、ok'
+    assert PunctuationRecast(verbose=-1).setup_recast(text) == '«Quote» “this”… ¿qué 、ok'
+    assert PunctuationRecast(verbose=-1, unicode=True).setup_recast(text) == 'Quote this qué ok'
+
+
+def test_squeeze_spaces():
+
+    for text in _spaced(2000) + [' ' * n for n in range(70)]:
+        assert squeeze_spaces(text) == text.replace(' ' * 4, ' ').replace(' ' * 3, ' ').replace(' ' * 2, ' ').strip()
+    assert squeeze_spaces('a' + ' ' * SQUEEZED_RUN + 'b') == 'a b'
+    assert squeeze_spaces('a' + ' ' * (SQUEEZED_RUN + 1) + 'b') == 'a  b'
+
+
+@pytest.mark.parametrize('unicode', [False, True])
+def test_vectorized_long_runs(unicode):
+
+    pytest.importorskip('pyarrow')
+    text = _spaced(500, seed=1)
+    expected = [_reference(doc, unicode) for doc in text]
+    assert PunctuationRecast(verbose=-1, backend='vectorized', unicode=unicode).setup_recast(text) == expected
+
+
+@pytest.mark.parametrize('recasts, ops', [
+    # case maps leave whitespace alone and run before the squeeze
+    (lambda: [PunctuationRecast(verbose=-1), CaseRecast(process='lower', verbose=-1)], ['translate', 'squeeze']),
+    (lambda: [EscapeSequenceRecast(verbose=-1), CaseRecast(process='upper', verbose=-1),
+              AlphabetRecast(process='keep_alpha', verbose=-1), PunctuationRecast(verbose=-1)], ['translate', 'squeeze']),
+    # escape sequences become spaces, they are squeezed only by a later squeeze
+    (lambda: [PunctuationRecast(verbose=-1), EscapeSequenceRecast(verbose=-1)], ['translate', 'squeeze', 'translate']),
+])
+def test_fused_ops(recasts, ops, corpus):
+
+    (_, stage, _), = compile_stages(recasts())
+    assert [op[0] for op in stage.ops_] == ops
+
+    text = corpus + _spaced(200)
+    expected = text
+    for rec in recasts():
+        expected = rec.setup_recast(expected)
+    assert [stage(doc) for doc in text] == expected
@@ -0,0 +1,75 @@
+"""spacy models are loaded once per process and shared until released"""
+import threading
+
+import pytest
+
+spacy = pytest.importorskip('spacy')
+
+from swachhdata.text import spacy_models
+from swachhdata.text import _registry
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch):
+    """path of a blank english pipeline, spacy.load calls counted"""
+
+    path = str(tmp_path / 'blank_en')
+    nlp = spacy.blank('en')
+    nlp.add_pipe('sentencizer')
+    nlp.to_disk(path)
+
+    loads = []
+    load = spacy.load
+    monkeypatch.setattr(spacy, 'load', lambda *args, **kwargs: loads.append(args) or load(*args, **kwargs))
+    yield path, loads
+    spacy_models.release(path)
+
+
+def test_shared(model):
+
+    path, loads = model
+    nlp = spacy_models.get(path)
+    assert spacy_models.get(path) is nlp
+    assert (path, frozenset()) in spacy_models.loaded()
+    assert len(loads) == 1
+
+
+def test_disable(model):
+
+    path, loads = model
+    assert spacy_models.get(path, disable=['sentencizer']) is not spacy_models.get(path)
+    assert spacy_models.get(path, disable=['sentencizer']).pipe_names == []
+    assert len(loads) == 2
+
+
+def test_release(model):
+
+    path, loads = model
+    nlp = spacy_models.warm(path).get(path)
+    spacy_models.release(path)
+    assert (path, frozenset()) not in spacy_models.loaded()
+    assert spacy_models.get(path) is not nlp
+
+
+def test_threads_load_once(model):
+
+    path, loads = model
+    barrier = threading.Barrier(8)
+    models = []
+
+    def get():
+        barrier.wait()
+        models.append(spacy_models.get(path))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(loads) == 1
+    assert all(nlp is models[0] for nlp in models)
+
+
+def test_one_registry():
+
+    assert spacy_models is _registry.spacy_models
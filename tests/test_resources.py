@@ -0,0 +1,73 @@
+"""Resources are resolved from the data directory only, and the resolution is cached"""
+import json
+
+import pytest
+
+from swachhdata.resources import _resources
+from swachhdata.resources import ResourceNotFoundError, data_dir, require, require_recast
+from swachhdata.text._registry import ModelRegistry
+
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch):
+    """empty data directory, nltk only looking it up"""
+
+    nltk = pytest.importorskip('nltk')
+    monkeypatch.setenv('SWACHHDATA_DATA', str(tmp_path))
+    monkeypatch.setattr(nltk.data, 'path', [])
+    monkeypatch.setattr(_resources, '_resolved', {})
+    return tmp_path
+
+
+def test_data_dir(directory):
+
+    assert data_dir() == str(directory)
+
+
+def test_require_nltk(directory):
+
+    (directory / 'corpora' / 'stopwords').mkdir(parents=True)
+    locations = require('stopwords')
+    assert locations == {'stopwords': str(directory / 'corpora' / 'stopwords')}
+    # resolved paths are stamped for later processes
+    with open(directory / _resources.STAMP_FILE) as fh:
+        assert json.load(fh) == locations
+
+
+def test_require_stamp(directory, monkeypatch):
+
+    path = directory / 'corpora' / 'wordnet'
+    path.mkdir(parents=True)
+    with open(directory / _resources.STAMP_FILE, 'w') as fh:
+        json.dump({'wordnet': str(path)}, fh)
+    # stamped resources are not looked up again
+    monkeypatch.setattr(_resources, '_locate', lambda name, directory: pytest.fail(f'{name} looked up'))
+    assert require('wordnet') == {'wordnet': str(path)}
+
+
+def test_require_missing(directory):
+
+    (directory / 'corpora' / 'wordnet').mkdir(parents=True)
+    with pytest.raises(ResourceNotFoundError, match='prefetch'):
+        require_recast('LemmatizationRecast', 'nltk')
+
+
+def test_require_unknown(directory):
+
+    with pytest.raises(KeyError):
+        require('no_such_corpus')
+
+
+def test_require_spacy(directory):
+
+    spacy = pytest.importorskip('spacy')
+    path = directory / 'spacy' / 'en_core_web_sm'
+    path.mkdir(parents=True)
+    # an empty directory is not a model spacy.load can load
+    with pytest.raises(ResourceNotFoundError):
+        require('en_core_web_sm')
+
+    spacy.blank('en').to_disk(path)
+    assert require('en_core_web_sm') == {'en_core_web_sm': str(path)}
+    # the shared registry loads the model of the data directory
+    assert ModelRegistry().get('en_core_web_sm').lang == 'en'
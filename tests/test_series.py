@@ -0,0 +1,96 @@
+"""pandas.Series input keeps its index, name and dtype through recasts and pipelines"""
+import pytest
+
+pandas = pytest.importorskip('pandas')
+
+from swachhdata.text import (RecastPipeline, TextRecast, urlRecast, htmlRecast, EscapeSequenceRecast, MentionRecast,
+                             ContractionsRecast, CaseRecast, EmojiRecast, HashtagRecast, ShortWordsRecast,
+                             NumberRecast, AlphabetRecast, PunctuationRecast)
+
+
+RECASTS = {
+    'url-remove': lambda **kw: urlRecast(process='remove', verbose=-1, **kw),
+    'url-extract_remove': lambda **kw: urlRecast(process='extract_remove', verbose=-1, **kw),
+    'html': lambda **kw: htmlRecast(verbose=-1, **kw),
+    'escape': lambda **kw: EscapeSequenceRecast(verbose=-1, **kw),
+    'mention-remove': lambda **kw: MentionRecast(process='remove', verbose=-1, **kw),
+    'contractions': lambda **kw: ContractionsRecast(verbose=-1, **kw),
+    'case-lower': lambda **kw: CaseRecast(process='lower', verbose=-1, **kw),
+    'emoji-extract_remove': lambda **kw: EmojiRecast(process='extract_remove', verbose=-1, **kw),
+    'hashtag-extract_remove': lambda **kw: HashtagRecast(process='extract_remove', verbose=-1, **kw),
+    'shortwords': lambda **kw: ShortWordsRecast(min_length=3, verbose=-1, **kw),
+    'number-replace': lambda **kw: NumberRecast(process='replace', verbose=-1, **kw),
+    'alphabet': lambda **kw: AlphabetRecast(process='keep_alpha', verbose=-1, **kw),
+    'punctuation': lambda **kw: PunctuationRecast(verbose=-1, **kw),
+}
+
+DTYPES = [object, 'string']
+
+
+def _series(corpus, dtype):
+
+    return pandas.Series(corpus, index=pandas.RangeIndex(2000, 2000 + 3 * len(corpus), 3), name='tweets', dtype=dtype)
+
+
+def _check_text(result, text, expected):
+
+    assert isinstance(result, pandas.Series)
+    assert result.index.equals(text.index)
+    assert result.name == text.name
+    assert result.dtype == text.dtype
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+@pytest.mark.parametrize('dtype', DTYPES)
+@pytest.mark.parametrize('recast', RECASTS)
+def test_recast_series(recast, dtype, n_jobs, corpus):
+
+    text = _series(corpus, dtype)
+    expected = RECASTS[recast]().setup_recast(corpus)
+    result = RECASTS[recast](n_jobs=n_jobs, chunksize=64).setup_recast(text)
+    if isinstance(expected, tuple):
+        result, extracted = result
+        expected, expected_extracted = expected
+        assert extracted.index.equals(text.index)
+        assert extracted.tolist() == expected_extracted
+    _check_text(result, text, expected)
+
+
+def test_recast_series_pyarrow(corpus):
+
+    pytest.importorskip('pyarrow')
+    text = _series(corpus, 'string[pyarrow]')
+    for recast in RECASTS.values():
+        expected = recast().setup_recast(corpus)
+        result = recast().setup_recast(text)
+        if isinstance(expected, tuple):
+            result, expected = result[0], expected[0]
+        _check_text(result, text, expected)
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+@pytest.mark.parametrize('compiled', [False, True])
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_pipeline_series(dtype, compiled, n_jobs, corpus):
+
+    pipeline = lambda: [htmlRecast(verbose=-1), urlRecast(process='remove', verbose=-1),
+                        CaseRecast(process='lower', verbose=-1), PunctuationRecast(verbose=-1)]
+    text = _series(corpus, dtype)
+    expected = RecastPipeline(corpus, pipeline())
+    result = RecastPipeline(text, pipeline(), n_jobs=n_jobs, chunksize=64, compiled=compiled)
+    _check_text(result, text, expected)
+
+
+@pytest.mark.parametrize('dedup', [False, True])
+def test_text_recast_series(dedup, corpus):
+
+    text = _series(corpus + corpus[:50], object)
+    kwargs = dict(urlRecast={'process': 'extract_remove'}, CaseRecast={'process': 'lower'},
+                  HashtagRecast={'process': 'extract_remove'}, PunctuationRecast=True)
+    expected = TextRecast(corpus + corpus[:50], **kwargs)
+    result = TextRecast(text, dedup=dedup, **kwargs)
+    _check_text(result.text, text, expected.text)
+    assert result.url.index.equals(text.index)
+    assert result.url.tolist() == expected.url.tolist()
+    assert result.hashtag.to_series().index.equals(text.index)
@@ -0,0 +1,36 @@
+"""New recast options never shift the positional parameters of earlier releases"""
+import inspect
+
+import pytest
+
+from swachhdata import text
+
+
+# positional parameters of each recast before any new option was added
+POSITIONAL = {
+    'urlRecast': ['process', 'verbose'],
+    'htmlRecast': ['verbose'],
+    'EscapeSequenceRecast': ['verbose'],
+    'MentionRecast': ['process', 'verbose'],
+    'ContractionsRecast': ['verbose'],
+    'CaseRecast': ['process', 'verbose'],
+    'EmojiRecast': ['process', 'space_out', 'verbose'],
+    'HashtagRecast': ['process', 'verbose'],
+    'ShortWordsRecast': ['min_length', 'verbose'],
+    'StopWordsRecast': ['package', 'stopwords', 'verbose'],
+    'NumberRecast': ['process', 'seperator', 'verbose'],
+    'AlphabetRecast': ['process', 'verbose'],
+    'PunctuationRecast': ['verbose'],
+    'TokenisationRecast': ['package', 'method', 'verbose'],
+    'StemmingRecast': ['package', 'method', 'verbose'],
+    'LemmatizationRecast': ['package', 'verbose'],
+}
+
+
+@pytest.mark.parametrize('recast', POSITIONAL)
+def test_positional_parameters(recast):
+
+    parameters = list(inspect.signature(getattr(text, recast)).parameters)
+    assert parameters[:len(POSITIONAL[recast])] == POSITIONAL[recast]
+    # process pool options come last
+    assert parameters[-2:] == ['n_jobs', 'chunksize']
@@ -0,0 +1,60 @@
+"""spacy backed recasts give the same output through nlp.pipe batches as document by document"""
+import pytest
+
+spacy = pytest.importorskip('spacy')
+
+from swachhdata.resources import _resources
+from swachhdata.text import TokenisationRecast, LemmatizationRecast, spacy_models
+from swachhdata.text._text import SPACY_MODEL
+
+
+LEMMAS = {'going': 'go', 'are': 'be', 'services': 'service', 'running': 'run', 'is': 'be', 'have': 'have'}
+
+
+@pytest.fixture
+def nlp(tmp_path, monkeypatch):
+    """blank english pipeline (sentencizer, lookup lemmatizer) shared as the spacy model"""
+
+    from spacy.lookups import Lookups
+
+    nlp = spacy.blank('en')
+    nlp.add_pipe('sentencizer')
+    lookups = Lookups()
+    lookups.add_table('lemma_lookup', LEMMAS)
+    nlp.add_pipe('lemmatizer', config={'mode': 'lookup'}).initialize(lookups=lookups)
+
+    (tmp_path / 'spacy').mkdir()
+    nlp.to_disk(tmp_path / 'spacy' / SPACY_MODEL)
+    monkeypatch.setenv('SWACHHDATA_DATA', str(tmp_path))
+    monkeypatch.setattr(_resources, '_resolved', {})
+    monkeypatch.setitem(spacy_models._ModelRegistry__models, (SPACY_MODEL, frozenset()), nlp)
+    return nlp
+
+
+def _texts(documents):
+    """tokens of each document, sentences (spacy Span) as their text"""
+
+    return [[getattr(token, 'text', token) for token in tokens] for tokens in documents]
+
+
+# sentences are spacy Span views of their Doc, they cannot be sent back from worker processes
+@pytest.mark.parametrize('method, n_jobs', [('word', 1), ('word', 2), ('sentence', 1)])
+def test_tokenisation_pipe(method, n_jobs, nlp, corpus):
+
+    if method == 'word':
+        expected = [[token.text for token in nlp(text)] for text in corpus]
+    else:
+        expected = [[sentence.text for sentence in nlp(text).sents] for text in corpus]
+    rec = TokenisationRecast('spacy', method, -1, batch_size=64, n_jobs=n_jobs, chunksize=100)
+    assert _texts(rec.setup_recast(corpus)) == expected
+    assert _texts(TokenisationRecast('spacy', method, -1, batch_size=7).recast_iter(iter(corpus))) == expected
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_lemmatization_pipe(n_jobs, nlp, corpus):
+
+    expected = [' '.join(token.lemma_ for token in nlp(text)) for text in corpus]
+    assert any('service' in text.split() for text in expected)
+    rec = LemmatizationRecast('spacy', -1, batch_size=64, n_jobs=n_jobs, chunksize=100)
+    assert rec.setup_recast(corpus) == expected
+    assert LemmatizationRecast('spacy', -1, batch_size=7).setup_recast(corpus[0]) == expected[0]
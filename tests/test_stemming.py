@@ -0,0 +1,42 @@
+"""StemmingRecast stems every word as the nltk stemmers do, through the vocabulary of each batch or word by word"""
+import pytest
+
+stem = pytest.importorskip('nltk.stem')
+pandas = pytest.importorskip('pandas')
+
+from swachhdata.text import RecastPipeline, StemmingRecast
+
+
+STEMMERS = {'porter': lambda: stem.PorterStemmer(), 'snowball': lambda: stem.SnowballStemmer('english')}
+
+
+def _stemmed(method, corpus):
+
+    stemmer = STEMMERS[method]()
+    return [' '.join(stemmer.stem(word) for word in text.split()) for text in corpus]
+
+
+@pytest.mark.parametrize('method', STEMMERS)
+@pytest.mark.parametrize('vocabulary, batch_size', [(True, 10000), (True, 7), (False, 10000)])
+def test_stem(method, vocabulary, batch_size, corpus):
+
+    expected = _stemmed(method, corpus)
+    rec = StemmingRecast('nltk', method, -1, vocabulary=vocabulary, batch_size=batch_size)
+    assert rec.setup_recast(corpus) == expected
+    assert rec.setup_recast(corpus[3]) == expected[3]
+    assert list(StemmingRecast('nltk', method, -1, batch_size=batch_size).recast_iter(iter(corpus))) == expected
+
+
+def test_stem_series(corpus):
+
+    text = pandas.Series(corpus, index=range(len(corpus), 0, -1))
+    result = StemmingRecast('nltk', 'porter', -1).setup_recast(text)
+    assert result.index.equals(text.index)
+    assert result.tolist() == _stemmed('porter', corpus)
+
+
+@pytest.mark.parametrize('compiled', [False, True])
+def test_stem_pipeline(compiled, corpus):
+
+    result = RecastPipeline(corpus, [StemmingRecast('nltk', 'snowball', -1, batch_size=50)], compiled=compiled)
+    assert result == _stemmed('snowball', corpus)
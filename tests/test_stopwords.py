@@ -0,0 +1,64 @@
+"""StopWordsRecast removes the stop words of each package, loaded once per process"""
+import pytest
+
+from swachhdata.resources import ResourceNotFoundError
+from swachhdata.text import StopWordsRecast, TextRecast
+from swachhdata.text import _registry
+
+
+def _without(words, text):
+
+    return ' '.join(word for word in text.split() if word not in words)
+
+
+def test_gensim(corpus):
+
+    preprocessing = pytest.importorskip('gensim.parsing.preprocessing')
+    expected = [preprocessing.remove_stopwords(text) for text in corpus]
+    assert StopWordsRecast(package='gensim', verbose=-1).setup_recast(corpus) == expected
+
+
+@pytest.mark.parametrize('language', ['english', 'en'])
+def test_spacy(language, corpus):
+
+    stop_words = pytest.importorskip('spacy.lang.en.stop_words')
+    rec = StopWordsRecast(package='spacy', verbose=-1, language=language)
+    assert rec.setup_recast(corpus) == [_without(stop_words.STOP_WORDS, text) for text in corpus]
+
+
+def test_spacy_language():
+
+    pytest.importorskip('spacy')
+    rec = StopWordsRecast('spacy', None, -1, 'de')
+    assert rec.setup_recast('der Hund und die Katze') == 'Hund Katze'
+
+
+def test_nltk(corpus):
+
+    nltk = pytest.importorskip('nltk')
+    try:
+        rec = StopWordsRecast(package='nltk', verbose=-1)
+    except ResourceNotFoundError as error:
+        pytest.skip(str(error))
+    expected = [_without(set(nltk.corpus.stopwords.words('english')), text) for text in corpus]
+    assert rec.setup_recast(corpus) == expected
+
+
+def test_custom(corpus):
+
+    stopwords = ['the', 'a', 'is', 'it']
+    rec = StopWordsRecast(package='custom', stopwords=stopwords, verbose=-1)
+    assert rec.setup_recast(corpus) == [_without(stopwords, text) for text in corpus]
+
+
+def test_shared():
+
+    pytest.importorskip('spacy')
+    assert _registry.stopwords('spacy', 'english') is _registry.stopwords('spacy', 'en')
+
+
+def test_text_recast_language():
+
+    pytest.importorskip('spacy')
+    text = ['der Hund und die Katze']
+    assert TextRecast(text, StopWordsRecast={'package': 'spacy', 'language': 'de'}).text == ['Hund Katze']
@@ -0,0 +1,138 @@
+"""TextRecast results hold the values each recast extracts, per call"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from swachhdata.resources import ResourceNotFoundError
+from swachhdata.text import (TextRecast, urlRecast, CaseRecast, EmojiRecast, HashtagRecast, NumberRecast,
+                             ContractionsRecast, StopWordsRecast, StemmingRecast, LemmatizationRecast)
+from swachhdata.text import _contractions, _emoji, _registry
+from swachhdata import resources
+
+
+KWARGS = dict(urlRecast={'process': 'extract_remove'}, CaseRecast={'process': 'lower'},
+              EmojiRecast={'process': 'extract_remove', 'space_out': False},
+              HashtagRecast={'process': 'extract_remove'}, NumberRecast={'process': 'extract_replace', 'seperator': None})
+
+
+def _recasts():
+
+    return [urlRecast(process='extract_remove', verbose=-1), CaseRecast(process='lower', verbose=-1),
+            EmojiRecast(process='extract_remove', space_out=False, verbose=-1),
+            HashtagRecast(process='extract_remove', verbose=-1),
+            NumberRecast(process='extract_replace', seperator=None, verbose=-1)]
+
+
+def _expected(text):
+    """text and extracted values of the recasts run one after the other"""
+
+    extracted = {}
+    for rec in _recasts():
+        text = rec.setup_recast(text)
+        if isinstance(text, tuple):
+            text, values = text
+            extracted[type(rec).__name__] = values
+    return text, extracted
+
+
+def test_extracted_matches_recasts(corpus):
+
+    text, extracted = _expected(corpus)
+    result = TextRecast(corpus, **KWARGS)
+    assert result.text == text
+    assert result.url.tolist() == extracted['urlRecast']
+    assert result.emoji.tolist() == extracted['EmojiRecast']
+    assert result.hashtag.tolist() == extracted['HashtagRecast']
+    assert result.number.tolist() == extracted['NumberRecast']
+    assert result.mention is None and result.token is None
+    assert list(result.extracted()) == ['url', 'emoji', 'hashtag', 'number']
+    assert result.url.counts() == [len(values) for values in extracted['urlRecast']]
+
+
+def test_single_document():
+
+    document = 'Visit www.samplewebsite.com #python 42 😀'
+    text, extracted = _expected(document)
+    result = TextRecast(document, **KWARGS)
+    assert result.text == text
+    assert result.url == extracted['urlRecast']
+    assert result.hashtag == extracted['HashtagRecast']
+
+
+def test_extracted_emoji_keep_backend():
+
+    # the extracted emoji must not replace the lazily loaded emoji package
+    pytest.importorskip('emoji')
+    result = TextRecast(['a 😀 b'], EmojiRecast={'process': 'extract_remove', 'space_out': False})
+    assert result.text == ['a b']
+    assert result.emoji.tolist() == [['😀']]
+    assert EmojiRecast(process='replace', verbose=-1).setup_recast('a 😀') == 'a grinning_face'
+
+
+def test_to_arrow(corpus):
+
+    pytest.importorskip('pyarrow')
+    result = TextRecast(corpus, **KWARGS)
+    assert result.url.to_arrow().to_pylist() == result.url.tolist()
+
+
+def test_concurrent_calls(corpus):
+
+    # each call gets its own result, whatever runs alongside it
+    documents = [corpus[i::8] for i in range(8)]
+    expected = [_expected(text) for text in documents]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda text: TextRecast(text, **KWARGS), documents * 4))
+    for i, result in enumerate(results):
+        text, extracted = expected[i % 8]
+        assert result.text == text
+        assert result.url.tolist() == extracted['urlRecast']
+        assert result.hashtag.tolist() == extracted['HashtagRecast']
+
+
+THREADED = {
+    'emoji': lambda: EmojiRecast(process='replace', verbose=-1),
+    'contractions': lambda: ContractionsRecast(verbose=-1, mappings={'brb': 'be right back'}),
+    'stopwords_gensim': lambda: StopWordsRecast(package='gensim', verbose=-1),
+    'stopwords_spacy': lambda: StopWordsRecast(package='spacy', verbose=-1),
+    'stopwords_custom': lambda: StopWordsRecast(package='custom', stopwords=['the', 'a'], verbose=-1),
+    'stemming_porter': lambda: StemmingRecast('nltk', 'porter', -1),
+    'stemming_snowball': lambda: StemmingRecast('nltk', 'snowball', -1, vocabulary=False),
+    'lemmatization': lambda: LemmatizationRecast('nltk', -1),
+}
+
+
+def _reset(monkeypatch):
+    """Drop the process-wide resources, so the threads race on building them"""
+
+    monkeypatch.setattr(_emoji, '_matcher', None)
+    monkeypatch.setattr(_contractions, '_engines', {})
+    for name, value in [('_stopwords', {}), ('_stemmers', {}), ('_nltk_tagger', None), ('_wordnet_lemmatizer', None)]:
+        monkeypatch.setattr(_registry, name, value)
+    monkeypatch.setattr(resources._resources, '_resolved', {})
+    for cached in [_registry.stem, _registry.word_tag, _registry.wordnet_lemma]:
+        cached.cache_clear()
+
+
+@pytest.mark.parametrize('recast', THREADED)
+def test_threaded_recasts(recast, monkeypatch, corpus):
+
+    # every thread builds the recast and its shared resources at the same time
+    try:
+        expected = THREADED[recast]().setup_recast(corpus)
+    except (ImportError, ResourceNotFoundError, LookupError) as error:
+        pytest.skip(str(error))
+    _reset(monkeypatch)
+    documents = [corpus[i::8] for i in range(8)]
+    barrier = threading.Barrier(8)
+
+    def run(text):
+        rec = THREADED[recast]()
+        barrier.wait()
+        return rec.setup_recast(text)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, documents))
+    for i, result in enumerate(results):
+        assert result == expected[i::8]
@@ -0,0 +1,89 @@
+"""TweetExtractor collects tweets into column buffers, returned as a DataFrame or written out chunk by chunk"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+tweepy = pytest.importorskip('tweepy')
+pandas = pytest.importorskip('pandas')
+
+from swachhdata.text import TweetExtractor
+from swachhdata.text import _text
+from swachhdata.text._base import LazyModule
+from swachhdata.text._text import TWEET_COLUMNS
+
+
+KEYS = {'consumer_key': 'key', 'consumer_secret': 'secret', 'access_token': 'token', 'access_token_secret': 'secret'}
+
+START = datetime(2021, 1, 1)
+
+
+def _tweet(i):
+
+    return SimpleNamespace(id=i, user=SimpleNamespace(name=f'user{i % 3}'), full_text=f'tweet {i}, #{i}',
+                           favorite_count=i * 2, retweet_count=i % 5, created_at=START + timedelta(minutes=i))
+
+
+class _Cursor:
+    """tweepy.Cursor over local tweets, nothing is fetched"""
+
+    fetched = 0
+
+    def __init__(self, method, **kwargs):
+
+        self.kwargs = kwargs
+
+
+    def items(self):
+
+        for i in range(1000):
+            _Cursor.fetched += 1
+            yield _tweet(i)
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+
+    monkeypatch.setattr(tweepy, 'Cursor', _Cursor)
+    return TweetExtractor(KEYS)
+
+
+def _expected(count):
+
+    return pandas.DataFrame({'ID': range(count), 'User': [f'user{i % 3}' for i in range(count)],
+                             'Tweets': [f'tweet {i}, #{i}' for i in range(count)],
+                             'fav_count': [i * 2 for i in range(count)], 'rt_count': [i % 5 for i in range(count)],
+                             'tweet_date': [START + timedelta(minutes=i) for i in range(count)]}, columns=TWEET_COLUMNS)
+
+
+def test_extract_frame(extractor):
+
+    pandas.testing.assert_frame_equal(extractor.extract('python', 25), _expected(25))
+
+
+@pytest.mark.parametrize('chunk_size', [7, 25, 10000])
+def test_extract_csv(chunk_size, extractor, tmp_path):
+
+    assert extractor.extract('python', 25, file_name=str(tmp_path / 'tweets'), chunk_size=chunk_size) is None
+    result = pandas.read_csv(tmp_path / 'tweets.csv', parse_dates=['tweet_date'])
+    pandas.testing.assert_frame_equal(result, _expected(25), check_dtype=False)
+
+
+def test_extract_parquet(extractor, tmp_path):
+
+    parquet = pytest.importorskip('pyarrow.parquet')
+    extractor.extract('python', 25, file_name=str(tmp_path / 'tweets'), file_format='parquet', chunk_size=7)
+    table = parquet.ParquetFile(tmp_path / 'tweets.parquet')
+    assert table.num_row_groups == 4
+    pandas.testing.assert_frame_equal(table.read().to_pandas(), _expected(25), check_dtype=False)
+
+
+def test_extract_parquet_missing_arrow(extractor, tmp_path, monkeypatch):
+
+    # checked before any tweet is fetched
+    monkeypatch.setattr(_text, 'pyarrow_parquet', LazyModule('swachhdata_missing.parquet', extra='arrow'))
+    monkeypatch.setattr(_Cursor, 'fetched', 0)
+    with pytest.raises(ImportError, match=r'pip install swachhdata\[arrow\]'):
+        extractor.extract('python', 25, file_name=str(tmp_path / 'tweets'), file_format='parquet')
+    assert _Cursor.fetched == 0
+    assert not (tmp_path / 'tweets.parquet').exists()
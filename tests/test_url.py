@@ -0,0 +1,39 @@
+"""urlRecast prefilters give the output of the full URL pattern on every document"""
+import re
+
+import pytest
+
+from swachhdata.text import urlRecast
+
+
+IPV6 = ['2001:0db8:0000:85a3:0000:0000:ac1f:8001/website.jpg', 'fe80::1%eth0', '::1', 'host ::ffff:192.168.1.1 up',
+        'time 12:30 now', 'a:b', 'deadbeef: x', '[2001:db8::1]:8080/path', 'no url here', 'trailing.dot.', 'a...b.com']
+
+
+def _documents(corpus):
+
+    return corpus + IPV6 + [f'{a} {b}' for a, b in zip(corpus, IPV6 * 40)]
+
+
+def _reference(process, text):
+    """urlRecast as it ran the full pattern on every document"""
+
+    regex = urlRecast()._REGEX
+    text = re.sub(r'\.{3}', '', text)
+    if process == 'remove':
+        return re.sub(regex, '', text)
+    urls = re.findall(regex, text)
+    if process == 'extract':
+        return urls
+    return re.sub(regex, '', text), urls
+
+
+@pytest.mark.parametrize('process', ['remove', 'extract', 'extract_remove'])
+def test_prefilter_matches_pattern(process, corpus):
+
+    documents = _documents(corpus)
+    expected = [_reference(process, text) for text in documents]
+    result = urlRecast(process=process, verbose=-1).setup_recast(documents)
+    if process == 'extract_remove':
+        result = list(zip(*result))
+    assert result == expected
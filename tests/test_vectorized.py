@@ -0,0 +1,52 @@
+"""backend='vectorized' (pyarrow.compute) gives the output of the python backend"""
+import pytest
+
+pytest.importorskip('pyarrow')
+pandas = pytest.importorskip('pandas')
+
+from swachhdata.text import urlRecast, MentionRecast, HashtagRecast, NumberRecast, PunctuationRecast
+
+
+EXTRACTING = ['remove', 'extract', 'extract_remove']
+
+CASES = ([(urlRecast, {'process': process}) for process in EXTRACTING]
+         + [(MentionRecast, {'process': process}) for process in EXTRACTING]
+         + [(HashtagRecast, {'process': process}) for process in EXTRACTING]
+         + [(NumberRecast, {'process': process}) for process in ['remove', 'replace', 'extract', 'extract_remove', 'extract_replace']]
+         + [(NumberRecast, {'process': 'replace', 'seperator': ','})]
+         + [(PunctuationRecast, {}), (PunctuationRecast, {'unicode': True})])
+
+
+def _id(case):
+
+    recast, params = case
+    return f'{recast.__name__}-{"-".join(map(str, params.values())) or "default"}'
+
+
+@pytest.mark.parametrize('case', CASES, ids=_id)
+def test_vectorized_matches_python(case, corpus):
+
+    recast, params = case
+    expected = recast(verbose=-1, **params).setup_recast(corpus)
+    assert recast(verbose=-1, backend='vectorized', **params).setup_recast(corpus) == expected
+
+
+@pytest.mark.parametrize('case', CASES, ids=_id)
+@pytest.mark.parametrize('dtype', [object, 'string', 'string[pyarrow]'])
+def test_vectorized_series(case, dtype, corpus):
+
+    recast, params = case
+    text = pandas.Series(corpus, index=range(1000, 1000 + len(corpus)), name='tweets', dtype=dtype)
+    expected = recast(verbose=-1, **params).setup_recast(text)
+    result = recast(verbose=-1, backend='vectorized', **params).setup_recast(text)
+
+    if not isinstance(expected, tuple):
+        expected, result = (expected,), (result,)
+    for values, expected_values in zip(result, expected):
+        assert list(values) == list(expected_values)
+        assert values.index.equals(text.index)
+        assert values.dtype == expected_values.dtype
+    if params.get('process') != 'extract':
+        # the text keeps the dtype and name of the input
+        assert result[0].dtype == text.dtype
+        assert result[0].name == text.name